@@ -2,3 +2,7 @@
 
 def create_proxy(fn):
     return fn
+
+
+def to_js(value, **kwargs):
+    return value
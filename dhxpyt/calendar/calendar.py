@@ -8,9 +8,9 @@ It relies on Pyodide to interface with the JavaScript-based DHX Calendar library
 
 from typing import Any, Callable, List, Union
 import js
-import json
 from pyodide.ffi import create_proxy
 
+from ..marshalling import to_js
 from .calendar_config import CalendarConfig
 
 class Calendar:
@@ -36,7 +36,8 @@ class Calendar:
     """
     def __init__(self, config: CalendarConfig, widget_parent: Any = None):
         """Initializes the calendar instance."""
-        self.calendar = js.dhx.Calendar.new(widget_parent, js.JSON.parse(json.dumps(config.to_dict())))
+        self._config_proxies: List[Any] = []
+        self.calendar = js.dhx.Calendar.new(widget_parent, to_js(config.to_dict(), proxies=self._config_proxies))
 
     """ Calendar API Functions """
 
@@ -53,6 +54,9 @@ class Calendar:
         Call this method to clean up the calendar widget when it is no longer needed.
         """
         self.calendar.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def get_current_mode(self) -> str:
         """Returns the current mode of displaying the Calendar.
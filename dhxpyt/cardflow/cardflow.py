@@ -1,8 +1,8 @@
-import json
-from typing import Any, Callable, Dict, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, Optional, TypeVar, Union
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .cardflow_config import CardFlowConfig
 
 class CardFlow:
@@ -18,7 +18,7 @@ class CardFlow:
         config_dict = config.to_dict()
         self.cardflow = js.customdhx.CardFlow.new(
             container,
-            js.JSON.parse(json.dumps(config_dict))
+            to_js(config_dict)
         )
         
         # Dictionary to store event handlers (if you want to store them for potential removal)
@@ -80,6 +80,56 @@ class CardFlow:
     def set_row_data_value(self, row_id, column_id, value):
         self.cardflow.setRowDataValue(row_id, column_id, value)
 
+    def upsert_rows(self, rows: Iterable[Dict[str, Any]], key: str = "id") -> Dict[str, int]:
+        """
+        Inserts new rows and patches changed fields of existing rows in place.
+
+        Only the cells whose values changed are updated; other cards are not rebuilt.
+
+        :param rows: Rows to insert or update.
+        :param key: (Optional) The row field that uniquely identifies a row; rows are matched on it.
+        :return: ``{"added": n, "updated": n, "removed": 0}``: rows inserted, existing rows
+            that had at least one changed field, and always 0 removed.
+        """
+        result = self.cardflow.upsertRows(to_js(list(rows)), key)
+        return result.to_py() if hasattr(result, "to_py") else result
+
+    def remove_rows(self, ids: Iterable[Any], key: str = "id") -> Dict[str, int]:
+        """
+        Removes the cards of the rows whose `key` field is in `ids`.
+
+        :param ids: Key values of the rows to remove; unknown values are ignored.
+        :param key: (Optional) The row field that uniquely identifies a row.
+        :return: ``{"added": 0, "updated": 0, "removed": n}`` with the number of cards removed.
+        """
+        result = self.cardflow.removeRows(to_js(list(ids)), key)
+        return result.to_py() if hasattr(result, "to_py") else result
+
+    def replace_data(self, rows: Iterable[Dict[str, Any]], key: str = "id") -> Dict[str, int]:
+        """
+        Makes `rows` the complete data set, keeping the cards of rows that are still present.
+
+        Suited to polling loops: unchanged cards keep their DOM, expansion state and attached widgets.
+
+        :param rows: The complete, current set of rows, in display order.
+        :param key: (Optional) The row field that uniquely identifies a row; rows are matched on it.
+        :return: ``{"added": n, "updated": n, "removed": n}``: new rows, kept rows with changed
+            fields, and rows dropped because they are missing from `rows`.
+        """
+        result = self.cardflow.replaceData(to_js(list(rows)), key)
+        return result.to_py() if hasattr(result, "to_py") else result
+
+    def sort(self, column_id: str, order: str = "asc") -> None:
+        """
+        Sorts the cards by a column, reordering the existing cards in place.
+
+        :param column_id: The ID of the column to sort by.
+        :param order: (Optional) "asc" or "desc".
+        """
+        if order not in ("asc", "desc"):
+            raise ValueError(f"Unsupported sort order: {order!r}")
+        self.cardflow.sort(column_id, order)
+
     def toggle_header(self, show=None):
         self.cardflow.toggleHeader(show)
 
@@ -106,9 +156,9 @@ class CardFlow:
         except Exception:
             if hasattr(self.cardflow, "setTheme"):
                 if isinstance(theme, dict):
-                    self.cardflow.setTheme(js.JSON.parse(json.dumps(theme)))
+                    self.cardflow.setTheme(to_js(theme))
                 else:
-                    self.cardflow.setTheme(js.JSON.parse(json.dumps({"name": theme, "fonts": True})))
+                    self.cardflow.setTheme(to_js({"name": theme, "fonts": True}))
 
     def export_to_json(self) -> str:
         """
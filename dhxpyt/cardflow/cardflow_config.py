@@ -99,6 +99,7 @@ class CardFlowConfig:
         defaultExpandedHeight: str = "300px",  # NEW: Default height for expanded cards
         gpu: bool = False,
         gpu_widget_id: str = "",
+        virtual: bool = False,
     ):
         """
         Initializes the CardFlowConfig.
@@ -115,6 +116,8 @@ class CardFlowConfig:
         :param cardHeight: Height (CSS) of each card row, e.g. "100px". Defaults to "auto" in JS if not set.
         :param stacked: If True, card data displays in vertical (stacked) format rather than side-by-side grid.
         :param defaultExpandedHeight: Default height for expanded card content areas (e.g., "300px").
+        :param virtual: If True, collapsed cards are drawn as plain pooled rows in a virtual scroller and a
+            card's dhx Layout is only created when it is expanded or receives content. Use for large data sets.
         """
         self.columns = columns if columns is not None else []
         self.data = data if data is not None else []
@@ -137,6 +140,7 @@ class CardFlowConfig:
         self.showOptions = showOptions
         self.gpu = gpu
         self.gpu_widget_id = gpu_widget_id
+        self.virtual = virtual
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -169,6 +173,7 @@ class CardFlowConfig:
             "defaultExpandedHeight": self.defaultExpandedHeight,
             "gpu": self.gpu,
             "gpuWidgetId": self.gpu_widget_id or None,
+            "virtual": self.virtual,
         }
         # Remove keys with None values
         return {k: v for k, v in config_dict.items() if v is not None}
@@ -1,17 +1,18 @@
-import json
+import asyncio
+import inspect
 import logging
 from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import js
 from pyodide.ffi import create_proxy
 
+from ..marshalling import to_js
 from .cardpanel_config import CardPanelConfig, CardPanelCardConfig
 
 
 logger = logging.getLogger(__name__)
 WRAPPER_REVISION = "cardpanel-wrapper/2024-02-22"
-logger.info("CardPanel wrapper loaded (%s)", WRAPPER_REVISION)
-print(f"[CardPanel] Wrapper ready ({WRAPPER_REVISION})")
+logger.debug("CardPanel wrapper loaded (%s)", WRAPPER_REVISION)
 
 
 class CardPanel:
@@ -39,6 +40,8 @@ class CardPanel:
         self.config = config or CardPanelConfig()
         self._event_proxies: Dict[str, List[Any]] = {}
         self._container = container
+        self._search_source: Optional[Callable[[str], Any]] = None
+        self._search_generation = 0
 
         root_element = self._resolve_root(container=container, root=root)
         if root_element is None:
@@ -47,7 +50,7 @@ class CardPanel:
         config_payload = self.config.to_dict()
         self.cardpanel = js.customdhx.CardPanel.new(
             root_element,
-            js.JSON.parse(json.dumps(config_payload))
+            to_js(config_payload)
         )
 
     # ---------------------------------------------------------------------
@@ -163,18 +166,74 @@ class CardPanel:
 
     def load(self, cards: Iterable[Union[CardPanelCardConfig, Dict[str, Any]]]) -> None:
         payload = [card.to_dict() if hasattr(card, "to_dict") else card for card in cards]
-        self.cardpanel.load(js.JSON.parse(json.dumps(payload)))
+        self.cardpanel.load(to_js(payload))
 
     def add_card(self, card: Union[CardPanelCardConfig, Dict[str, Any]]) -> None:
         card_payload = card.to_dict() if hasattr(card, "to_dict") else card
-        self.cardpanel.add(js.JSON.parse(json.dumps(card_payload)))
+        self.cardpanel.add(to_js(card_payload))
+
+    def add_cards(self, cards: Iterable[Union[CardPanelCardConfig, Dict[str, Any]]]) -> None:
+        """
+        Appends several cards in one call; cards already on screen are not re-rendered.
+        """
+        payload = [card.to_dict() if hasattr(card, "to_dict") else card for card in cards]
+        if payload:
+            self.cardpanel.addCards(to_js(payload))
 
     def filter(self, query: str) -> None:
         """
-        Access the underlying filter logic (mirrors the JS helper).
+        Filters the visible cards by `query`.
+
+        Uses the widget's local search index, or the search source set with
+        set_search_source() when there is one.
+        """
+        if self._search_source is None:
+            self.cardpanel.filter(query)
+            return
+
+        self._search_generation += 1
+        generation = self._search_generation
+        result = self._search_source(query)
+        if inspect.isawaitable(result):
+            async def receive():
+                try:
+                    ids = await result
+                except Exception as exc:
+                    logger.warning("CardPanel search source failed for %r: %s", query, exc)
+                    return
+                self._show_matches(generation, ids)
+            asyncio.ensure_future(receive())
+        else:
+            self._show_matches(generation, result)
+
+    def set_search_source(self, source: Optional[Callable[[str], Any]]) -> None:
+        """
+        Routes searches to a Python callable, e.g. for server-backed catalogs.
+
+        The callable receives the query and returns (or, if async, resolves to)
+        the ids of the matching cards, or None to show every card. Typing in the
+        search box goes through it as well. Pass None to use the local index again.
+
+        :param source: Callable ``source(query)``, sync or async, or None.
         """
-        if hasattr(self.cardpanel, "_filter"):
-            self.cardpanel._filter(query)
+        self._search_source = source
+        previous = self._event_proxies.pop("searchProvider", [])
+        if source is None:
+            self.cardpanel.setSearchProvider(None)
+        else:
+            proxy = create_proxy(self.filter)
+            self._event_proxies["searchProvider"] = [proxy]
+            self.cardpanel.setSearchProvider(proxy)
+        # Released only once the widget no longer points at them.
+        for old_proxy in previous:
+            old_proxy.destroy()
+
+    def _show_matches(self, generation: int, ids: Optional[Iterable[Any]]) -> None:
+        if generation != self._search_generation:
+            return  # superseded by a newer query
+        if hasattr(ids, "to_py"):
+            ids = ids.to_py()
+        self.cardpanel.showMatches(None if ids is None else to_js(list(ids)))
 
     def destroy(self) -> None:
         """
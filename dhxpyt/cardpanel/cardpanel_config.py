@@ -60,6 +60,8 @@ class CardPanelConfig:
     card_columns: Optional[int] = None
     card_icon_size: Optional[Union[int, float, str]] = None
     card_template: Optional[Any] = None  # accepts string name, callable, or descriptor dict
+    search_fields: Optional[List[str]] = None  # card fields covered by the search index
+    search_debounce_ms: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
         cards_payload: List[Dict[str, Any]] = []
@@ -103,5 +105,9 @@ class CardPanelConfig:
             config_dict["cardIconSize"] = self.card_icon_size
         if self.card_template is not None:
             config_dict["cardTemplate"] = self.card_template
+        if self.search_fields is not None:
+            config_dict["searchFields"] = list(self.search_fields)
+        if self.search_debounce_ms is not None:
+            config_dict["searchDebounceMs"] = self.search_debounce_ms
 
         return config_dict
@@ -1,9 +1,9 @@
 # chart.py
 from typing import Any, Callable, List, Dict, Union
 import js
-import json
 from pyodide.ffi import create_proxy
 
+from ..marshalling import to_js
 from .chart_config import (ChartConfig, LineChartConfig, SplineAreaChartConfig, 
                            BarChartConfig, SplineChartConfig, XBarChartConfig, 
                            AreaChartConfig, Pie3DChartConfig, PieChartConfig, 
@@ -22,7 +22,7 @@ class Chart:
     """
     def __init__(self, config: ChartConfig, widget_parent: Any = None):
         """Initializes the chart instance with the given configuration."""
-        self.chart = js.dhx.Chart.new(widget_parent, js.JSON.parse(json.dumps(config.to_dict())))
+        self.chart = js.dhx.Chart.new(widget_parent, to_js(config.to_dict()))
 
     """ Chart API Functions """
 
@@ -59,7 +59,7 @@ class Chart:
 
         :param config: Dictionary of configuration options.
         """
-        self.chart.setConfig(js.JSON.parse(json.dumps(config)))
+        self.chart.setConfig(to_js(config))
 
     def png(self, config: Dict[str, Any] = {}) -> None:
         """
@@ -67,7 +67,7 @@ class Chart:
 
         :param config: Optional export configuration.
         """
-        self.chart.png(js.JSON.parse(json.dumps(config)))
+        self.chart.png(to_js(config))
 
     def pdf(self, config: Dict[str, Any] = {}) -> None:
         """
@@ -75,7 +75,7 @@ class Chart:
 
         :param config: Optional export configuration.
         """
-        self.chart.pdf(js.JSON.parse(json.dumps(config)))
+        self.chart.pdf(to_js(config))
 
     """ Chart Events """
 
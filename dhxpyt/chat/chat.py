@@ -1,19 +1,65 @@
 import asyncio
-import json
 import logging
 import inspect
+import time
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
 
 import js
 from pyodide.ffi import create_proxy
 
+from ..marshalling import to_js
 from .chat_config import ChatConfig, ChatAgentConfig, ChatMessageConfig
 
 
 logger = logging.getLogger(__name__)
 WRAPPER_REVISION = "chat-wrapper/2024-03-01"
-logger.info("Chat widget wrapper loaded (%s)", WRAPPER_REVISION)
-print(f"[ChatWidget] Wrapper ready ({WRAPPER_REVISION})")
+logger.debug("Chat widget wrapper loaded (%s)", WRAPPER_REVISION)
+
+
+class _StreamBuffer:
+    """
+    Coalesces streamed chunks so the widget sees one append per interval
+    instead of one per token.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[str], None],
+        interval_ms: Optional[float],
+        max_chars: Optional[int],
+    ) -> None:
+        self._flush = flush
+        self._interval = interval_ms / 1000.0 if interval_ms else None
+        self._max_chars = max_chars
+        self._parts: List[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+        self._timer: Any = None
+
+    def add(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._max_chars and self._size >= self._max_chars:
+            self.flush()
+        elif self._interval is not None and time.monotonic() - self._last_flush >= self._interval:
+            self.flush()
+
+    def arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Schedule a trailing flush so text never waits on the next chunk."""
+        if self._parts and self._timer is None and self._interval is not None:
+            self._timer = loop.call_later(self._interval, self.flush)
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._last_flush = time.monotonic()
+        if not self._parts:
+            return
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self._flush(text)
 
 
 class Chat:
@@ -27,7 +73,17 @@ class Chat:
         *,
         container: Any = None,
         root: Optional[Union[str, Any]] = None,
+        persistence: Optional[Union[str, bool]] = None,
     ) -> None:
+        """
+        :param config: (Optional) Chat configuration.
+        :param container: (Optional) Element or layout cell hosting the widget.
+        :param root: (Optional) Root element or CSS selector, used when no container is given.
+        :param persistence: (Optional) Where chat history is stored: "auto" (IndexedDB when
+            available, otherwise localStorage), "indexeddb", "local", or "none"/False to
+            disable it. Overrides ``config.persistence``. History is only persisted when
+            ``config.storage_key`` is set.
+        """
         if container is None and root is None:
             raise ValueError("Chat widget requires a container or a root element.")
 
@@ -40,8 +96,9 @@ class Chat:
             raise RuntimeError("Unable to resolve root element for Chat widget.")
 
         config_payload = self.config.to_dict()
-        config_json = json.dumps(config_payload)
-        config_options = js.JSON.parse(config_json)
+        if persistence is not None:
+            config_payload["persistence"] = persistence
+        config_options = to_js(config_payload)
         self.chat = js.customdhx.ChatWidget.new(root_element, config_options)
 
     # ------------------------------------------------------------------
@@ -129,20 +186,25 @@ class Chat:
     def set_messages(
         self, messages: Iterable[Union[ChatMessageConfig, Dict[str, Any]]]
     ) -> None:
+        """
+        Replace the messages of the active chat. Histories at or above
+        ``ChatConfig.virtualize_threshold`` (200 by default) are rendered as a
+        window around the viewport, so only the visible messages get DOM.
+        """
         payload = [self._message_to_dict(message) for message in messages]
-        self.chat.setMessages(js.JSON.parse(json.dumps(payload)))
+        self.chat.setMessages(to_js(payload))
 
     def add_message(
         self, message: Union[ChatMessageConfig, Dict[str, Any]]
     ) -> str:
         payload = self._message_to_dict(message)
-        result = self.chat.addMessage(js.JSON.parse(json.dumps(payload)))
+        result = self.chat.addMessage(to_js(payload))
         return result.to_py() if hasattr(result, "to_py") else result
 
     def update_message(self, message_id: str, **updates: Any) -> None:
         self.chat.updateMessage(
             message_id,
-            js.JSON.parse(json.dumps(updates))
+            to_js(updates)
         )
 
     def remove_message(self, message_id: str) -> None:
@@ -161,7 +223,7 @@ class Chat:
         message: Union[ChatMessageConfig, Dict[str, Any]],
     ) -> str:
         payload = self._message_to_dict(message)
-        result = self.chat.startStream(js.JSON.parse(json.dumps(payload)))
+        result = self.chat.startStream(to_js(payload))
         return result.to_py() if hasattr(result, "to_py") else result
 
     def append_stream(self, message_id: str, chunk: str) -> None:
@@ -184,7 +246,7 @@ class Chat:
             agent_payload = agent
         else:
             raise TypeError(f"Unsupported agent representation: {type(agent)!r}")
-        self.chat.setAgent(js.JSON.parse(json.dumps(agent_payload)))
+        self.chat.setAgent(to_js(agent_payload))
 
     def set_theme(
         self,
@@ -301,6 +363,11 @@ class Chat:
         if not isinstance(payload, dict):
             return ""
 
+        # Compact delta frames: {"t": text}; control frames carry no text.
+        text = payload.get("t")
+        if isinstance(text, str):
+            return text
+
         chunk_type = payload.get("type")
 
         if chunk_type == "chunk":
@@ -347,10 +414,39 @@ class Chat:
         finish: bool = True,
         on_error: Optional[Callable[[Exception], None]] = None,
         cancel_check: Optional[Callable[[], bool]] = None,
+        flush_interval_ms: Optional[float] = None,
+        max_batch_chars: Optional[int] = None,
     ) -> None:
+        """
+        Pipe a (sync or async) iterable of stream chunks into a message.
+
+        By default every parsed chunk is appended immediately. Passing
+        `flush_interval_ms` (e.g. 16 for once per frame) and/or
+        `max_batch_chars` buffers chunks in Python and forwards them as a
+        single `append_stream` call per interval or once the buffer reaches
+        the size limit.
+        """
         tokenize = parser or self.extract_stream_text
+        buffer: Optional[_StreamBuffer] = None
+        if flush_interval_ms or max_batch_chars:
+            buffer = _StreamBuffer(
+                lambda text: self.append_stream(response_id, text),
+                flush_interval_ms,
+                max_batch_chars,
+            )
+
+        def push(text: str) -> None:
+            if buffer is None:
+                self.append_stream(response_id, text)
+            else:
+                buffer.add(text)
+
+        def flush() -> None:
+            if buffer is not None:
+                buffer.flush()
 
         def handle_error(exc: Exception) -> None:
+            flush()
             if on_error:
                 on_error(exc)
                 return
@@ -366,18 +462,23 @@ class Chat:
         ):
 
             async def runner():
+                loop = asyncio.get_running_loop()
                 try:
                     async for chunk in stream:
                         if cancel_check and cancel_check():
+                            flush()
                             if finish:
                                 self.finish_stream(response_id)
                             return
                         text = tokenize(chunk)
                         if text:
-                            self.append_stream(response_id, text)
+                            push(text)
+                            if buffer is not None:
+                                buffer.arm(loop)
                 except Exception as exc:  # pragma: no cover - pass to handler
                     handle_error(exc)
                 else:
+                    flush()
                     if finish:
                         self.finish_stream(response_id)
 
@@ -392,17 +493,19 @@ class Chat:
         try:
             for chunk in iterator:
                 if cancel_check and cancel_check():
+                    flush()
                     if finish:
                         self.finish_stream(response_id)
                     return
                 text = tokenize(chunk)
                 if not text:
                     continue
-                self.append_stream(response_id, text)
+                push(text)
         except Exception as exc:  # pragma: no cover - pass to handler
             handle_error(exc)
             return
 
+        flush()
         if finish:
             self.finish_stream(response_id)
 
@@ -87,6 +87,9 @@ class ChatConfig:
     id_prefix: Optional[str] = None
     demo_response: Optional[str] = None
     storage_key: Optional[str] = None
+    persistence: Optional[Union[str, bool]] = None
+    persistence_debounce_ms: Optional[int] = None
+    virtualize_threshold: Optional[int] = None
     extra: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -116,6 +119,9 @@ class ChatConfig:
             "idPrefix": self.id_prefix,
             "demoResponse": self.demo_response,
             "storageKey": self.storage_key,
+            "persistence": self.persistence,
+            "persistenceDebounceMs": self.persistence_debounce_ms,
+            "virtualizeThreshold": self.virtualize_threshold,
             "gpu": self.gpu,
             "gpuWidgetId": self.gpu_widget_id,
         }
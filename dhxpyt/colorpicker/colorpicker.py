@@ -3,10 +3,10 @@ pyTincture Colorpicker widget implementation
 """
 
 from typing import Any, Callable, Dict, List, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .colorpicker_config import ColorpickerConfig
 
 class Colorpicker:
@@ -14,7 +14,7 @@ class Colorpicker:
         """Initializes the Colorpicker instance."""
         if config is None:
             config = ColorpickerConfig()
-        self.colorpicker = js.dhx.Colorpicker.new(widget_parent, js.JSON.parse(json.dumps(config.to_dict())))
+        self.colorpicker = js.dhx.Colorpicker.new(widget_parent, to_js(config.to_dict()))
     
     """ Colorpicker API Functions """
 
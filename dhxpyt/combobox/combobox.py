@@ -3,10 +3,10 @@ pyTincture Combobox widget implementation
 """
 
 from typing import Any, Callable, Dict, List, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .combobox_config import ComboboxConfig
 
 class Combobox:
@@ -15,7 +15,8 @@ class Combobox:
         if config is None:
             config = ComboboxConfig()
         config_dict = config.to_dict()
-        self.combobox = js.dhx.Combobox.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.combobox = js.dhx.Combobox.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
     
     """ Combobox API Functions """
     
@@ -34,6 +35,9 @@ class Combobox:
     def destructor(self) -> None:
         """Removes a Combobox instance and releases occupied resources."""
         self.combobox.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
     
     def disable(self) -> None:
         """Disables Combobox on a page."""
@@ -143,7 +147,7 @@ class Combobox:
     
     @data.setter
     def data(self, value: List[Dict[str, Any]]) -> None:
-        self.combobox.data.parse(js.JSON.parse(json.dumps(value)))
+        self.combobox.data.parse(to_js(value))
     
     @property
     def disabled(self) -> bool:
@@ -30,6 +30,438 @@
     // Ensure we have a "customdhx" namespace
     globalThis.customdhx = globalThis.customdhx || {};
 
+    // Virtual rendering: rows within this distance of the viewport stay mounted.
+    const VIRTUAL_OVERSCAN_PX = 600;
+    const VIRTUAL_ESTIMATED_ROW_HEIGHT = 64;
+
+    function ensureStyles() {
+        if (document.querySelector("style[data-cardflow-style='true']")) {
+            return;
+        }
+        const css = `
+.cardflow-virtual-host {
+    height: 100%;
+    width: 100%;
+}
+.cardflow-virtual-scroller {
+    height: 100%;
+    overflow: auto;
+    padding: 10px;
+    box-sizing: border-box;
+}
+.cardflow-row {
+    margin: 5px;
+    border: var(--dhx-border-width, 1px) solid var(--dhx-border-color, #dfdfdf);
+    background: var(--dhx-s-toolbar-background, var(--dhx-background-primary, #fff));
+    color: var(--dhx-font-color-primary, inherit);
+}
+.cardflow-row-header {
+    display: flex;
+    align-items: center;
+    min-height: 55px;
+    cursor: pointer;
+}
+.cardflow-row-toggle {
+    padding: 0 6px 0 10px;
+    font-size: 18px;
+}
+.cardflow-row-cells {
+    flex: 1 1 auto;
+    min-width: 0;
+}
+.cardflow-row-options {
+    margin-right: 10px;
+    font-size: 20px;
+}
+.cardflow-row-content {
+    position: relative;
+    padding: 5px;
+}
+.cardflow-row .toolbar-cell:not(.hideable) {
+    min-width: 0;
+}
+@media (max-width: 600px) {
+    .cardflow-row .hideable {
+        display: none;
+    }
+}
+`;
+        const style = document.createElement("style");
+        style.setAttribute("data-cardflow-style", "true");
+        style.textContent = css;
+        document.head.appendChild(style);
+    }
+
+    function sameValue(a, b) {
+        if (a === b) return true;
+        if (a === null || b === null || typeof a !== "object" || typeof b !== "object") return false;
+        try {
+            return JSON.stringify(a) === JSON.stringify(b);
+        } catch (err) {
+            return false;
+        }
+    }
+
+    function parsePixels(value, fallback) {
+        const parsed = parseFloat(value);
+        return typeof value === "number" || /px$/.test(String(value)) ? (isNaN(parsed) ? fallback : parsed) : fallback;
+    }
+
+    // Renders collapsed cards as pooled plain DOM rows and only keeps the rows
+    // near the viewport mounted. A card's dhx.Layout is created on demand by
+    // contentCell() (expand / attachToCardContent) and survives scrolling.
+    class VirtualCardList {
+        constructor(flow) {
+            this.flow = flow;
+            this.rows = [];
+            this.rowsById = new Map();
+            this.mounted = new Map();
+            this.pool = [];
+            this.expanded = new Set();
+            this.contents = new Map();
+            this.heights = new Map();
+            this.offsets = null;
+            this.estimate = VIRTUAL_ESTIMATED_ROW_HEIGHT;
+            this.scroller = null;
+            this.frame = null;
+            this.menu = null;
+            this.menuRowId = null;
+            this._onScroll = () => this.scheduleUpdate();
+        }
+
+        mount(host) {
+            ensureStyles();
+            this.scroller = document.createElement("div");
+            this.scroller.className = "cardflow-virtual-scroller";
+            this.topSpacer = document.createElement("div");
+            this.rowsEl = document.createElement("div");
+            this.bottomSpacer = document.createElement("div");
+            this.scroller.append(this.topSpacer, this.rowsEl, this.bottomSpacer);
+            host.appendChild(this.scroller);
+            this.scroller.addEventListener("scroll", this._onScroll);
+            window.addEventListener("resize", this._onScroll);
+            this.rowsEl.addEventListener("click", (event) => this._handleClick(event));
+            this.update();
+        }
+
+        setRows(rows) {
+            this.rows = rows || [];
+            this.rowsById = new Map();
+            this.rows.forEach((row, index) => {
+                if (row.id === undefined || row.id === null || row.id === "") {
+                    row.id = (index + 1).toString();
+                }
+                this.rowsById.set(row.id, row);
+            });
+            this.offsets = null;
+            this.scheduleUpdate();
+        }
+
+        getRow(id) {
+            return this.rowsById.get(id);
+        }
+
+        dropRow(id) {
+            const el = this.mounted.get(id);
+            if (el) {
+                this._release(id, el);
+            }
+            const content = this.contents.get(id);
+            if (content && content.layout.destructor) {
+                content.layout.destructor();
+            }
+            this.contents.delete(id);
+            this.expanded.delete(id);
+            this.heights.delete(id);
+        }
+
+        refreshRow(id) {
+            const el = this.mounted.get(id);
+            const row = this.rowsById.get(id);
+            if (el && row) {
+                this._fill(el, row);
+                this.scheduleUpdate();
+            }
+        }
+
+        refreshAll() {
+            this.mounted.forEach((el, id) => this._fill(el, this.rowsById.get(id)));
+            this.scheduleUpdate();
+        }
+
+        isExpanded(id) {
+            return this.expanded.has(id);
+        }
+
+        expand(id, event) {
+            if (!this.rowsById.has(id) || this.expanded.has(id)) {
+                return;
+            }
+            this.expanded.add(id);
+            this.heights.delete(id);
+            this.offsets = null;
+            this.refreshRow(id);
+            this.flow.onExpand(id, event || {});
+        }
+
+        collapse(id, event) {
+            if (!this.expanded.delete(id)) {
+                return;
+            }
+            this.heights.delete(id);
+            this.offsets = null;
+            this.refreshRow(id);
+            this.flow.onCollapse(id, event || {});
+        }
+
+        setExpandedHeight(id) {
+            const content = this.contents.get(id);
+            if (content) {
+                content.el.style.height = this.flow.getCardExpandedHeight(id);
+            }
+            this.heights.delete(id);
+            this.offsets = null;
+            this.scheduleUpdate();
+        }
+
+        // Returns the single cell of the card's content layout, creating the
+        // dhx.Layout the first time a card needs one.
+        contentCell(id) {
+            if (!this.rowsById.has(id)) {
+                return null;
+            }
+            let content = this.contents.get(id);
+            if (!content) {
+                const el = document.createElement("div");
+                el.className = "cardflow-row-content";
+                el.style.height = this.flow.getCardExpandedHeight(id);
+                const layout = new dhx.Layout(el, {
+                    type: "none",
+                    rows: [{ id: "content", height: "100%" }],
+                });
+                content = { el, layout };
+                this.contents.set(id, content);
+                this.refreshRow(id);
+            }
+            return content.layout.getCell("content");
+        }
+
+        scheduleUpdate() {
+            if (this.frame !== null || !this.scroller) {
+                return;
+            }
+            this.frame = requestAnimationFrame(() => this.update());
+        }
+
+        update() {
+            this.frame = null;
+            if (!this.scroller) {
+                return;
+            }
+            const rows = this.rows;
+            let offsets = this._getOffsets();
+            const scrollTop = this.scroller.scrollTop || 0;
+            const viewport = this.scroller.clientHeight || window.innerHeight || 800;
+            const top = Math.max(0, scrollTop - VIRTUAL_OVERSCAN_PX);
+            const bottom = scrollTop + viewport + VIRTUAL_OVERSCAN_PX;
+
+            let low = 0;
+            let high = rows.length;
+            while (low < high) {
+                const mid = (low + high) >> 1;
+                if (offsets[mid + 1] <= top) {
+                    low = mid + 1;
+                } else {
+                    high = mid;
+                }
+            }
+            const start = low;
+            let end = start;
+            while (end < rows.length && offsets[end] < bottom) {
+                end += 1;
+            }
+
+            const visible = new Set();
+            for (let i = start; i < end; i += 1) {
+                visible.add(rows[i].id);
+            }
+            this.mounted.forEach((el, id) => {
+                if (!visible.has(id)) {
+                    this._release(id, el);
+                }
+            });
+
+            let cursor = this.rowsEl.firstChild;
+            for (let i = start; i < end; i += 1) {
+                const row = rows[i];
+                let el = this.mounted.get(row.id);
+                if (!el) {
+                    el = this.pool.pop() || this._createRowElement();
+                    this._fill(el, row);
+                    this.mounted.set(row.id, el);
+                }
+                if (el === cursor) {
+                    cursor = cursor.nextSibling;
+                } else {
+                    this.rowsEl.insertBefore(el, cursor);
+                }
+            }
+
+            let measured = false;
+            for (let i = start; i < end; i += 1) {
+                const id = rows[i].id;
+                const height = this.mounted.get(id).offsetHeight;
+                if (height && height !== this.heights.get(id)) {
+                    this.heights.set(id, height);
+                    if (!this.expanded.has(id)) {
+                        this.estimate = height;
+                    }
+                    measured = true;
+                }
+            }
+            if (measured) {
+                // Real heights differ from the estimate; settle the window on
+                // the next frame so the viewport ends up fully covered.
+                this.offsets = null;
+                offsets = this._getOffsets();
+                this.scheduleUpdate();
+            }
+            this.topSpacer.style.height = `${offsets[start]}px`;
+            this.bottomSpacer.style.height = `${offsets[rows.length] - offsets[end]}px`;
+        }
+
+        destroy() {
+            if (this.frame !== null) {
+                cancelAnimationFrame(this.frame);
+                this.frame = null;
+            }
+            if (this.scroller) {
+                this.scroller.removeEventListener("scroll", this._onScroll);
+                this.scroller.remove();
+                this.scroller = null;
+            }
+            window.removeEventListener("resize", this._onScroll);
+            this.contents.forEach((content) => {
+                if (content.layout.destructor) {
+                    content.layout.destructor();
+                }
+            });
+            if (this.menu && this.menu.destructor) {
+                this.menu.destructor();
+            }
+            this.contents.clear();
+            this.mounted.clear();
+            this.pool = [];
+        }
+
+        _getOffsets() {
+            if (this.offsets && this.offsets.length === this.rows.length + 1) {
+                return this.offsets;
+            }
+            const offsets = new Array(this.rows.length + 1);
+            offsets[0] = 0;
+            for (let i = 0; i < this.rows.length; i += 1) {
+                const id = this.rows[i].id;
+                let height = this.heights.get(id);
+                if (height === undefined) {
+                    height = this.estimate;
+                    if (this.expanded.has(id)) {
+                        height += parsePixels(this.flow.getCardExpandedHeight(id), 300);
+                    }
+                }
+                offsets[i + 1] = offsets[i] + height;
+            }
+            this.offsets = offsets;
+            return offsets;
+        }
+
+        _createRowElement() {
+            const el = document.createElement("div");
+            el.className = "cardflow-row";
+            const header = document.createElement("div");
+            header.className = "cardflow-row-header";
+            el.appendChild(header);
+            el._header = header;
+            return el;
+        }
+
+        _fill(el, row) {
+            const flow = this.flow;
+            const expanded = this.expanded.has(row.id);
+            el._rowId = row.id;
+            el.dataset.rowId = String(row.id);
+            el.style.backgroundColor = row._color || "";
+            el.style.fontFamily = flow.toolbarFontFamily;
+            const showOptions = flow.showOptions && (row._showOptions === undefined || row._showOptions);
+            el._header.innerHTML =
+                `<i class="cardflow-row-toggle mdi ${expanded ? "mdi-chevron-down" : "mdi-chevron-right"}"></i>` +
+                `<div class="cardflow-row-cells">${flow.getCardCellsHtml(flow.config.columns || [], row, false)}</div>` +
+                (showOptions ? '<i class="cardflow-row-options mdi mdi-dots-vertical-circle"></i>' : "");
+
+            if (expanded && !this.contents.has(row.id)) {
+                // Expanding creates the content layout so attachToCardContent
+                // has somewhere to mount the card's widget.
+                this.contentCell(row.id);
+            }
+            const content = this.contents.get(row.id);
+            if (el._content && el._content !== (content && content.el)) {
+                el._content.remove();
+                el._content = null;
+            }
+            if (content) {
+                content.el.hidden = !expanded;
+                if (el._content !== content.el) {
+                    el.appendChild(content.el);
+                    el._content = content.el;
+                }
+            }
+        }
+
+        _release(id, el) {
+            this.mounted.delete(id);
+            if (el._content) {
+                el._content.remove();
+                el._content = null;
+            }
+            el.remove();
+            this.pool.push(el);
+        }
+
+        _handleClick(event) {
+            const target = event.target;
+            const rowEl = target && target.closest ? target.closest(".cardflow-row") : null;
+            if (!rowEl || target.closest(".cardflow-row-content")) {
+                return;
+            }
+            const id = rowEl._rowId;
+            if (target.closest(".cardflow-row-options")) {
+                this._showOptions(id, target);
+                return;
+            }
+            if (this.expanded.has(id)) {
+                this.collapse(id, event);
+            } else {
+                this.expand(id, event);
+            }
+        }
+
+        _showOptions(id, target) {
+            const items = this.flow.getOptionMenuItems();
+            if (!items.length) {
+                return;
+            }
+            if (!this.menu) {
+                this.menu = new dhx.ContextMenu(null, { css: "dhx_widget--bordered" });
+                this.menu.events.on("click", (optionId, event) => {
+                    this.flow.onOptions(this.menuRowId, event, optionId);
+                });
+            }
+            this.menu.data.parse(items);
+            this.menuRowId = id;
+            this.menu.showAt(target, "bottom");
+        }
+    }
+
     class CardFlow {
         constructor(container, config) {
             this.config = config || {};
@@ -49,6 +481,9 @@
             this.showOptions = this.config.showOptions !== false;
             this.useGpu = !!this.config.gpu;
             this.gpuWidgetId = this.config.gpuWidgetId || null;
+            // virtual: collapsed cards are pooled DOM rows instead of a Layout
+            // cell pair plus a dhx.Toolbar per card.
+            this.cardList = this.config.virtual ? new VirtualCardList(this) : null;
 
             if (this.config.columns && this.config.columns.length > 0) {
                 this.sortColumnId = "";
@@ -56,6 +491,11 @@
                 this.sortColumnId = null;
             }
 
+            this.container = container;
+            this._buildLayout();
+        }
+
+        _buildLayout() {
             const rows = this.config.data ? this.config.data.length : 0;
 
             const layoutRows = [];
@@ -72,17 +512,25 @@
                     ],
                 });
             }
-            layoutRows.push({
-                id: "cardsRow",
-                cols: [this.getLayoutCount("C", rows)],
-            });
+            const hostId = `cardflow-host-${Math.random().toString(16).slice(2)}`;
+            if (this.cardList) {
+                layoutRows.push({
+                    id: "cardsRow",
+                    html: `<div class="cardflow-virtual-host" data-cardflow-host="${hostId}"></div>`,
+                });
+            } else {
+                layoutRows.push({
+                    id: "cardsRow",
+                    cols: [this.getLayoutCount("C", rows)],
+                });
+            }
 
             this.layout = new dhx.Layout(null, {
                 id: "youknowme",
                 type: "none",
                 rows: layoutRows,
             });
-            container.attach(this.layout);
+            this.container.attach(this.layout);
             this.registerGpuPreference();
 
             if (this.showHeader || (!this.sortDisabled && this.showSort)) {
@@ -90,6 +538,16 @@
                 this.updateSortRowVisibility();
             }
 
+            if (this.cardList) {
+                this.cardList.setRows(this.config.data || []);
+                this.waitForElement(`[data-cardflow-host="${hostId}"]`, 4000)
+                    .then(host => this.cardList.mount(host))
+                    .catch(error => {
+                        console.error("CardFlow virtual list could not be mounted:", error);
+                    });
+                return;
+            }
+
             this.makeHeaderSection("C", rows);
             this.toolbarEventSetup();
         }
@@ -100,7 +558,11 @@
             if (rowData) {
                 rowData._expanded_height = height;
             }
-            
+            if (this.cardList) {
+                this.cardList.setExpandedHeight(cardId);
+                return;
+            }
+
             // If the card is currently expanded, update its height immediately
             const toolbar = this.toolbar.find(tb => tb.id === cardId);
             if (toolbar && toolbar.stat === "down") {
@@ -127,62 +589,73 @@
         }
 
         toolbarEventSetup() {
-            this.toolbar.forEach(toolbar => {
-                if (toolbar.stat !== "down" && toolbar.stat !== "up") {
-                    toolbar.stat = "up";
-                }
+            this.toolbar.forEach(toolbar => this._setupToolbarEvents(toolbar));
+        }
 
-                const uid = toolbar._uid;
-                const selector = `[data-dhx-widget-id="${uid}"]`;
-                const currentLayout = this.layout;
-
-                this.waitForElement(selector, 4000)
-                    .then(widgetUl => {
-                const navElement = widgetUl.closest("nav") || widgetUl;
-                if (!navElement.__cardflowClickHandler) {
-                    const handler = (event) => {
-                        if (event.target.className.indexOf("dhx_toolbar-button__icon") !== -1) {
-                        } else if (event.target.className.indexOf("dhx_toolbar-button--icon") !== -1) {
-                        } else if (event.target.className.indexOf("dhx_button") !== -1) {
-                        } else if (event.target.className.indexOf("mdi-dots") !== -1) {
-                        } else if (event.target.className.indexOf("dhx_toolbar__item") !== -1) {
-                        } else {
-                            if (toolbar.stat !== "down" && toolbar.stat !== "up") {
-                                toolbar.stat = "up";
-                            }
-                            if (toolbar.stat === "down") {
-                                toolbar.show("up");
-                                toolbar.hide("down");
-                                toolbar.stat = "up";
-                                currentLayout.getCell(toolbar.contentCell).hide();
-                                        this.onCollapse(toolbar.id, event);
-                                    } else if (toolbar.stat === "up") {
-                                        toolbar.show("down");
-                                        toolbar.hide("up");
-                                        toolbar.stat = "down";
-                                        const contentCell = currentLayout.getCell(toolbar.contentCell);
-                                        contentCell.show();
-                                        // Apply the specific height for this card from _expanded_height or default
-                                const expandedHeight = this.getCardExpandedHeight(toolbar.id);
-                                this.updateCellHeight(toolbar.contentCell, expandedHeight);
-                                this.onExpand(toolbar.id, event);
-                            }
+        _setupToolbarEvents(toolbar) {
+            if (toolbar.stat !== "down" && toolbar.stat !== "up") {
+                toolbar.stat = "up";
+            }
+
+            const uid = toolbar._uid;
+            const selector = `[data-dhx-widget-id="${uid}"]`;
+            const currentLayout = this.layout;
+
+            this.waitForElement(selector, 4000)
+                .then(widgetUl => {
+            const navElement = widgetUl.closest("nav") || widgetUl;
+            if (!navElement.__cardflowClickHandler) {
+                const handler = (event) => {
+                    if (event.target.className.indexOf("dhx_toolbar-button__icon") !== -1) {
+                    } else if (event.target.className.indexOf("dhx_toolbar-button--icon") !== -1) {
+                    } else if (event.target.className.indexOf("dhx_button") !== -1) {
+                    } else if (event.target.className.indexOf("mdi-dots") !== -1) {
+                    } else if (event.target.className.indexOf("dhx_toolbar__item") !== -1) {
+                    } else {
+                        if (toolbar.stat !== "down" && toolbar.stat !== "up") {
+                            toolbar.stat = "up";
                         }
-                    };
-                    navElement.addEventListener("click", handler);
-                    navElement.__cardflowClickHandler = handler;
-                }
-                if (!navElement) {
-                    console.error("Toolbar container not found for nav click handling.");
-                }
-            })
-            .catch(error => {
-                console.error(`Widget element for toolbar uid ${uid} not found within 4 seconds.`, error);
-            });
-        });
+                        if (toolbar.stat === "down") {
+                            toolbar.show("up");
+                            toolbar.hide("down");
+                            toolbar.stat = "up";
+                            currentLayout.getCell(toolbar.contentCell).hide();
+                                    this.onCollapse(toolbar.id, event);
+                                } else if (toolbar.stat === "up") {
+                                    toolbar.show("down");
+                                    toolbar.hide("up");
+                                    toolbar.stat = "down";
+                                    const contentCell = currentLayout.getCell(toolbar.contentCell);
+                                    contentCell.show();
+                                    // Apply the specific height for this card from _expanded_height or default
+                            const expandedHeight = this.getCardExpandedHeight(toolbar.id);
+                            this.updateCellHeight(toolbar.contentCell, expandedHeight);
+                            this.onExpand(toolbar.id, event);
+                        }
+                    }
+                };
+                navElement.addEventListener("click", handler);
+                navElement.__cardflowClickHandler = handler;
+            }
+            if (!navElement) {
+                console.error("Toolbar container not found for nav click handling.");
+            }
+                })
+                .catch(error => {
+                    console.error(`Widget element for toolbar uid ${uid} not found within 4 seconds.`, error);
+                });
         }
 
         attachToCardContent(id, widget) {
+            if (this.cardList) {
+                const cell = this.cardList.contentCell(id);
+                if (cell) {
+                    cell.attach(widget);
+                } else {
+                    console.error(`Card with id ${id} not found.`);
+                }
+                return;
+            }
             const cellId = this.rowMapping[id];
             if (!cellId) {
                 console.error(`Mapping for card with id ${id} not found.`);
@@ -197,6 +670,13 @@
         }
 
         detachCardFromContent(id) {
+            if (this.cardList) {
+                const content = this.cardList.contents.get(id);
+                if (content) {
+                    content.layout.getCell("content").detach();
+                }
+                return;
+            }
             const cellId = this.rowMapping[id];
             if (!cellId) {
                 console.error(`Mapping for card with id ${id} not found.`);
@@ -230,6 +710,10 @@
         }
 
         setRowColor(rowId, color) {
+            if (this.cardList) {
+                this._updateVirtualRow(rowId, { _color: color });
+                return;
+            }
             const toolbar = this.toolbar.find(tb => tb.id === rowId);
             if (!toolbar) {
                 console.error(`Toolbar with id ${rowId} not found.`);
@@ -250,6 +734,10 @@
         }
 
         setRowFontSize(rowId, fontSize) {
+            if (this.cardList) {
+                this._updateVirtualRow(rowId, { _fontSize: fontSize });
+                return;
+            }
             const toolbar = this.toolbar.find(tb => tb.id === rowId);
             if (!toolbar) {
                 console.error(`Toolbar with id ${rowId} not found.`);
@@ -274,12 +762,20 @@
         }
 
         setRowDataValue(rowId, columnId, value) {
+            if (this.cardList) {
+                if (!(this.config.columns || []).some(col => col.id === columnId)) {
+                    console.error(`Column with id ${columnId} not found.`);
+                    return;
+                }
+                this._updateVirtualRow(rowId, { [columnId]: value });
+                return;
+            }
             const toolbar = this.toolbar.find(tb => tb.id === rowId);
             if (!toolbar) {
                 console.error(`Toolbar with id ${rowId} not found.`);
                 return;
             }
-            const rowData = this.config.data.find(row => row.id === rowId);
+            const rowData = toolbar.rowData || this.config.data.find(row => row.id === rowId);
             if (!rowData) {
                 console.error(`Row data with id ${rowId} not found.`);
                 return;
@@ -289,27 +785,21 @@
                 console.error(`Column with id ${columnId} not found.`);
                 return;
             }
+            rowData[columnId] = value;
+            this._invalidateSortKey(rowData, columnId);
             const toolbarSelector = `[data-dhx-widget-id="${toolbar._uid}"]`;
             this.waitForElement(toolbarSelector, 4000)
                 .then(toolbarElem => {
-                    const dataCells = toolbarElem.querySelectorAll(".toolbar-cell:not(.hideable)");
-                    let cellIndex = 0;
-                    for (let i = 0; i < this.config.columns.length; i++) {
-                        if (this.config.columns[i].type === "stretch") continue;
-                        if (this.config.columns[i].id === columnId) {
-                            break;
-                        }
-                        cellIndex++;
-                    }
-                    if (cellIndex < dataCells.length) {
+                    const valueCell = Array.from(toolbarElem.querySelectorAll(".cardflow-value"))
+                        .find(cell => cell.dataset.columnId === String(columnId));
+                    if (valueCell) {
                         let displayValue = value;
                         if (column.dataType === "time" && column.applyFormat && column.dataFormat) {
                             displayValue = formatTimeValue(value, column.dataFormat);
                         }
-                        dataCells[cellIndex].textContent = displayValue;
-                        rowData[columnId] = value;
+                        valueCell.textContent = displayValue;
                     } else {
-                        console.error(`Column index for ${columnId} out of bounds or not found.`);
+                        console.error(`Cell for column ${columnId} not found.`);
                     }
                 })
                 .catch(error => {
@@ -318,6 +808,10 @@
         }
 
         setRowOptionsVisibility(rowId, show) {
+            if (this.cardList) {
+                this._updateVirtualRow(rowId, { _showOptions: show });
+                return;
+            }
             const toolbar = this.toolbar.find(tb => tb.id === rowId);
             if (!toolbar) {
                 console.error(`Toolbar with id ${rowId} not found.`);
@@ -334,10 +828,25 @@
 
         toggleDataHeaders(show) {
             this.showDataHeaders = show !== undefined ? show : !this.showDataHeaders;
+            if (this.cardList) {
+                this.cardList.refreshAll();
+                return;
+            }
             this.reDrawCards();
             this.toolbarEventSetup();
         }
 
+        _updateVirtualRow(rowId, changes) {
+            const rowData = this.cardList.getRow(rowId);
+            if (!rowData) {
+                console.error(`Row data with id ${rowId} not found.`);
+                return;
+            }
+            Object.assign(rowData, changes);
+            Object.keys(changes).forEach(key => this._invalidateSortKey(rowData, key));
+            this.cardList.refreshRow(rowId);
+        }
+
         updateSortRowVisibility() {
             const sortRow = this.layout.getCell("sortRow");
             if (sortRow) {
@@ -456,69 +965,384 @@
 
         sortCards() {
             if (!this.sortColumnId || this.sortDisabled) return;
-            const colDef = (this.config.columns || []).find(col => col.id === this.sortColumnId);
-
-            this.config.data.sort((a, b) => {
-                let aVal = a[this.sortColumnId];
-                let bVal = b[this.sortColumnId];
-
-                if (colDef && colDef.dataType) {
-                    switch(colDef.dataType) {
-                        case "float":
-                        case "int":
-                            aVal = parseFloat(aVal);
-                            bVal = parseFloat(bVal);
-                            break;
-                        case "time":
-                            aVal = parseTime(aVal);
-                            bVal = parseTime(bVal);
-                            break;
-                        default:
-                            aVal = aVal.toString();
-                            bVal = bVal.toString();
+            this._sortRows();
+        }
+
+        // Programmatic sort; unlike the toolbar it works with sortDisabled.
+        sort(columnId, order) {
+            if (!columnId) return;
+            this.sortColumnId = columnId;
+            if (order === "asc" || order === "desc") {
+                this.sortOrder = order;
+            }
+            if (this.sortToolbar) {
+                const selectEl = document.getElementById("sortColumnSelect");
+                if (selectEl) {
+                    // Options carry the column id with a "$" prefix.
+                    selectEl.value = `$${columnId}`;
+                }
+                this.sortToolbar.data.update("sortOrder", {
+                    icon: this.sortOrder === "asc" ? "mdi mdi-sort-ascending" : "mdi mdi-sort-descending",
+                    tooltip: this.sortOrder === "asc" ? "Ascending" : "Descending",
+                });
+            }
+            this._sortRows();
+        }
+
+        _sortRows() {
+            const data = this.config.data || [];
+            const keys = this._getSortKeys(this.sortColumnId);
+            const direction = this.sortOrder === "asc" ? 1 : -1;
+            const decorated = data.map((row, index) => ({ row, key: keys.get(row), index }));
+            decorated.sort((a, b) => {
+                // Unparseable keys (null) go last in either direction.
+                if (a.key === null || b.key === null) {
+                    if (a.key === b.key) return a.index - b.index;
+                    return a.key === null ? 1 : -1;
+                }
+                if (a.key < b.key) return -direction;
+                if (a.key > b.key) return direction;
+                return a.index - b.index;
+            });
+            decorated.forEach((entry, index) => {
+                data[index] = entry.row;
+            });
+            this._reorderCards();
+        }
+
+        // Typed sort keys are computed once per column and row and cached
+        // until setRowDataValue() changes a value of that column.
+        _getSortKeys(columnId) {
+            this._sortKeys = this._sortKeys || new Map();
+            const data = this.config.data || [];
+            let entry = this._sortKeys.get(columnId);
+            if (!entry) {
+                const colDef = (this.config.columns || []).find(col => col.id === columnId);
+                entry = { kind: colDef && colDef.dataType ? colDef.dataType : this._detectSortKind(data, columnId), keys: new WeakMap() };
+                this._sortKeys.set(columnId, entry);
+            }
+            data.forEach(row => {
+                if (!entry.keys.has(row)) {
+                    entry.keys.set(row, this._sortKey(entry.kind, row[columnId]));
+                }
+            });
+            return entry.keys;
+        }
+
+        // Without a dataType a column sorts numerically if every value is a
+        // number, by date if every value is a date, and as text otherwise.
+        _detectSortKind(data, columnId) {
+            if (data.every(row => !isNaN(parseFloat(row[columnId])))) return "float";
+            if (data.every(row => !isNaN(new Date(row[columnId]).getTime()))) return "date";
+            return "str";
+        }
+
+        _sortKey(kind, value) {
+            let key;
+            switch (kind) {
+                case "float":
+                case "int":
+                    key = parseFloat(value);
+                    break;
+                case "time":
+                    key = value === undefined || value === null ? NaN : parseTime(String(value));
+                    break;
+                case "date":
+                    key = new Date(value).getTime();
+                    break;
+                default:
+                    return value === undefined || value === null ? "" : value.toString();
+            }
+            return isNaN(key) ? null : key;
+        }
+
+        _invalidateSortKey(rowData, columnId) {
+            const entry = this._sortKeys && this._sortKeys.get(columnId);
+            if (!entry) return;
+            const colDef = (this.config.columns || []).find(col => col.id === columnId);
+            if (colDef && colDef.dataType) {
+                entry.keys.delete(rowData);
+            } else {
+                // The detected kind may change with the new value.
+                this._sortKeys.delete(columnId);
+            }
+        }
+
+        // Moves the cards into data order in one pass without touching the
+        // layout's cells: the i-th header/content cell pair takes over the
+        // toolbar and content of the i-th row. Toolbars are re-attached, not
+        // rebuilt, and dhx folds the cell repaints into one layout redraw.
+        _reorderCards() {
+            if (this.cardList) {
+                this.cardList.setRows(this.config.data);
+                return;
+            }
+            const byRow = new Map(this.toolbar.map(toolbar => [toolbar.rowData, toolbar]));
+            const ordered = (this.config.data || []).map(row => byRow.get(row));
+            if (ordered.length !== this.toolbar.length || ordered.some(toolbar => !toolbar)) {
+                this.reDrawCards();
+                this.toolbarEventSetup();
+                return;
+            }
+            const slots = this.toolbar.map(toolbar => ({ headerCell: toolbar.headerCell, contentCell: toolbar.contentCell }));
+            const contents = new Map(this.toolbar.map(toolbar => {
+                const cell = this.layout.getCell(toolbar.contentCell);
+                return [toolbar, { widget: cell.getWidget(), html: cell.config.html }];
+            }));
+            ordered.forEach((toolbar, index) => {
+                const slot = slots[index];
+                if (toolbar.headerCell === slot.headerCell) {
+                    return;
+                }
+                this.layout.getCell(slot.headerCell).attach(toolbar);
+                const contentCell = this.layout.getCell(slot.contentCell);
+                const content = contents.get(toolbar);
+                if (content.widget) {
+                    contentCell.attach(content.widget);
+                } else {
+                    if (contentCell.getWidget()) {
+                        contentCell.detach();
                     }
+                    contentCell.attachHTML(content.html || "");
+                }
+                toolbar.headerCell = slot.headerCell;
+                toolbar.contentCell = slot.contentCell;
+                this.rowMapping[toolbar.id] = slot.contentCell;
+                if (toolbar.stat === "down") {
+                    contentCell.show();
+                    this.updateCellHeight(slot.contentCell, this.getCardExpandedHeight(toolbar.id));
                 } else {
-                    const aNum = parseFloat(aVal);
-                    const bNum = parseFloat(bVal);
-                    if (!isNaN(aNum) && !isNaN(bNum)) {
-                        aVal = aNum;
-                        bVal = bNum;
-                    } else {
-                        const aDate = new Date(aVal);
-                        const bDate = new Date(bVal);
-                        if (!isNaN(aDate.getTime()) && !isNaN(bDate.getTime())) {
-                            aVal = aDate.getTime();
-                            bVal = bDate.getTime();
-                        } else {
-                            aVal = aVal.toString();
-                            bVal = bVal.toString();
-                        }
+                    contentCell.hide();
+                }
+            });
+            this.toolbar = ordered;
+        }
+
+        _canEditCardsLayout(cardsLayout) {
+            return Boolean(cardsLayout && typeof cardsLayout.addCell === "function" && typeof cardsLayout.removeCell === "function");
+        }
+
+        // ------------------------------------------------------------------
+        // Incremental data updates
+        // ------------------------------------------------------------------
+
+        // Inserts rows whose `key` is new and patches the changed fields of
+        // the others; untouched cards are left alone. Rows are matched on
+        // row[key]; `id` stays the card id that events report.
+        upsertRows(rows, key = "id") {
+            const result = this._upsertRows(rows, key);
+            if ((result.added || result.sortChanged) && this.sortColumnId) {
+                this._sortRows();
+            }
+            return { added: result.added, updated: result.updated, removed: 0 };
+        }
+
+        removeRows(ids, key = "id") {
+            const data = this.config.data || [];
+            const removeKeys = new Set(ids || []);
+            const removed = data.filter(row => removeKeys.has(row[key]));
+            if (!removed.length) {
+                return { added: 0, updated: 0, removed: 0 };
+            }
+            this.config.data = data.filter(row => !removeKeys.has(row[key]));
+            removed.forEach(row => delete this.rowMapping[row.id]);
+            if (this.cardList) {
+                removed.forEach(row => this.cardList.dropRow(row.id));
+                this.cardList.setRows(this.config.data);
+            } else {
+                this._removeCardCells(removed.map(row => row.id));
+            }
+            return { added: 0, updated: 0, removed: removed.length };
+        }
+
+        // Makes `rows` the complete data set (in that order) while keeping the
+        // cards of rows that are still present.
+        replaceData(rows, key = "id") {
+            const incoming = rows || [];
+            const keys = new Set(incoming.map(row => row[key]));
+            const stale = (this.config.data || []).filter(row => !keys.has(row[key])).map(row => row[key]);
+            const removed = this.removeRows(stale, key);
+            const result = this._upsertRows(incoming, key);
+            const byKey = new Map(this.config.data.map(row => [row[key], row]));
+            const data = this.config.data;
+            // Refilled in place: spreading a large board into splice() arguments
+            // overflows the call stack.
+            data.length = 0;
+            incoming.forEach(row => {
+                data.push(byKey.get(row[key]));
+            });
+            if (this.sortColumnId) {
+                this._sortRows();
+            } else {
+                this._reorderCards();
+            }
+            return { added: result.added, updated: result.updated, removed: removed.removed };
+        }
+
+        // Rows without an `id` use their key as the card id.
+        _withRowId(row, key) {
+            if (key !== "id" && (row.id === undefined || row.id === null)) {
+                row.id = row[key];
+            }
+            return row;
+        }
+
+        _upsertRows(rows, key) {
+            this.config.data = this.config.data || [];
+            const byKey = new Map(this.config.data.map(row => [row[key], row]));
+            const added = [];
+            let updated = 0;
+            let sortChanged = false;
+            (rows || []).forEach(incoming => {
+                const row = this._withRowId(Object.assign({}, incoming), key);
+                const existing = byKey.get(row[key]);
+                if (!existing) {
+                    this.config.data.push(row);
+                    byKey.set(row[key], row);
+                    added.push(row);
+                } else {
+                    const fields = this._patchRow(existing, row);
+                    if (fields.length) {
+                        updated += 1;
+                        sortChanged = sortChanged || fields.includes(this.sortColumnId);
                     }
                 }
+            });
+            if (added.length) {
+                // New rows can change a column's detected sort kind.
+                this._sortKeys = null;
+                if (this.cardList) {
+                    this.cardList.setRows(this.config.data);
+                } else {
+                    this._appendCards(added);
+                }
+            }
+            return { added: added.length, updated, sortChanged };
+        }
 
-                if (aVal < bVal) return this.sortOrder === "asc" ? -1 : 1;
-                if (aVal > bVal) return this.sortOrder === "asc" ? 1 : -1;
-                return 0;
+        // Applies the fields of `row` that differ from `existing` and returns
+        // their names. Column values go through setRowDataValue so only their
+        // cells change.
+        _patchRow(existing, row) {
+            const changes = {};
+            Object.keys(row).forEach(field => {
+                if (field === "id" || sameValue(existing[field], row[field])) {
+                    return;
+                }
+                changes[field] = row[field];
             });
-            this.reDrawCards();
-            this.toolbarEventSetup();
+            const fields = Object.keys(changes);
+            if (!fields.length) {
+                return fields;
+            }
+            if (this.cardList) {
+                this._updateVirtualRow(existing.id, changes);
+                if (fields.includes("_expanded_height")) {
+                    this.cardList.setExpandedHeight(existing.id);
+                }
+                return fields;
+            }
+            const columnIds = new Set((this.config.columns || []).map(col => col.id));
+            fields.forEach(field => {
+                const value = changes[field];
+                if (columnIds.has(field)) {
+                    this.setRowDataValue(existing.id, field, value);
+                } else if (field === "_color") {
+                    this.setRowColor(existing.id, value);
+                } else if (field === "_fontSize") {
+                    this.setRowFontSize(existing.id, value);
+                } else if (field === "_showOptions") {
+                    this.setRowOptionsVisibility(existing.id, value);
+                } else if (field === "_expanded_height") {
+                    this.setCardExpandedHeight(existing.id, value);
+                } else {
+                    existing[field] = value;
+                }
+            });
+            return fields;
+        }
+
+        _cardsLayout() {
+            return this.layout.getCell("CList");
+        }
+
+        // Adds a header/content cell pair per row at the end of the cards
+        // layout and builds only the new toolbars.
+        _appendCards(rows) {
+            const cardsLayout = this._cardsLayout();
+            if (!this._canEditCardsLayout(cardsLayout)) {
+                this._rebuildLayout();
+                return;
+            }
+            rows.forEach(rowData => {
+                this._cellSeq = (this._cellSeq || 0) + 1;
+                const ndx = this._cellSeq;
+                cardsLayout.addCell({ id: `C${ndx}A`, height: "auto", padding: 5, width: "100%" });
+                cardsLayout.addCell({ id: `C${ndx}B`, height: "auto", html: "", padding: 5, width: "100%" });
+                const toolbar = this.createCardToolbar("C", ndx, rowData, this.toolbar.length);
+                this._setupToolbarEvents(toolbar);
+            });
+        }
+
+        _removeCardCells(ids) {
+            const cardsLayout = this._cardsLayout();
+            if (!this._canEditCardsLayout(cardsLayout)) {
+                this._rebuildLayout();
+                return;
+            }
+            const removeIds = new Set(ids);
+            this.toolbar = this.toolbar.filter(toolbar => {
+                if (!removeIds.has(toolbar.id)) {
+                    return true;
+                }
+                cardsLayout.removeCell(toolbar.headerCell);
+                cardsLayout.removeCell(toolbar.contentCell);
+                if (toolbar.destructor) {
+                    toolbar.destructor();
+                }
+                return false;
+            });
+        }
+
+        // Full rebuild for layouts without addCell/removeCell: replaces the
+        // whole layout and recreates every card from config.data.
+        _rebuildLayout() {
+            this.toolbar.forEach(toolbar => {
+                if (toolbar.destructor) {
+                    toolbar.destructor();
+                }
+            });
+            this.toolbar = [];
+            if (this.sortToolbar && this.sortToolbar.destructor) {
+                this.sortToolbar.destructor();
+            }
+            this.sortToolbar = null;
+            if (this.layout && this.layout.destructor) {
+                this.layout.destructor();
+            }
+            this._buildLayout();
         }
 
         reDrawCards() {
-            const rows = this.config.data ? this.config.data.length : 0;
+            const dataSet = this.config.data || [];
+            // Card cell numbers in layout order; they stop being 1..n once
+            // rows have been inserted or removed.
+            const slots = this.toolbar.map(toolbar => Number(toolbar.headerCell.slice(1, -1)));
             this.toolbar.forEach(toolbar => {
                 if (toolbar.destructor) {
                     toolbar.destructor();
                 }
             });
             this.toolbar = [];
-            for (let i = 0; i < rows; i++) {
-                const cellA = this.layout.getCell(`C${i + 1}A`);
-                const cellB = this.layout.getCell(`C${i + 1}B`);
+            slots.forEach(ndx => {
+                const cellA = this.layout.getCell(`C${ndx}A`);
+                const cellB = this.layout.getCell(`C${ndx}B`);
                 if (cellA && cellA.clear) cellA.clear();
                 if (cellB && cellB.clear) cellB.clear();
-            }
-            this.makeHeaderSection("C", rows);
+            });
+            dataSet.forEach((rowData, index) => {
+                this.createCardToolbar("C", slots[index] !== undefined ? slots[index] : index + 1, rowData, index);
+            });
         }
 
         onExpand(id, event) {
@@ -541,97 +1365,104 @@
 
         makeHeaderSection(cell_start, rows) {
             const dataSet = this.config.data || [];
-            const columns = this.config.columns || [];
-
             for (let index = 0; index < rows; index++) {
-                const ndx = index + 1;
-                const currentToolbar = new dhx.Toolbar(null, {
-                    id: `toolbar$${cell_start}$${ndx}`,
-                    css: "dhx_widget--bordered height55",
-                    width: "100%"
-                });
-                const currentContent = cell_start + ndx.toString() + "B";
+                this.createCardToolbar(cell_start, index + 1, dataSet[index], index);
+            }
+            this._cellSeq = Math.max(this._cellSeq || 0, rows);
+        }
 
-                const rowData = dataSet[index];
-                if (rowData) {
-                    if (rowData.id) {
-                        currentToolbar.id = rowData.id;
-                    } else {
-                        currentToolbar.id = (index + 1).toString();
-                    }
-                }
+        // Builds the toolbar for one card and attaches it to the card's
+        // `${cell_start}${ndx}A` cell; `${cell_start}${ndx}B` is its content cell.
+        createCardToolbar(cell_start, ndx, rowData, index) {
+            const columns = this.config.columns || [];
+            const currentToolbar = new dhx.Toolbar(null, {
+                id: `toolbar$${cell_start}$${ndx}`,
+                css: "dhx_widget--bordered height55",
+                width: "100%"
+            });
+            const currentContent = cell_start + ndx.toString() + "B";
 
-                currentToolbar.data.parse(this.getToolbarData(columns, rowData));
-                this.layout.getCell(`${cell_start}${ndx}A`).attach(currentToolbar);
-                this.layout.getCell(currentContent).hide();
-                currentToolbar.hide("down");
-                this.toolbar.push(currentToolbar);
-                currentToolbar.stat = "up";
-                currentToolbar.contentCell = currentContent;
-                this.rowMapping[currentToolbar.id] = currentContent;
-                this._applyToolbarFontFamily(currentToolbar);
-
-                if (rowData && rowData._color) {
-                    const toolbarSelector = `[data-dhx-widget-id="${currentToolbar._uid}"]`;
-                    this.waitForElement(toolbarSelector, 4000)
-                        .then(toolbarElem => {
-                            toolbarElem.style.backgroundColor = rowData._color;
-                        })
-                        .catch(error => {
-                            console.error(`Toolbar element for ${currentToolbar._uid} not found:`, error);
-                        });
+            if (rowData) {
+                if (rowData.id) {
+                    currentToolbar.id = rowData.id;
+                } else {
+                    currentToolbar.id = (index + 1).toString();
                 }
+            }
 
-                if (rowData && rowData._fontSize) {
-                    const toolbarSelector = `[data-dhx-widget-id="${currentToolbar._uid}"]`;
-                    this.waitForElement(toolbarSelector, 4000)
-                        .then(toolbarElem => {
-                            const dataCells = toolbarElem.querySelectorAll(".toolbar-cell:not(.hideable)");
-                            dataCells.forEach(cell => {
-                                cell.style.fontSize = rowData._fontSize;
-                            });
-                        })
-                        .catch(error => {
-                            console.error(`Toolbar element for ${currentToolbar._uid} not found:`, error);
-                        });
-                }
+            currentToolbar.data.parse(this.getToolbarData(columns, rowData));
+            this.layout.getCell(`${cell_start}${ndx}A`).attach(currentToolbar);
+            this.layout.getCell(currentContent).hide();
+            currentToolbar.hide("down");
+            this.toolbar.push(currentToolbar);
+            currentToolbar.stat = "up";
+            currentToolbar.contentCell = currentContent;
+            currentToolbar.headerCell = `${cell_start}${ndx}A`;
+            currentToolbar.rowData = rowData;
+            this.rowMapping[currentToolbar.id] = currentContent;
+            this._applyToolbarFontFamily(currentToolbar);
+
+            if (rowData && rowData._color) {
+                const toolbarSelector = `[data-dhx-widget-id="${currentToolbar._uid}"]`;
+                this.waitForElement(toolbarSelector, 4000)
+                    .then(toolbarElem => {
+                        toolbarElem.style.backgroundColor = rowData._color;
+                    })
+                    .catch(error => {
+                        console.error(`Toolbar element for ${currentToolbar._uid} not found:`, error);
+                    });
+            }
 
-                if (rowData && rowData._showOptions !== undefined) {
-                    currentToolbar.data.update("options", { hidden: !rowData._showOptions });
-                }
+            if (rowData && rowData._fontSize) {
+                const toolbarSelector = `[data-dhx-widget-id="${currentToolbar._uid}"]`;
+                this.waitForElement(toolbarSelector, 4000)
+                    .then(toolbarElem => {
+                        const dataCells = toolbarElem.querySelectorAll(".toolbar-cell:not(.hideable)");
+                        dataCells.forEach(cell => {
+                            cell.style.fontSize = rowData._fontSize;
+                        });
+                    })
+                    .catch(error => {
+                        console.error(`Toolbar element for ${currentToolbar._uid} not found:`, error);
+                    });
+            }
 
-                currentToolbar.events.on("click", function (id, e) {
-                    const optionsItem = currentToolbar.data.getItem("options");
-                    if (
-                        optionsItem &&
-                        optionsItem.items &&
-                        optionsItem.items.find(item => item.id === id)
-                    ) {
-                        this.onOptions(currentToolbar.id, e, id);
-                    } else {
-                        if (currentToolbar.stat !== "down" && currentToolbar.stat !== "up") {
-                            currentToolbar.stat = "up";
-                        }
+            if (rowData && rowData._showOptions !== undefined) {
+                currentToolbar.data.update("options", { hidden: !rowData._showOptions });
+            }
 
-                        if (id.endsWith("up")) {
-                        currentToolbar.hide(id);
-                        currentToolbar.show("down");
-                        currentToolbar.stat = "down";
-                        this.layout.getCell(currentContent).show();
-                        // Apply the specific height for this card from _expanded_height or default
-                        const expandedHeight = this.getCardExpandedHeight(currentToolbar.id);
-                        this.updateCellHeight(currentContent, expandedHeight);
-                        this.onExpand(currentToolbar.id, e);
-                        } else if (id.endsWith("down")) {
-                        currentToolbar.show("up");
-                        currentToolbar.hide("down");
+            currentToolbar.events.on("click", function (id, e) {
+                const optionsItem = currentToolbar.data.getItem("options");
+                if (
+                    optionsItem &&
+                    optionsItem.items &&
+                    optionsItem.items.find(item => item.id === id)
+                ) {
+                    this.onOptions(currentToolbar.id, e, id);
+                } else {
+                    if (currentToolbar.stat !== "down" && currentToolbar.stat !== "up") {
                         currentToolbar.stat = "up";
-                        this.layout.getCell(currentContent).hide();
-                        this.onCollapse(currentToolbar.id, e);
                     }
-                    }
-                }.bind(this));
-            }
+
+                    if (id.endsWith("up")) {
+                    currentToolbar.hide(id);
+                    currentToolbar.show("down");
+                    currentToolbar.stat = "down";
+                    this.layout.getCell(currentContent).show();
+                    // Apply the specific height for this card from _expanded_height or default
+                    const expandedHeight = this.getCardExpandedHeight(currentToolbar.id);
+                    this.updateCellHeight(currentContent, expandedHeight);
+                    this.onExpand(currentToolbar.id, e);
+                    } else if (id.endsWith("down")) {
+                    currentToolbar.show("up");
+                    currentToolbar.hide("down");
+                    currentToolbar.stat = "up";
+                    this.layout.getCell(currentContent).hide();
+                    this.onCollapse(currentToolbar.id, e);
+                }
+                }
+            }.bind(this));
+            return currentToolbar;
         }
 
         deepQuerySelector(selector, root = document) {
@@ -697,6 +1528,35 @@
         }
 
         getToolbarData(columns, rowData) {
+            const toolbarItems = [
+                { type: "nav", size: "small", id: "up", icon: "mdi mdi-chevron-right" },
+                { type: "nav", size: "small", id: "down", icon: "mdi mdi-chevron-down", visible: false },
+                { type: "customHTML", html: this.getCardCellsHtml(columns, rowData, true) },
+                { type: "spacer" }
+            ];
+
+            if (this.showOptions && (rowData._showOptions === undefined || rowData._showOptions)) {
+                toolbarItems.push({
+                    type: "customHTML",
+                    id: "options",
+                    html: '<i style="margin-right: 10px; font-size: 20px;" class="mdi mdi-dots-vertical-circle"></i>',
+                    size: "medium",
+                    icon: "mdi mdi-dots-vertical-circle",
+                    items: this.getOptionMenuItems()
+                });
+            }
+
+            return toolbarItems;
+        }
+
+        getOptionMenuItems() {
+            return this.optionItems.map(item => ({ id: item.id || item.value, ...item }));
+        }
+
+        // Builds the header/data cell markup shared by toolbar cards and
+        // virtual rows. Virtual rows get the responsive rules from the
+        // injected stylesheet instead of a <style> block per card.
+        getCardCellsHtml(columns, rowData, inlineStyles) {
             let headerCells = "";
             let dataCells = "";
             let leftColumns = "";
@@ -734,7 +1594,7 @@
                 if (col.dataType === "time" && col.applyFormat && col.dataFormat) {
                     value = formatTimeValue(value, col.dataFormat);
                 }
-                dataCells += `<div class="toolbar-cell${hideableClass}" style="white-space: nowrap; overflow: hidden; text-overflow: ellipsis; width: ${colWidth}; font-size: ${rowData._fontSize || this.fontSize}; font-family: ${this.toolbarFontFamily};">
+                dataCells += `<div class="toolbar-cell cardflow-value${hideableClass}" data-column-id="${col.id}" style="white-space: nowrap; overflow: hidden; text-overflow: ellipsis; width: ${colWidth}; font-size: ${rowData._fontSize || this.fontSize}; font-family: ${this.toolbarFontFamily};">
                                 ${value}
                               </div>`;
                 cellIndex++;
@@ -742,6 +1602,9 @@
 
             let htmlContent = `
               <div style="width: 100%; background-color: inherit; padding: 10px 20px; font-family: ${this.toolbarFontFamily}; box-sizing: border-box;">
+            `;
+            if (inlineStyles) {
+                htmlContent += `
                 <style>
                   @media (max-width: 600px) {
                     .hideable {
@@ -752,7 +1615,8 @@
                     min-width: 0;
                   }
                 </style>
-            `;
+                `;
+            }
 
             if (stretchIndex !== -1) {
                 // Use flexbox layout for stretch
@@ -802,26 +1666,7 @@
             }
 
             htmlContent += `</div>`;
-
-            const toolbarItems = [
-                { type: "nav", size: "small", id: "up", icon: "mdi mdi-chevron-right" },
-                { type: "nav", size: "small", id: "down", icon: "mdi mdi-chevron-down", visible: false },
-                { type: "customHTML", html: htmlContent },
-                { type: "spacer" }
-            ];
-
-            if (this.showOptions && (rowData._showOptions === undefined || rowData._showOptions)) {
-                toolbarItems.push({
-                    type: "customHTML",
-                    id: "options",
-                    html: '<i style="margin-right: 10px; font-size: 20px;" class="mdi mdi-dots-vertical-circle"></i>',
-                    size: "medium",
-                    icon: "mdi mdi-dots-vertical-circle",
-                    items: this.optionItems.map(item => ({ id: item.id || item.value, ...item }))
-                });
-            }
-
-            return toolbarItems;
+            return htmlContent;
         }
 
         getLayoutCount(name, rows) {
@@ -835,11 +1680,15 @@
             }
             return {
                 type: "none",
-                rows: [{ type: "none", padding: 10, rows: list, css: "layout-scroll", width: "100%" }]
+                rows: [{ id: `${name}List`, type: "none", padding: 10, rows: list, css: "layout-scroll", width: "100%" }]
             };
         }
 
         collapseAll() {
+            if (this.cardList) {
+                Array.from(this.cardList.expanded).forEach(id => this.cardList.collapse(id, {}));
+                return;
+            }
             this.toolbar.forEach(toolbar => {
                 if (toolbar.stat === "down") {
                     const currentContent = toolbar.contentCell;
@@ -860,6 +1709,10 @@
         }
     
         expandAll() {
+            if (this.cardList) {
+                this.cardList.rows.forEach(row => this.cardList.expand(row.id, {}));
+                return;
+            }
             this.toolbar.forEach(toolbar => {
                 if (toolbar.stat === "up" || toolbar.stat === undefined || toolbar.stat === null) {
                     const currentContent = toolbar.contentCell;
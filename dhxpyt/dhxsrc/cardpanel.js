@@ -2,6 +2,28 @@ function createUniqueId(prefix) {
     return `${prefix}_${Math.random().toString(16).slice(2)}`;
 }
 
+// Search index granularity: queries at least this long are answered from
+// n-gram postings, shorter ones by scanning the pre-normalized text.
+const CARDPANEL_NGRAM = 3;
+
+function sameCardData(a, b) {
+    try {
+        return JSON.stringify(a) === JSON.stringify(b);
+    } catch (err) {
+        return false;
+    }
+}
+
+function normalizeSearchText(value) {
+    if (value === undefined || value === null) {
+        return "";
+    }
+    if (Array.isArray(value)) {
+        return value.map(normalizeSearchText).join(" ");
+    }
+    return String(value).toLowerCase();
+}
+
 (function () {
     globalThis.customdhx = globalThis.customdhx || {};
 
@@ -14,6 +36,15 @@ function createUniqueId(prefix) {
             this._eventsBound = false;
             this._mountId = null;
             this._domReadyPromise = null;
+            this._cardsById = new Map();
+            this._cardElements = new Map();
+            this._searchTexts = new Map();
+            this._searchGrams = new Map();
+            this._searchProvider = null;
+            this._searchTimer = null;
+            this._searchGeneration = 0;
+            this._activeMatches = null;
+            this._activeQuery = "";
 
             this._ids = this._generateIds();
 
@@ -200,6 +231,8 @@ function createUniqueId(prefix) {
                 addButtonText: "Add Data Source",
                 viewButtonText: "View Details",
                 autoFilter: true,
+                searchFields: ["title", "subtitle", "pill"],
+                searchDebounceMs: 120,
                 cardMinWidth: 260,
                 cardMinHeight: 160,
                 cardGap: 16,
@@ -367,7 +400,7 @@ function createUniqueId(prefix) {
                     const query = (this._input?.value || "").trim();
                     this.emit("search", query);
                     if (this.options.autoFilter) {
-                        this._filter(query);
+                        this.filter(query);
                     }
                 });
             }
@@ -378,10 +411,14 @@ function createUniqueId(prefix) {
 
                     if (event.key === "Enter") {
                         this.emit("search", query);
+                        if (this.options.autoFilter) {
+                            this.filter(query);
+                        }
+                        return;
                     }
 
                     if (this.options.autoFilter) {
-                        this._filter(query);
+                        this._scheduleFilter(query);
                     }
                 });
             }
@@ -610,18 +647,73 @@ html[data-dhx-theme="dark"] .cardpanel-layout {
             document.head.appendChild(style);
         }
 
+        // Reconciles by card id: cards whose data and position are unchanged
+        // keep their element (and card object); only new, changed or moved
+        // cards are rendered, since templates receive the card's index.
         load(cards) {
             this._enqueueAction(() => {
-                this.cards = Array.isArray(cards) ? cards.map((card) => Object.assign({}, card)) : [];
-                this._renderCards();
+                const incoming = Array.isArray(cards) ? cards : [];
+                const previous = new Map();
+                this.cards.forEach((card, index) => {
+                    if (card.id !== undefined && card.id !== null && this._cardElements.has(card)) {
+                        previous.set(card.id, { card, index });
+                    }
+                });
+
+                const next = incoming.map((card, index) => {
+                    const entry = card && previous.get(card.id);
+                    if (entry && entry.index === index && sameCardData(entry.card, card)) {
+                        previous.delete(card.id);
+                        return entry.card;
+                    }
+                    return Object.assign({}, card);
+                });
+                const kept = new Set(next);
+                this.cards.forEach((card) => {
+                    if (!kept.has(card)) {
+                        const element = this._cardElements.get(card);
+                        if (element) {
+                            element.remove();
+                        }
+                        this._cardElements.delete(card);
+                        this._unindexCard(card);
+                    }
+                });
+
+                this.cards = next;
+                this._reconcileCards();
             });
         }
 
         add(card) {
+            this.addCards([card]);
+        }
+
+        // Appends cards without touching the ones already rendered.
+        addCards(cards) {
             this._enqueueAction(() => {
-                const copy = Object.assign({}, card);
-                this.cards.push(copy);
-                this._renderCards();
+                const copies = (Array.isArray(cards) ? cards : Array.from(cards || [])).map((card) => Object.assign({}, card));
+                if (!copies.length) {
+                    return;
+                }
+                const start = this.cards.length;
+                copies.forEach((copy) => {
+                    this.cards.push(copy);
+                    this._indexCard(copy);
+                });
+                if (!this._grid) {
+                    return;
+                }
+                const renderer = this._resolveTemplateRenderer();
+                const fragment = document.createDocumentFragment();
+                copies.forEach((copy, offset) => {
+                    const element = this._renderCard(renderer, copy, start + offset);
+                    if (element) {
+                        fragment.appendChild(element);
+                    }
+                });
+                this._grid.appendChild(fragment);
+                this._reapplyFilter(copies);
             });
         }
 
@@ -838,67 +930,237 @@ html[data-dhx-theme="dark"] .cardpanel-layout {
             };
         }
 
-        _renderCards() {
+        // Puts the grid children in `this.cards` order, rendering only cards
+        // without an element and moving the others.
+        _reconcileCards() {
             if (!this._grid) {
                 return;
             }
 
-            this._grid.innerHTML = "";
-
-            const renderer = this._resolveTemplateRenderer();
-
+            let renderer = null;
+            const fresh = [];
+            let cursor = this._grid.firstElementChild;
             this.cards.forEach((card, index) => {
-                let rendered;
-                try {
-                    rendered = renderer(card, this._createTemplateContext(index, card));
-                } catch (err) {
-                    console.error("CardPanel template render failed:", err);
-                    return;
+                let element = this._cardElements.get(card);
+                if (!element) {
+                    renderer = renderer || this._resolveTemplateRenderer();
+                    this._indexCard(card);
+                    element = this._renderCard(renderer, card, index);
+                    if (!element) {
+                        return;
+                    }
+                    fresh.push(card);
                 }
-
-                if (typeof rendered === "string") {
-                    const temp = document.createElement("div");
-                    temp.innerHTML = rendered.trim();
-                    rendered = temp.firstElementChild;
+                if (element === cursor) {
+                    cursor = cursor.nextElementSibling;
+                } else {
+                    this._grid.insertBefore(element, cursor);
                 }
+            });
 
-                if (!(rendered instanceof HTMLElement)) {
-                    console.warn("CardPanel template must return a DOM element or HTML string.");
-                    return;
-                }
+            this._reapplyFilter(fresh);
+        }
 
-                if (!rendered.dataset.cardId && card.id) {
-                    rendered.dataset.cardId = card.id;
-                }
+        _renderCard(renderer, card, index) {
+            let rendered;
+            try {
+                rendered = renderer(card, this._createTemplateContext(index, card));
+            } catch (err) {
+                console.error("CardPanel template render failed:", err);
+                return null;
+            }
 
-                this._grid.appendChild(rendered);
-            });
+            if (typeof rendered === "string") {
+                const temp = document.createElement("div");
+                temp.innerHTML = rendered.trim();
+                rendered = temp.firstElementChild;
+            }
+
+            if (!(rendered instanceof HTMLElement)) {
+                console.warn("CardPanel template must return a DOM element or HTML string.");
+                return null;
+            }
+
+            if (!rendered.dataset.cardId && card.id) {
+                rendered.dataset.cardId = card.id;
+            }
+
+            this._cardElements.set(card, rendered);
+            return rendered;
         }
 
-        _filter(query) {
-            if (!this._grid) {
-                return;
+        // Re-applies the active filter after cards were rendered. `cards`
+        // limits the work to newly rendered cards; null means all of them.
+        _reapplyFilter(cards) {
+            if (this._activeQuery) {
+                this._applyMatches(this._search(normalizeSearchText(this._activeQuery)), cards);
+            } else if (this._activeMatches) {
+                this._applyMatches(this._activeMatches, cards);
             }
+        }
 
-            const term = (query || "").toLowerCase();
-            const children = Array.from(this._grid.children);
+        // ------------------------------------------------------------------
+        // Search
+        // ------------------------------------------------------------------
+
+        // Filters the cards immediately. With a search provider set (see
+        // setSearchProvider) the query is answered by the provider instead of
+        // the local index.
+        filter(query) {
+            if (this._searchTimer !== null) {
+                clearTimeout(this._searchTimer);
+                this._searchTimer = null;
+            }
+            this._enqueueAction(() => this._runFilter(query));
+        }
+
+        // Kept for callers of the old private name.
+        _filter(query) {
+            this.filter(query);
+        }
 
-            children.forEach((child) => {
-                const id = child.dataset.cardId || "";
-                const card = this.cards.find((c) => (c.id || "") === id);
+        setSearchProvider(provider) {
+            this._searchProvider = typeof provider === "function" ? provider : null;
+        }
 
-                if (!card) {
+        // Shows only the cards with the given ids; null/undefined shows all.
+        showMatches(ids) {
+            this._enqueueAction(() => {
+                this._activeQuery = "";
+                if (ids === null || ids === undefined) {
+                    this._applyMatches(null);
                     return;
                 }
+                const matches = new Set();
+                Array.from(ids).forEach((id) => {
+                    const card = this._cardsById.get(id) || this._cardsById.get(String(id));
+                    if (card) {
+                        matches.add(card);
+                    }
+                });
+                this._applyMatches(matches);
+            });
+        }
 
-                const haystack = [
-                    card.title || "",
-                    card.subtitle || "",
-                    card.pill || ""
-                ].join(" ").toLowerCase();
+        _scheduleFilter(query) {
+            if (this._searchTimer !== null) {
+                clearTimeout(this._searchTimer);
+            }
+            this._searchTimer = setTimeout(() => {
+                this._searchTimer = null;
+                this._runFilter(query);
+            }, Math.max(0, Number(this.options.searchDebounceMs) || 0));
+        }
 
-                child.style.display = !term || haystack.indexOf(term) !== -1 ? "" : "none";
+        _runFilter(query) {
+            if (this._searchProvider) {
+                const generation = ++this._searchGeneration;
+                Promise.resolve(this._searchProvider(query || ""))
+                    .then((ids) => {
+                        if (generation === this._searchGeneration && ids !== undefined) {
+                            this.showMatches(ids);
+                        }
+                    })
+                    .catch((err) => console.error("CardPanel search provider failed:", err));
+                return;
+            }
+            this._activeQuery = query || "";
+            this._applyMatches(this._search(normalizeSearchText(query)));
+        }
+
+        // Returns the Set of matching cards, or null when every card matches.
+        _search(term) {
+            if (!term) {
+                return null;
+            }
+            const matches = new Set();
+            if (term.length < CARDPANEL_NGRAM) {
+                this._searchTexts.forEach((text, card) => {
+                    if (text.indexOf(term) !== -1) {
+                        matches.add(card);
+                    }
+                });
+                return matches;
+            }
+            let smallest = null;
+            for (let i = 0; i + CARDPANEL_NGRAM <= term.length; i += 1) {
+                const posting = this._searchGrams.get(term.slice(i, i + CARDPANEL_NGRAM));
+                if (!posting) {
+                    return matches;
+                }
+                if (!smallest || posting.size < smallest.size) {
+                    smallest = posting;
+                }
+            }
+            smallest.forEach((card) => {
+                if (this._searchTexts.get(card).indexOf(term) !== -1) {
+                    matches.add(card);
+                }
             });
+            return matches;
+        }
+
+        _applyMatches(matches, cards) {
+            this._activeMatches = matches;
+            const apply = (element, card) => {
+                const hidden = Boolean(matches) && !matches.has(card);
+                if (element.__cardpanelHidden !== hidden) {
+                    element.style.display = hidden ? "none" : "";
+                    element.__cardpanelHidden = hidden;
+                }
+            };
+            if (cards) {
+                cards.forEach((card) => {
+                    const element = this._cardElements.get(card);
+                    if (element) {
+                        apply(element, card);
+                    }
+                });
+                return;
+            }
+            this._cardElements.forEach(apply);
+        }
+
+        _unindexCard(card) {
+            if (card.id !== undefined && card.id !== null && this._cardsById.get(card.id) === card) {
+                this._cardsById.delete(card.id);
+            }
+            const text = this._searchTexts.get(card);
+            if (text === undefined) {
+                return;
+            }
+            this._searchTexts.delete(card);
+            for (let i = 0; i + CARDPANEL_NGRAM <= text.length; i += 1) {
+                const gram = text.slice(i, i + CARDPANEL_NGRAM);
+                const posting = this._searchGrams.get(gram);
+                if (posting) {
+                    posting.delete(card);
+                    if (!posting.size) {
+                        this._searchGrams.delete(gram);
+                    }
+                }
+            }
+        }
+
+        _indexCard(card) {
+            if (this._searchTexts.has(card)) {
+                return;
+            }
+            if (card.id !== undefined && card.id !== null) {
+                this._cardsById.set(card.id, card);
+            }
+            const fields = Array.isArray(this.options.searchFields) ? this.options.searchFields : [];
+            const text = fields.map((field) => normalizeSearchText(card[field])).join(" ");
+            this._searchTexts.set(card, text);
+            for (let i = 0; i + CARDPANEL_NGRAM <= text.length; i += 1) {
+                const gram = text.slice(i, i + CARDPANEL_NGRAM);
+                let posting = this._searchGrams.get(gram);
+                if (!posting) {
+                    posting = new Set();
+                    this._searchGrams.set(gram, posting);
+                }
+                posting.add(card);
+            }
         }
 
         destroy() {
@@ -910,8 +1172,17 @@ html[data-dhx-theme="dark"] .cardpanel-layout {
                 this.layout.destructor();
             }
 
+            if (this._searchTimer !== null) {
+                clearTimeout(this._searchTimer);
+                this._searchTimer = null;
+            }
             this._events = {};
             this.cards = [];
+            this._cardsById.clear();
+            this._cardElements.clear();
+            this._searchTexts.clear();
+            this._searchGrams.clear();
+            this._searchProvider = null;
             this._grid = null;
 
             if (this._mountId) {
@@ -226,6 +226,56 @@
         return basicMarkdown(text);
     }
 
+    // Streaming messages are rendered block by block: text up to the last
+    // completed block (a paragraph followed by a blank line, or a closed
+    // fence) is rendered once and frozen, and only the open tail is
+    // re-rendered per chunk. The scanner keeps its position between calls so
+    // each chunk only walks the newly arrived lines.
+    const FENCE_PATTERN = /^ {0,3}(`{3,}|~{3,})/;
+    const CONTINUATION_PATTERN = /^(?:[ \t]|[-*+][ \t]|\d+[.)][ \t])/;
+
+    function createStreamBlockState() {
+        return { frozen: 0, scanned: 0, fence: null, pendingBreak: -1 };
+    }
+
+    function advanceStreamBlocks(state, text) {
+        const end = text.lastIndexOf("\n") + 1;
+        let boundary = state.frozen;
+        let cursor = state.scanned;
+        while (cursor < end) {
+            const lineEnd = text.indexOf("\n", cursor) + 1;
+            const line = text.slice(cursor, lineEnd - 1);
+            const fenceMatch = FENCE_PATTERN.exec(line);
+            if (state.fence) {
+                const marker = fenceMatch && fenceMatch[1];
+                if (marker && marker[0] === state.fence[0] && marker.length >= state.fence.length && !line.slice(fenceMatch[0].length).trim()) {
+                    state.fence = null;
+                    boundary = lineEnd;
+                }
+            } else if (!line.trim()) {
+                if (state.pendingBreak < 0) {
+                    state.pendingBreak = cursor;
+                }
+            } else {
+                // A blank line only ends a block once the next line shows it
+                // is not a list item or indented continuation of it.
+                if (state.pendingBreak >= 0 && !CONTINUATION_PATTERN.test(line)) {
+                    boundary = Math.max(boundary, state.pendingBreak);
+                }
+                state.pendingBreak = -1;
+                if (fenceMatch) {
+                    if (!/^\s/.test(line)) {
+                        boundary = Math.max(boundary, cursor);
+                    }
+                    state.fence = fenceMatch[1];
+                }
+            }
+            cursor = lineEnd;
+        }
+        state.scanned = cursor;
+        return boundary;
+    }
+
     function injectStyles() {
         if (document.getElementById("ragchat-widget-styles")) {
             return;
@@ -280,6 +330,7 @@
             .rag-header-right select { padding: 8px 12px; border: 1px solid rgba(15,23,42,0.12); border-radius: 10px; background: rgba(255,255,255,0.85); font-size: 13px; min-width: 180px; }
             .rag-chat-scroll { flex: 1; overflow-y: auto; padding: 0 24px 16px; }
             .rag-chat-container { display: flex; flex-direction: column; gap: 16px; padding-bottom: 80px; }
+            .rag-virtual-spacer { flex: none; width: 100%; pointer-events: none; }
             .rag-message { position: relative; display: flex; flex-direction: column; gap: 0; max-width: 76%; min-width: 240px; align-items: flex-start; padding: 0; background: transparent; border: none; box-shadow: none; }
             .rag-message:hover .message-bubble { transform: translateY(-1px); box-shadow: 0 22px 44px rgba(15,23,42,0.12); }
             .rag-user-message { align-self: flex-end; align-items: flex-end; }
@@ -542,6 +593,360 @@
         document.head.appendChild(style);
     }
 
+    // -----------------------------------------------------------------
+    // Chat persistence
+    // -----------------------------------------------------------------
+    //
+    // Chats are stored as one record per chat plus a small index (chat order
+    // and active chat). Mutations only mark the touched chat dirty; dirty
+    // records are written after a debounce, in an idle callback, so a
+    // streamed answer costs one serialization of its own chat per flush
+    // instead of one serialization of the whole history per token.
+
+    const DEFAULT_PERSIST_DEBOUNCE_MS = 400;
+    const DEFAULT_PERSIST_QUOTA_BYTES = 4 * 1024 * 1024;
+
+    function isQuotaError(error) {
+        return Boolean(error) && (error.name === "QuotaExceededError" || error.name === "NS_ERROR_DOM_QUOTA_REACHED" || error.code === 22);
+    }
+
+    function readLegacyChats(prefix) {
+        try {
+            const parsed = JSON.parse(localStorage.getItem(`${prefix}:chats`) || "null");
+            if (Array.isArray(parsed)) {
+                return { chats: parsed, activeChatId: localStorage.getItem(`${prefix}:active`), legacy: true };
+            }
+        } catch (error) {
+            console.warn("[ChatWidget] Failed to read legacy chat state", error);
+        }
+        return null;
+    }
+
+    class LocalStorageChatBackend {
+        constructor(prefix) {
+            this.prefix = prefix;
+            this.indexKey = `${prefix}:chat-index`;
+        }
+
+        _chatKey(chatId) {
+            return `${this.prefix}:chat:${chatId}`;
+        }
+
+        load() {
+            const rawIndex = localStorage.getItem(this.indexKey);
+            if (!rawIndex) {
+                return Promise.resolve(readLegacyChats(this.prefix));
+            }
+            const index = JSON.parse(rawIndex);
+            const chats = [];
+            const sizes = new Map();
+            (index.ids || []).forEach((chatId) => {
+                const raw = localStorage.getItem(this._chatKey(chatId));
+                if (raw) {
+                    chats.push(JSON.parse(raw));
+                    sizes.set(chatId, raw.length * 2);
+                }
+            });
+            return Promise.resolve({ chats, sizes, activeChatId: index.activeChatId || null });
+        }
+
+        write(batch) {
+            batch.deletes.forEach((chatId) => localStorage.removeItem(this._chatKey(chatId)));
+            batch.puts.forEach(({ id, json }) => localStorage.setItem(this._chatKey(id), json));
+            if (batch.index) {
+                localStorage.setItem(this.indexKey, JSON.stringify(batch.index));
+            }
+            if (batch.dropLegacy) {
+                localStorage.removeItem(`${this.prefix}:chats`);
+                localStorage.removeItem(`${this.prefix}:active`);
+            }
+            return Promise.resolve();
+        }
+    }
+
+    class IndexedDbChatBackend {
+        constructor(prefix) {
+            this.prefix = prefix;
+            this._db = null;
+        }
+
+        _open() {
+            if (!this._db) {
+                this._db = new Promise((resolve, reject) => {
+                    const request = indexedDB.open(this.prefix, 1);
+                    request.onupgradeneeded = () => {
+                        request.result.createObjectStore("chats", { keyPath: "id" });
+                        request.result.createObjectStore("meta");
+                    };
+                    request.onsuccess = () => resolve(request.result);
+                    request.onerror = () => reject(request.error);
+                });
+            }
+            return this._db;
+        }
+
+        load() {
+            return this._open().then((db) => new Promise((resolve, reject) => {
+                const tx = db.transaction(["chats", "meta"], "readonly");
+                const indexRequest = tx.objectStore("meta").get("index");
+                const chatsRequest = tx.objectStore("chats").getAll();
+                tx.oncomplete = () => {
+                    const index = indexRequest.result;
+                    if (!index) {
+                        resolve(readLegacyChats(this.prefix));
+                        return;
+                    }
+                    const byId = new Map(chatsRequest.result.map((record) => [record.id, record.json]));
+                    const ids = (index.ids || []).filter((chatId) => byId.has(chatId));
+                    resolve({
+                        chats: ids.map((chatId) => JSON.parse(byId.get(chatId))),
+                        sizes: new Map(ids.map((chatId) => [chatId, byId.get(chatId).length * 2])),
+                        activeChatId: index.activeChatId || null,
+                    });
+                };
+                tx.onerror = () => reject(tx.error);
+            }));
+        }
+
+        write(batch) {
+            return this._open().then((db) => new Promise((resolve, reject) => {
+                const tx = db.transaction(["chats", "meta"], "readwrite");
+                const chats = tx.objectStore("chats");
+                batch.deletes.forEach((chatId) => chats.delete(chatId));
+                batch.puts.forEach((record) => chats.put(record));
+                if (batch.index) {
+                    tx.objectStore("meta").put(batch.index, "index");
+                }
+                tx.oncomplete = () => {
+                    if (batch.dropLegacy) {
+                        localStorage.removeItem(`${this.prefix}:chats`);
+                        localStorage.removeItem(`${this.prefix}:active`);
+                    }
+                    resolve();
+                };
+                tx.onerror = () => reject(tx.error);
+                tx.onabort = () => reject(tx.error);
+            }));
+        }
+    }
+
+    function resolvePersistenceMode(options) {
+        let mode = options.persistence;
+        if (mode === false || mode === "none" || mode === "memory") {
+            return "none";
+        }
+        if (mode === undefined || mode === null || mode === true || mode === "auto") {
+            // Without a storageKey the prefix is random per instance, so the
+            // history could never be read back; skip writing it at all.
+            if (!options.storageKey) {
+                return "none";
+            }
+            mode = typeof indexedDB !== "undefined" ? "indexeddb" : "local";
+        }
+        mode = String(mode).toLowerCase();
+        if (mode === "indexeddb" && typeof indexedDB === "undefined") {
+            console.warn("[ChatWidget] IndexedDB is not available, falling back to localStorage persistence");
+            return "local";
+        }
+        return mode === "indexeddb" ? "indexeddb" : "local";
+    }
+
+    class ChatStore {
+        constructor(prefix, options = {}) {
+            this.mode = resolvePersistenceMode(options);
+            this.backend = this.mode === "indexeddb"
+                ? new IndexedDbChatBackend(prefix)
+                : this.mode === "local" ? new LocalStorageChatBackend(prefix) : null;
+            const debounceMs = Number(options.persistenceDebounceMs);
+            this.debounceMs = options.persistenceDebounceMs != null && debounceMs >= 0 ? debounceMs : DEFAULT_PERSIST_DEBOUNCE_MS;
+            this.quotaBytes = Number(options.persistenceQuotaBytes) > 0 ? Number(options.persistenceQuotaBytes) : DEFAULT_PERSIST_QUOTA_BYTES;
+            this._dirty = new Set();
+            this._allDirty = false;
+            this._sizes = new Map();
+            this._evicted = new Set();
+            this._persistedIndex = null;
+            this._dropLegacy = false;
+            this._timer = null;
+            this._idleHandle = null;
+            this._writing = null;
+            this._snapshot = null;
+        }
+
+        get enabled() {
+            return Boolean(this.backend);
+        }
+
+        load() {
+            if (!this.backend) {
+                return Promise.resolve(null);
+            }
+            return this.backend.load().then((state) => {
+                if (state) {
+                    state.chats.forEach((chat) => this._sizes.set(chat.id, (state.sizes && state.sizes.get(chat.id)) || 0));
+                    if (state.legacy) {
+                        // Rewrite the old single-key dump in the per-chat format.
+                        this._dropLegacy = true;
+                        this._allDirty = true;
+                    } else {
+                        this._persistedIndex = JSON.stringify({ ids: state.chats.map((chat) => chat.id), activeChatId: state.activeChatId || null });
+                    }
+                }
+                return state;
+            });
+        }
+
+        markDirty(chatId) {
+            if (!this.backend) return;
+            if (chatId) {
+                this._dirty.add(chatId);
+            } else {
+                this._allDirty = true;
+            }
+        }
+
+        schedule(snapshot) {
+            if (!this.backend) return;
+            this._snapshot = snapshot;
+            if (this._timer !== null || this._idleHandle !== null) return;
+            this._timer = setTimeout(() => {
+                this._timer = null;
+                if (typeof requestIdleCallback === "function") {
+                    this._idleHandle = requestIdleCallback(() => {
+                        this._idleHandle = null;
+                        this.flush();
+                    }, { timeout: 1000 });
+                } else {
+                    this.flush();
+                }
+            }, this.debounceMs);
+        }
+
+        cancel() {
+            if (this._timer !== null) {
+                clearTimeout(this._timer);
+                this._timer = null;
+            }
+            if (this._idleHandle !== null && typeof cancelIdleCallback === "function") {
+                cancelIdleCallback(this._idleHandle);
+            }
+            this._idleHandle = null;
+        }
+
+        flush() {
+            this.cancel();
+            if (!this.backend || !this._snapshot) {
+                return Promise.resolve();
+            }
+            if (this._writing) {
+                // Let the in-flight write land first; changes made meanwhile
+                // are still in the dirty set.
+                return this._writing.then(() => this.flush());
+            }
+            const batch = this._collect(this._snapshot());
+            if (!batch) {
+                return Promise.resolve();
+            }
+            this._writing = this.backend.write(batch).catch((error) => {
+                if (!isQuotaError(error) || !this._evictOldest(batch)) {
+                    console.warn("[ChatWidget] Failed to persist chats", error);
+                    return undefined;
+                }
+                console.warn("[ChatWidget] Storage quota reached, dropped the oldest chats from persisted history");
+                return this.backend.write(batch).catch((retryError) => {
+                    console.warn("[ChatWidget] Failed to persist chats", retryError);
+                });
+            }).then(() => {
+                this._writing = null;
+            });
+            return this._writing;
+        }
+
+        _collect(state) {
+            const chats = state.chats || [];
+            const liveIds = new Set(chats.map((chat) => chat.id));
+            const dirty = this._allDirty ? liveIds : this._dirty;
+            const puts = [];
+            chats.forEach((chat) => {
+                if (!dirty.has(chat.id) || this._evicted.has(chat.id)) return;
+                const json = JSON.stringify(chat);
+                this._sizes.set(chat.id, json.length * 2);
+                puts.push({ id: chat.id, json });
+            });
+            const deletes = [];
+            this._sizes.forEach((_size, chatId) => {
+                if (!liveIds.has(chatId)) {
+                    deletes.push(chatId);
+                }
+            });
+            deletes.forEach((chatId) => {
+                this._sizes.delete(chatId);
+                this._evicted.delete(chatId);
+            });
+            this._dirty.clear();
+            this._allDirty = false;
+
+            const batch = { puts, deletes, index: null, dropLegacy: this._dropLegacy };
+            this._dropLegacy = false;
+            this._applyQuota(batch, chats, state.activeChatId);
+            const index = {
+                ids: chats.filter((chat) => !this._evicted.has(chat.id)).map((chat) => chat.id),
+                activeChatId: state.activeChatId || null,
+            };
+            const serializedIndex = JSON.stringify(index);
+            if (serializedIndex !== this._persistedIndex) {
+                batch.index = index;
+                this._persistedIndex = serializedIndex;
+            }
+            if (!batch.puts.length && !batch.deletes.length && !batch.index && !batch.dropLegacy) {
+                return null;
+            }
+            return batch;
+        }
+
+        _totalBytes() {
+            let total = 0;
+            this._sizes.forEach((size, chatId) => {
+                if (!this._evicted.has(chatId)) {
+                    total += size;
+                }
+            });
+            return total;
+        }
+
+        // Quota guard: keep the persisted history under `quotaBytes` by
+        // dropping the oldest chats (never the active one) from storage. The
+        // chats stay in memory for the current session.
+        _applyQuota(batch, chats, activeChatId) {
+            for (const chat of chats) {
+                if (this._totalBytes() <= this.quotaBytes) break;
+                if (chat.id === activeChatId || this._evicted.has(chat.id)) continue;
+                this._evictChat(batch, chat.id);
+            }
+        }
+
+        _evictOldest(batch) {
+            const state = this._snapshot ? this._snapshot() : { chats: [] };
+            const victim = (state.chats || []).find((chat) => chat.id !== state.activeChatId && !this._evicted.has(chat.id));
+            if (!victim) return false;
+            this._evictChat(batch, victim.id);
+            const index = {
+                ids: (state.chats || []).filter((chat) => !this._evicted.has(chat.id)).map((chat) => chat.id),
+                activeChatId: state.activeChatId || null,
+            };
+            batch.index = index;
+            this._persistedIndex = JSON.stringify(index);
+            return true;
+        }
+
+        _evictChat(batch, chatId) {
+            this._evicted.add(chatId);
+            batch.puts = batch.puts.filter((record) => record.id !== chatId);
+            if (!batch.deletes.includes(chatId)) {
+                batch.deletes.push(chatId);
+            }
+        }
+    }
+
     class EventBus {
         constructor() {
             this._listeners = new Map();
@@ -583,6 +988,47 @@
         }
     }
 
+    // Long chats are rendered as a window: only the messages around the
+    // viewport (plus overscan) have DOM, the rest is represented by two
+    // spacers sized from measured (or estimated) message heights.
+    const DEFAULT_VIRTUALIZE_THRESHOLD = 200;
+    const VIRTUAL_OVERSCAN_PX = 800;
+    const VIRTUAL_ESTIMATED_HEIGHT = 120;
+
+    class MessageRecord {
+        constructor(app, chatId, message, element = null) {
+            this._app = app;
+            this.chatId = chatId;
+            this.message = message;
+            this._element = element;
+            this.height = 0;
+        }
+
+        // Created on demand, so messages outside the rendered window cost no
+        // DOM until they are scrolled into view or updated.
+        get element() {
+            if (!this._element) {
+                this._element = this._app._materializeMessage(this.message);
+            }
+            return this._element;
+        }
+
+        set element(value) {
+            this._element = value;
+        }
+
+        get hasElement() {
+            return Boolean(this._element);
+        }
+
+        release() {
+            if (this._element) {
+                this._element.remove();
+                this._element = null;
+            }
+        }
+    }
+
     class TenzinChatApp {
         constructor(root, options, host) {
             this.root = root;
@@ -614,6 +1060,7 @@
                 sidebarCollapsed: `${this._storagePrefix}:sidebar`,
                 isDarkMode: `${this._storagePrefix}:darkMode`,
             };
+            this._store = new ChatStore(this._storagePrefix, this.options);
 
             this.chats = [];
             this.activeChatId = null;
@@ -638,6 +1085,8 @@
             this._persistedDarkMode = this.isDarkMode;
             this._themeObserver = null;
             this._messageMap = new Map();
+            this._markdownCache = new Map();
+            this._virtual = null;
             this._artifactMap = new Map();
             this._pendingMessages = [];
             this._pendingStreams = [];
@@ -1337,12 +1786,16 @@
         }
 
         _initializeState() {
-            this._loadState();
-            this.loadModels().then(() => {
+            const loaded = this._loadState();
+            Promise.all([loaded, this.loadModels()]).then(() => {
                 this.initChats();
             }).catch(() => {
-                this.initChats();
+                loaded.then(() => this.initChats());
             });
+            this._onPageHide = () => {
+                this._store.flush();
+            };
+            window.addEventListener("pagehide", this._onPageHide);
             this._adjustTextareaHeight();
             this._observeHostTheme();
         }
@@ -1367,37 +1820,53 @@
         }
 
         _loadState() {
-            try {
-                const storedChats = localStorage.getItem(this._storageKeys.chats);
-                const storedActive = localStorage.getItem(this._storageKeys.activeChatId);
-                if (storedChats) {
-                    const parsed = JSON.parse(storedChats);
-                    if (Array.isArray(parsed)) {
-                        this.chats = parsed;
-                    }
+            return this._store.load().then((state) => {
+                if (!state) return;
+                // Chats created while the store was loading (e.g. messages
+                // pushed right after mount) are kept after the stored ones.
+                const storedIds = new Set(state.chats.map((chat) => chat.id));
+                const pending = this.chats.filter((chat) => !storedIds.has(chat.id));
+                this.chats = state.chats.concat(pending);
+                pending.forEach((chat) => this.saveState(chat.id));
+                if (!this.activeChatId && state.activeChatId) {
+                    this.activeChatId = state.activeChatId;
                 }
-                if (storedActive) {
-                    this.activeChatId = storedActive;
-                }
-            } catch (error) {
+            }).catch((error) => {
                 console.warn("[ChatWidget] Failed to load state", error);
-            }
+            });
+        }
+
+        /**
+         * Schedule a persistence flush. Pass the id of the chat that changed to
+         * rewrite only that record; without an id every chat is rewritten.
+         */
+        saveState(chatId) {
+            this._savePreferences();
+            this._store.markDirty(chatId);
+            this._store.schedule(() => this._persistSnapshot());
         }
 
-        saveState() {
+        // UI preferences always go straight to localStorage, independent of the
+        // chat store (which is skipped with persistence "none" or no storage key).
+        _savePreferences() {
+            this._persistedDarkMode = this.isDarkMode;
+            const prefs = `${this.artifactPanelWidth}|${this.sidebarCollapsed}|${this.isDarkMode}`;
+            if (prefs === this._savedPreferences) {
+                return;
+            }
             try {
-                localStorage.setItem(this._storageKeys.chats, JSON.stringify(this.chats));
-                if (this.activeChatId) {
-                localStorage.setItem(this._storageKeys.activeChatId, this.activeChatId);
+                localStorage.setItem(this._storageKeys.artifactPanelWidth, this.artifactPanelWidth);
+                localStorage.setItem(this._storageKeys.sidebarCollapsed, String(this.sidebarCollapsed));
+                localStorage.setItem(this._storageKeys.isDarkMode, String(this.isDarkMode));
+                this._savedPreferences = prefs;
+            } catch (error) {
+                console.warn("[ChatWidget] Failed to save state", error);
             }
-            localStorage.setItem(this._storageKeys.artifactPanelWidth, this.artifactPanelWidth);
-            localStorage.setItem(this._storageKeys.sidebarCollapsed, String(this.sidebarCollapsed));
-            localStorage.setItem(this._storageKeys.isDarkMode, String(this.isDarkMode));
-            this._persistedDarkMode = this.isDarkMode;
-        } catch (error) {
-            console.warn("[ChatWidget] Failed to save state", error);
         }
-    }
+
+        _persistSnapshot() {
+            return { chats: this.chats, activeChatId: this.activeChatId };
+        }
 
         destroy() {
             const handlers = EVENT_HANDLERS.get(this);
@@ -1436,6 +1905,11 @@
                 window.removeEventListener("resize", handlers.onInput);
             }
             EVENT_HANDLERS.delete(this);
+            if (this._onPageHide) {
+                window.removeEventListener("pagehide", this._onPageHide);
+                this._onPageHide = null;
+            }
+            this._store.flush();
             if (this._themeObserver) {
                 this._themeObserver.disconnect();
                 this._themeObserver = null;
@@ -2180,7 +2654,7 @@
                 });
                 contentEl.innerHTML = renderedParts.join("") || displayText;
             } else if (displayText.trim()) {
-                const html = renderMarkdown(displayText);
+                const html = message.streaming ? renderMarkdown(displayText) : this._renderMarkdownCached(message.id, displayText);
                 contentEl.innerHTML = html || displayText.replace(/\n/g, "<br>");
             } else {
                 contentEl.innerHTML = "";
@@ -2193,6 +2667,11 @@
                 contentEl.innerHTML = (contentEl.innerHTML || "") + (needsBreak ? "<br>" : "") + buildingHtml;
             }
 
+            this._updateThinkingState(message, element, Boolean((displayText || "").trim()));
+            this._renderToolEvents(message, element);
+        }
+
+        _updateThinkingState(message, element, hasRenderableContent) {
             const thinkingEl = element.querySelector(".message-thinking");
             const isBuilding = Boolean(message?.meta?.artifactBuilding);
             if (thinkingEl) {
@@ -2206,7 +2685,6 @@
                     }
                 }
             }
-            const hasRenderableContent = Boolean((displayText || "").trim());
             const showThinking = message.role !== "user" && Boolean(message.streaming) && (!hasRenderableContent || isBuilding);
             element.classList.toggle("is-thinking", showThinking);
             if (thinkingEl) {
@@ -2216,7 +2694,6 @@
             if (copyBtn) {
                 copyBtn.setAttribute("tabindex", showThinking ? "-1" : "0");
             }
-            this._renderToolEvents(message, element);
         }
 
         _renderToolEvents(message, element) {
@@ -2481,19 +2958,212 @@
         }
 
         _renderMessages() {
+            this._teardownVirtualList();
             this.els.chatContainer.innerHTML = "";
             this._messageMap.clear();
             const activeChat = this._getActiveChat();
             if (!activeChat) return;
             activeChat.messages.forEach((message) => {
-                const element = this._createMessageElement(message);
-                this._renderMessageContent(message, element);
-                this.els.chatContainer.appendChild(element);
-                this._messageMap.set(message.id, { chatId: activeChat.id, element, message });
+                this._messageMap.set(message.id, new MessageRecord(this, activeChat.id, message));
             });
+            const threshold = Number(this.options.virtualizeThreshold ?? DEFAULT_VIRTUALIZE_THRESHOLD);
+            if (threshold > 0 && activeChat.messages.length >= threshold) {
+                this._setupVirtualList(activeChat);
+            } else {
+                const fragment = document.createDocumentFragment();
+                activeChat.messages.forEach((message) => {
+                    fragment.appendChild(this._messageMap.get(message.id).element);
+                });
+                this.els.chatContainer.appendChild(fragment);
+            }
             this._scrollToBottom();
         }
 
+        _materializeMessage(message) {
+            const element = this._createMessageElement(message);
+            if (message.streaming) {
+                element.classList.add("streaming");
+            }
+            this._renderMessageContent(message, element);
+            return element;
+        }
+
+        _renderMarkdownCached(messageId, text) {
+            const cached = this._markdownCache.get(messageId);
+            if (cached && cached.text === text) {
+                return cached.html;
+            }
+            const html = renderMarkdown(text);
+            this._markdownCache.set(messageId, { text, html });
+            return html;
+        }
+
+        // Adds a new record for `message` and puts it on screen: appended
+        // directly for short chats, through the window for virtualized ones.
+        _mountNewMessage(chat, message) {
+            const record = new MessageRecord(this, chat.id, message);
+            this._messageMap.set(message.id, record);
+            if (this._virtual) {
+                this._scheduleVirtualUpdate(true);
+            } else {
+                this.els.chatContainer.appendChild(record.element);
+            }
+            return record;
+        }
+
+        _setupVirtualList(chat) {
+            const container = this.els.chatContainer;
+            const topSpacer = document.createElement("div");
+            const bottomSpacer = document.createElement("div");
+            topSpacer.className = "rag-virtual-spacer";
+            bottomSpacer.className = "rag-virtual-spacer";
+            container.appendChild(topSpacer);
+            container.appendChild(bottomSpacer);
+            const styles = window.getComputedStyle(container);
+            const virtual = {
+                chatId: chat.id,
+                topSpacer,
+                bottomSpacer,
+                gap: parseFloat(styles.rowGap || styles.gap) || 0,
+                start: 0,
+                end: 0,
+                mounted: [],
+                frame: null,
+                stickToBottom: true,
+            };
+            virtual.onScroll = () => this._scheduleVirtualUpdate(false);
+            this.els.chatScroll.addEventListener("scroll", virtual.onScroll, { passive: true });
+            this._virtual = virtual;
+            this._updateVirtualWindow(true);
+        }
+
+        _teardownVirtualList() {
+            const virtual = this._virtual;
+            if (!virtual) return;
+            if (virtual.frame !== null) {
+                window.cancelAnimationFrame(virtual.frame);
+            }
+            this.els.chatScroll.removeEventListener("scroll", virtual.onScroll);
+            this._virtual = null;
+        }
+
+        _scheduleVirtualUpdate(stickToBottom) {
+            const virtual = this._virtual;
+            if (!virtual) return;
+            if (stickToBottom) {
+                virtual.stickToBottom = true;
+            }
+            if (virtual.frame !== null) return;
+            virtual.frame = window.requestAnimationFrame(() => {
+                virtual.frame = null;
+                this._updateVirtualWindow(virtual.stickToBottom);
+            });
+        }
+
+        _updateVirtualWindow(stickToBottom = false) {
+            const virtual = this._virtual;
+            const chat = this._getActiveChat();
+            if (!virtual || !chat || chat.id !== virtual.chatId) return;
+            virtual.stickToBottom = false;
+            const scroll = this.els.chatScroll;
+            const messages = chat.messages;
+            const records = messages.map((message) => this._messageMap.get(message.id));
+
+            let measured = 0;
+            let measuredCount = 0;
+            records.forEach((record) => {
+                if (record && record.height) {
+                    measured += record.height;
+                    measuredCount += 1;
+                }
+            });
+            const estimate = measuredCount ? measured / measuredCount : VIRTUAL_ESTIMATED_HEIGHT;
+            const heightOf = (index) => (records[index] && records[index].height) || estimate;
+
+            let total = 0;
+            for (let i = 0; i < records.length; i += 1) {
+                total += heightOf(i);
+            }
+            const containerTop = this.els.chatContainer.getBoundingClientRect().top - scroll.getBoundingClientRect().top + scroll.scrollTop;
+            const viewHeight = scroll.clientHeight;
+            const viewTop = stickToBottom ? Math.max(0, total - viewHeight) : scroll.scrollTop - containerTop;
+            const fromPx = viewTop - VIRTUAL_OVERSCAN_PX;
+            const toPx = viewTop + viewHeight + VIRTUAL_OVERSCAN_PX;
+
+            let start = 0;
+            let offset = 0;
+            while (start < records.length && offset + heightOf(start) < fromPx) {
+                offset += heightOf(start);
+                start += 1;
+            }
+            let end = start;
+            let cursor = offset;
+            while (end < records.length && cursor < toPx) {
+                cursor += heightOf(end);
+                end += 1;
+            }
+
+            // Keep the first visible message at the same screen position
+            // while estimated heights are replaced with measured ones.
+            let anchor = start;
+            let anchorOffset = offset;
+            while (anchor < end - 1 && anchorOffset + heightOf(anchor) <= viewTop) {
+                anchorOffset += heightOf(anchor);
+                anchor += 1;
+            }
+            const anchorDelta = viewTop - anchorOffset;
+
+            const keep = new Set(records.slice(start, end));
+            virtual.mounted.forEach((record) => {
+                if (keep.has(record)) return;
+                if (record.message.streaming) {
+                    record.element.remove();
+                } else {
+                    record.release();
+                }
+            });
+            const fragment = document.createDocumentFragment();
+            const mounted = records.slice(start, end).filter(Boolean);
+            mounted.forEach((record) => fragment.appendChild(record.element));
+            virtual.bottomSpacer.before(fragment);
+            mounted.forEach((record) => {
+                record.height = record.element.offsetHeight + virtual.gap;
+            });
+            virtual.mounted = mounted;
+            virtual.start = start;
+            virtual.end = end;
+
+            let topHeight = 0;
+            for (let i = 0; i < start; i += 1) {
+                topHeight += heightOf(i);
+            }
+            let bottomHeight = 0;
+            for (let i = end; i < records.length; i += 1) {
+                bottomHeight += heightOf(i);
+            }
+            this._sizeSpacer(virtual.topSpacer, topHeight, virtual.gap);
+            this._sizeSpacer(virtual.bottomSpacer, bottomHeight, virtual.gap);
+
+            if (stickToBottom) {
+                scroll.scrollTop = scroll.scrollHeight;
+            } else {
+                let anchorTop = topHeight;
+                for (let i = start; i < anchor; i += 1) {
+                    anchorTop += heightOf(i);
+                }
+                const target = containerTop + anchorTop + anchorDelta;
+                if (Math.abs(scroll.scrollTop - target) > 1) {
+                    scroll.scrollTop = target;
+                }
+            }
+        }
+
+        _sizeSpacer(spacer, height, gap) {
+            // Each spacer contributes one flex gap of its own.
+            spacer.style.display = height > 0 ? "block" : "none";
+            spacer.style.height = `${Math.max(0, height - gap)}px`;
+        }
+
         _renderChatList() {
             this.els.chatList.innerHTML = "";
             const isCollapsed = this.sidebarCollapsed;
@@ -2547,6 +3217,10 @@
         }
 
         _scrollToBottom() {
+            if (this._virtual) {
+                this._scheduleVirtualUpdate(true);
+                return;
+            }
             window.requestAnimationFrame(() => {
                 this.els.chatScroll.scrollTop = this.els.chatScroll.scrollHeight;
             });
@@ -2581,7 +3255,7 @@
             chat.messages = Array.from(messages || []).map((msg) => this._normalizeMessage(msg));
             chat.artifacts = [];
             chat.messages.forEach((msg) => {
-                if (msg.content && msg.role !== "user") {
+                if (msg.content && msg.role !== "user" && String(msg.content).includes("::::")) {
                     const parsed = this._processStreamingText(msg.content, { messageId: msg.id });
                     parsed.artifacts.forEach((artifact) => {
                         this._artifactMap.set(artifact.id, Object.assign({ chatId: chat.id, messageId: msg.id }, artifact));
@@ -2590,7 +3264,7 @@
                 }
             });
             this._renderMessages();
-            this.saveState();
+            this.saveState(chat.id);
         }
 
         addMessage(message) {
@@ -2600,12 +3274,9 @@
             chat.messages.push(normalized);
             const selectedModel = this._getSelectedModel();
             chat.model = selectedModel || chat.model || "default";
-            const element = this._createMessageElement(normalized);
-            this._renderMessageContent(normalized, element);
-            this.els.chatContainer.appendChild(element);
-            this._messageMap.set(normalized.id, { chatId: chat.id, element, message: normalized });
+            this._mountNewMessage(chat, normalized);
             this._scrollToBottom();
-            this.saveState();
+            this.saveState(chat.id);
             return normalized.id;
         }
 
@@ -2618,7 +3289,7 @@
             const normalized = this._normalizeMessage(record.message);
             Object.assign(record.message, normalized);
             this._renderMessageContent(record.message, record.element);
-            this.saveState();
+            this.saveState(record.chatId);
         }
 
         removeMessage(messageId) {
@@ -2628,9 +3299,11 @@
             if (chat) {
                 chat.messages = chat.messages.filter((msg) => msg.id !== messageId);
             }
-            record.element.remove();
+            record.release();
             this._messageMap.delete(messageId);
-            this.saveState();
+            this._markdownCache.delete(messageId);
+            this._scheduleVirtualUpdate(false);
+            this.saveState(record.chatId);
         }
 
         clearMessages() {
@@ -2638,11 +3311,13 @@
             if (!chat) return;
             chat.messages = [];
             chat.artifacts = [];
+            this._teardownVirtualList();
             this._messageMap.clear();
+            this._markdownCache.clear();
             this._artifactMap.clear();
             this.els.chatContainer.innerHTML = "";
             this.closeArtifactPanel();
-            this.saveState();
+            this.saveState(chat.id);
         }
 
         startStream(message) {
@@ -2652,13 +3327,9 @@
             chat.messages.push(payload);
             const selectedModel = this._getSelectedModel();
             chat.model = selectedModel || chat.model || "default";
-            const element = this._createMessageElement(payload);
-            element.classList.add("streaming");
-            this._renderMessageContent(payload, element);
-            this.els.chatContainer.appendChild(element);
-            this._messageMap.set(payload.id, { chatId: chat.id, element, message: payload });
+            this._mountNewMessage(chat, payload);
             this._scrollToBottom();
-            this.saveState();
+            this.saveState(chat.id);
             this._activeStreamId = payload.id;
             this._setComposerMode("cancel");
             return payload.id;
@@ -2680,10 +3351,48 @@
                     }
                 }
             }
-            this._renderMessageContent(record.message, record.element);
+            if (this._canRenderIncrementally(record.message)) {
+                this._renderStreamingContent(record);
+            } else {
+                record.streamBlocks = null;
+                this._renderMessageContent(record.message, record.element);
+            }
             this._scrollToBottom();
             this._handleArtifactStreaming(record.message);
-            this.saveState();
+            this.saveState(record.chatId);
+        }
+
+        _canRenderIncrementally(message) {
+            if (message.role === "user") return false;
+            if (!this.options.enableArtifacts) return true;
+            const meta = message.meta || {};
+            return !meta.artifactBuilding && !meta.artifactBuildingButton && !(message.content || "").includes("::::");
+        }
+
+        _renderStreamingContent(record) {
+            const { message, element } = record;
+            const contentEl = element.querySelector(".message-content");
+            if (!contentEl) return;
+            let state = record.streamBlocks;
+            if (!state || !state.tailEl || state.tailEl.parentNode !== contentEl) {
+                state = record.streamBlocks = createStreamBlockState();
+                state.tailEl = document.createElement("div");
+                state.tailEl.className = "message-stream-tail";
+                contentEl.innerHTML = "";
+                contentEl.appendChild(state.tailEl);
+            }
+            const text = message.content || "";
+            const boundary = advanceStreamBlocks(state, text);
+            if (boundary > state.frozen) {
+                const block = text.slice(state.frozen, boundary);
+                if (block.trim()) {
+                    state.tailEl.insertAdjacentHTML("beforebegin", renderMarkdown(block) || escapeHtml(block).replace(/\n/g, "<br>"));
+                }
+                state.frozen = boundary;
+            }
+            const tail = text.slice(state.frozen);
+            state.tailEl.innerHTML = tail.trim() ? (renderMarkdown(tail) || escapeHtml(tail).replace(/\n/g, "<br>")) : "";
+            this._updateThinkingState(message, element, Boolean(text.trim()));
         }
 
         finishStream(messageId, finalChunk) {
@@ -2693,6 +3402,7 @@
                 record.message.content = (record.message.content || "") + finalChunk;
             }
             record.message.streaming = false;
+            record.streamBlocks = null;
             record.element.classList.remove("streaming");
             const finishedAt = new Date().toISOString();
             record.message.timestamp = finishedAt;
@@ -2700,7 +3410,7 @@
             record.message.meta.timestamp = finishedAt;
             this._renderMessageContent(record.message, record.element);
             this._handleArtifactStreaming(record.message, true);
-            this.saveState();
+            this.saveState(record.chatId);
             if (this._activeStreamId === messageId) {
                 this._activeStreamId = null;
                 this._setComposerMode("send");
@@ -3097,7 +3807,7 @@
                     delete chat.badge;
                 }
                 chat.messages.forEach((msg) => {
-                    if (msg.content && msg.role !== "user") {
+                    if (msg.content && msg.role !== "user" && String(msg.content).includes("::::")) {
                         const parsed = this._processStreamingText(msg.content, { messageId: msg.id });
                         parsed.artifacts.forEach((artifact) => {
                             this._artifactMap.set(artifact.id, Object.assign({ chatId: chat.id, messageId: msg.id }, artifact));
@@ -0,0 +1,153 @@
+(function () {
+    // Data helpers for dhx.Grid that let the Python wrapper ship compact
+    // payloads and assemble row objects on the JS side.
+
+    function columnLength(column) {
+        return column && typeof column.length === "number" ? column.length : 0;
+    }
+
+    function readValue(column, index) {
+        const value = column[index];
+        return typeof value === "bigint" ? Number(value) : value;
+    }
+
+    function rowsFromColumns(columns, length) {
+        const names = Object.keys(columns || {});
+        const vectors = names.map((name) => columns[name]);
+        let count = typeof length === "number" ? length : 0;
+        if (typeof length !== "number") {
+            vectors.forEach((column) => {
+                count = Math.max(count, columnLength(column));
+            });
+        }
+
+        const rows = new Array(count);
+        for (let i = 0; i < count; i += 1) {
+            const row = {};
+            for (let c = 0; c < names.length; c += 1) {
+                row[names[c]] = readValue(vectors[c], i);
+            }
+            rows[i] = row;
+        }
+        return rows;
+    }
+
+    function parseColumns(grid, columns, options = {}) {
+        if (!grid || !grid.data) {
+            throw new Error("parseColumns requires a dhx.Grid instance");
+        }
+        const rows = rowsFromColumns(columns, options.length);
+        if (options.append) {
+            grid.data.add(rows, grid.data.getLength());
+        } else {
+            grid.data.parse(rows);
+        }
+        return rows.length;
+    }
+
+    // Applies an incremental diff ({replace} or {add, update, remove}) in one
+    // pass. Updates are applied silently and followed by a single repaint so
+    // scroll, selection and sort state survive a refresh.
+    function applyDiff(grid, diff = {}, key = "id") {
+        if (!grid || !grid.data) {
+            throw new Error("applyDiff requires a dhx.Grid instance");
+        }
+        const data = grid.data;
+        // dhx uses the row's `id` field as the collection id, so a custom key
+        // only fills in a missing id; a row whose own id differs is rejected
+        // rather than having its data rewritten.
+        const withId = (row) => {
+            if (key === "id") {
+                return row;
+            }
+            if (row.id === undefined || row.id === null) {
+                row.id = row[key];
+            } else if (row.id !== row[key]) {
+                throw new Error(`applyDiff: row id ${row.id} does not match its ${key} ${row[key]}`);
+            }
+            return row;
+        };
+
+        if (diff.replace) {
+            data.parse(diff.replace.map(withId));
+            return;
+        }
+
+        const removed = (diff.remove || []).filter((id) => data.exists(id));
+        if (removed.length) {
+            data.remove(removed);
+        }
+
+        const added = (diff.add || []).map(withId);
+        let updated = 0;
+        (diff.update || []).forEach((row) => {
+            withId(row);
+            if (data.exists(row.id)) {
+                data.update(row.id, row, true);
+                updated += 1;
+            } else {
+                added.push(row);
+            }
+        });
+        if (updated) {
+            data.events.fire("change", []);
+        }
+
+        if (added.length) {
+            data.add(added, data.getLength());
+        }
+    }
+
+    // Lazy mode: the collection holds `total` placeholder rows ({$empty: true},
+    // the same convention dhx uses for its own lazy loading) and row windows
+    // are filled in or released as the user scrolls.
+    function initLazy(grid, total) {
+        grid.data.parse({ total_count: total, from: 0, data: [] });
+    }
+
+    function fillRange(grid, from, rows) {
+        const data = grid.data;
+        rows.forEach((row, i) => {
+            const oldId = data.getId(from + i);
+            const item = oldId === undefined ? null : data.getItem(oldId);
+            if (!item) {
+                return;
+            }
+            let id = oldId;
+            if (row.id !== undefined && row.id !== null && row.id !== oldId) {
+                data.changeId(oldId, row.id, true);
+                id = row.id;
+            }
+            data.update(id, Object.assign({}, row, { $empty: undefined }), true);
+        });
+        data.events.fire("change", []);
+    }
+
+    function clearRange(grid, from, count) {
+        const data = grid.data;
+        for (let i = from; i < from + count; i += 1) {
+            const id = data.getId(i);
+            const item = id === undefined ? null : data.getItem(id);
+            if (!item || item.$empty) {
+                continue;
+            }
+            Object.keys(item).forEach((field) => {
+                if (field !== "id") {
+                    delete item[field];
+                }
+            });
+            item.$empty = true;
+        }
+        data.events.fire("change", []);
+    }
+
+    globalThis.customdhx = globalThis.customdhx || {};
+    globalThis.customdhx.gridData = {
+        rowsFromColumns,
+        parseColumns,
+        applyDiff,
+        initLazy,
+        fillRange,
+        clearRange,
+    };
+})();
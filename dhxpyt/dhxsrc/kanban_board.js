@@ -15,8 +15,14 @@
         cardTemplate: null,
         columnTemplate: null,
         boardId: null,
+        cardWindowSize: 0,
     };
 
+    // Opt-in (cardWindowSize > 0): columns holding more cards than
+    // `cardWindowSize` render only a window of them; spacers sized from
+    // measured (or estimated) card heights stand in for the rest.
+    const ESTIMATED_CARD_HEIGHT = 96;
+
     const CARD_TEMPLATES = new Map();
     const COLUMN_TEMPLATES = new Map();
 
@@ -36,6 +42,17 @@
         return JSON.parse(JSON.stringify(value));
     }
 
+    function sameCardData(a, b) {
+        if (!a || !b) {
+            return false;
+        }
+        try {
+            return JSON.stringify(a) === JSON.stringify(b);
+        } catch (err) {
+            return false;
+        }
+    }
+
     function ensureStyles() {
         if (document.querySelector("style[data-kanban-style='true']")) {
             return;
@@ -319,6 +336,16 @@
     min-height: 80px;
 }
 
+.kanban-column-body.is-virtual {
+    max-height: var(--kanban-column-max-height, 70vh);
+    overflow-y: auto;
+}
+
+.kanban-virtual-spacer {
+    flex: none;
+    pointer-events: none;
+}
+
 .kanban-empty-column {
     font-size: 13px;
     color: var(--kanban-muted);
@@ -516,6 +543,34 @@
             this._suspendRender = false;
             this._dragState = null;
             this._theme = "auto";
+            // Keyed DOM caches: card elements survive renders and are only
+            // rebuilt when the card changes or lands in another column/lane.
+            this._cardEls = new Map();
+            this._columnEls = new Map();
+            this._headerEls = new Map();
+            this._renderedLaneKey = null;
+            // (columnId -> laneId -> ordered card ids), kept in step with
+            // column.cards by the card mutators; columns listed in
+            // _staleBuckets are regrouped on next read.
+            this._buckets = new Map();
+            this._staleBuckets = new Set();
+            this._derivedLanes = null;
+            this._cardHeights = new Map();
+            // Card revisions (bumped on every change) and the memoized
+            // template output per card, so unchanged cards never call back
+            // into a template (for Python templates: never cross the bridge).
+            this._revisions = new Map();
+            this._templateCache = new Map();
+            // Bumped when columns, lanes or options change, since templates
+            // also see the column/lane context.
+            this._boardRevision = 0;
+            // Ordered change log delivered to subscribeChanges() listeners.
+            this._changeSeq = 0;
+            this._changeSubscribers = new Set();
+            this._bodyWindows = new WeakMap();
+            // Work deferred while rendering is suspended (see applyBatch).
+            this._pendingColumns = new Set();
+            this._pendingFullRender = false;
 
             this._buildShell();
             this.load(options);
@@ -639,16 +694,21 @@
             });
 
             this._render();
+            if (Array.isArray(columns) || Array.isArray(cards)) {
+                this._recordChange("board:reset", { reason: "load" });
+            }
         }
 
         setColumns(columns) {
             this._applyColumns(columns);
             this._render();
+            this._recordChange("board:reset", { reason: "columns" });
         }
 
         setCards(cards) {
             this._applyCards(cards);
             this._render();
+            this._recordChange("board:reset", { reason: "cards" });
         }
 
         setLanes(lanes) {
@@ -663,13 +723,20 @@
                 throw new Error(`Unknown column: ${normalized.status}`);
             }
             this._cards.set(normalized.id, normalized);
+            this._bumpRevision(normalized.id);
 
             const targetIndex = typeof index === "number" && index >= 0
                 ? Math.min(index, column.cards.length)
                 : column.cards.length;
             column.cards.splice(targetIndex, 0, normalized.id);
+            this._bucketInsert(column, normalized, targetIndex);
+            this._derivedLanes = null;
 
-            this._render();
+            this._renderColumns([column.id]);
+            this._recordChange("card:add", {
+                cardId: normalized.id,
+                after: Object.assign({ index: targetIndex }, normalized),
+            });
             this._emit("cardMove", {
                 action: "add",
                 card: normalized,
@@ -697,6 +764,23 @@
                 }
             }
 
+            const positional = (hasStatus && updates.status !== existing.status)
+                || (hasLane && updates.lane !== existing.lane);
+            if (positional) {
+                // Apply the non-positional fields first so they are not lost
+                // when the update turns into a move.
+                const rest = Object.assign({}, updates);
+                delete rest.status;
+                delete rest.lane;
+                if (Object.keys(rest).length) {
+                    const updated = Object.assign({}, existing, rest);
+                    this._cards.set(cardId, updated);
+                    this._bumpRevision(cardId);
+                    this._cardEls.delete(cardId);
+                    this._recordCardUpdate(existing, updated, rest);
+                }
+            }
+
             if (hasStatus && updates.status !== existing.status) {
                 const moveOptions = { column: updates.status };
                 if (hasLane) {
@@ -715,8 +799,19 @@
                 return;
             }
 
+            if (!this._recordCardUpdate(existing, clone, updates || {})) {
+                return;
+            }
             this._cards.set(cardId, clone);
-            this._render();
+            this._bumpRevision(cardId);
+            if (this._laneKeyOf(clone) !== this._laneKeyOf(existing)) {
+                this._invalidateBuckets(existing.status);
+                this._derivedLanes = null;
+                this._cardEls.delete(cardId);
+                this._renderColumns([existing.status]);
+                return;
+            }
+            this._refreshCard(cardId);
         }
 
         removeCard(cardId) {
@@ -726,11 +821,22 @@
             }
 
             this._cards.delete(cardId);
-            this._columns.forEach((column) => {
-                column.cards = column.cards.filter((id) => id !== cardId);
+            const fromIndex = this._detachCardId(cardId, existing);
+            this._derivedLanes = null;
+            const cached = this._cardEls.get(cardId);
+            if (cached) {
+                cached.el.remove();
+                this._cardEls.delete(cardId);
+            }
+            this._cardHeights.delete(cardId);
+            this._revisions.delete(cardId);
+            this._templateCache.delete(cardId);
+
+            this._renderColumns([existing.status]);
+            this._recordChange("card:remove", {
+                cardId,
+                before: Object.assign({ index: fromIndex }, existing),
             });
-
-            this._render();
             this._emit("cardMove", {
                 action: "remove",
                 card: existing,
@@ -758,12 +864,7 @@
                 return;
             }
 
-            this._columns.forEach((column) => {
-                const idx = column.cards.indexOf(cardId);
-                if (idx >= 0) {
-                    column.cards.splice(idx, 1);
-                }
-            });
+            const fromIndex = this._detachCardId(cardId, card);
 
             const insertIndex = typeof options.index === "number" && options.index >= 0
                 ? Math.min(options.index, targetColumn.cards.length)
@@ -773,9 +874,19 @@
             card.status = targetColumnId;
             card.lane = targetLaneId || null;
             this._cards.set(cardId, card);
+            this._bucketInsert(targetColumn, card, insertIndex);
+            this._bumpRevision(cardId);
+            if ((targetLaneId || null) !== fromLaneId) {
+                this._derivedLanes = null;
+            }
 
-            this._render();
+            this._renderColumns([fromColumnId, targetColumnId]);
 
+            this._recordChange("card:move", {
+                cardId,
+                before: { column: fromColumnId, lane: fromLaneId, index: fromIndex },
+                after: { column: targetColumnId, lane: card.lane || null, index: insertIndex },
+            });
             this._emit("cardMove", {
                 action: "move",
                 card: card,
@@ -793,6 +904,7 @@
                 ? Math.min(index, this._columns.length)
                 : this._columns.length;
             this._columns.splice(targetIndex, 0, normalized);
+            this._boardRevision += 1;
             this._render();
 
             this._emit("columnCreate", {
@@ -809,15 +921,70 @@
                 return;
             }
             Object.assign(column, updates || {});
+            this._boardRevision += 1;
             this._render();
         }
 
+        /**
+         * Apply a list of card operations and render once at the end.
+         * Each op is one of:
+         *   {op: "add", card, index}
+         *   {op: "update", id, changes}
+         *   {op: "move", id, column, lane, index}
+         *   {op: "remove", id}
+         * Returns the number of operations applied.
+         */
+        applyBatch(ops) {
+            let applied = 0;
+            this._withSuspendedRender(() => {
+                (ops || []).forEach((entry) => {
+                    if (!entry || typeof entry !== "object") {
+                        return;
+                    }
+                    try {
+                        switch (entry.op) {
+                        case "add":
+                            this.addCard(entry.card, entry.index);
+                            break;
+                        case "update":
+                            this.updateCard(entry.id, entry.changes);
+                            break;
+                        case "move": {
+                            const options = {};
+                            ["column", "lane", "index"].forEach((key) => {
+                                if (Object.prototype.hasOwnProperty.call(entry, key) && entry[key] !== undefined) {
+                                    options[key] = entry[key];
+                                }
+                            });
+                            this.moveCard(entry.id, options);
+                            break;
+                        }
+                        case "remove":
+                            this.removeCard(entry.id);
+                            break;
+                        default:
+                            console.warn("[KanbanBoard] applyBatch: unknown op", entry.op);
+                            return;
+                        }
+                        applied += 1;
+                    } catch (err) {
+                        console.warn("[KanbanBoard] applyBatch: operation failed", entry, err);
+                    }
+                });
+            });
+            this._flushPendingRender();
+            return applied;
+        }
+
         removeColumn(columnId) {
             const index = this._columns.findIndex((col) => col.id === columnId);
             if (index === -1) {
                 return;
             }
             const [removed] = this._columns.splice(index, 1);
+            this._buckets.delete(removed.id);
+            this._staleBuckets.delete(removed.id);
+            this._boardRevision += 1;
             this._render();
             this._emit("columnToggle", {
                 action: "remove",
@@ -832,6 +999,35 @@
             this._root.setAttribute("data-kanban-theme", resolved);
         }
 
+        /**
+         * Subscribe to the ordered change log. `handler` receives arrays of
+         * changes ({seq, type, cardId, before, after, ...}) where `seq` is
+         * monotonic per board. Changes made within `coalesceMs` of each other
+         * are delivered together. Returns an unsubscribe function.
+         */
+        subscribeChanges(handler, coalesceMs = 0) {
+            if (typeof handler !== "function") {
+                return () => {};
+            }
+            const subscriber = {
+                handler,
+                delay: Math.max(0, Number(coalesceMs) || 0),
+                buffer: [],
+                timer: null,
+            };
+            this._changeSubscribers.add(subscriber);
+            return () => {
+                if (subscriber.timer !== null) {
+                    clearTimeout(subscriber.timer);
+                }
+                this._changeSubscribers.delete(subscriber);
+            };
+        }
+
+        getChangeSequence() {
+            return this._changeSeq;
+        }
+
         getState() {
             const columns = this._columns.map((column) => ({
                 id: column.id,
@@ -864,8 +1060,19 @@
         }
 
         destroy() {
+            this._changeSubscribers.forEach((subscriber) => {
+                if (subscriber.timer !== null) {
+                    clearTimeout(subscriber.timer);
+                }
+            });
+            this._changeSubscribers.clear();
             this._events.clear();
             this._cards.clear();
+            this._cardEls.clear();
+            this._columnEls.clear();
+            this._headerEls.clear();
+            this._revisions.clear();
+            this._templateCache.clear();
             this._columns = [];
             this._lanes = [];
             if (this._root && this._root.parentNode) {
@@ -927,6 +1134,7 @@
         this._boardHeader.appendChild(this._boardHeaderColumns);
         this._boardLanes = document.createElement("div");
         this._boardLanes.className = "kanban-board-lanes";
+        this._bindCardEvents(this._boardLanes);
         this._board.appendChild(this._boardHeader);
         this._board.appendChild(this._boardLanes);
 
@@ -945,6 +1153,56 @@
             this.setTheme(this._options.theme);
         }
 
+        // Card interactions are delegated so cached card nodes can move
+        // between columns without rebinding listeners.
+        _bindCardEvents(container) {
+            const resolve = (event) => {
+                const cardEl = event.target && event.target.closest ? event.target.closest(".kanban-card") : null;
+                if (!cardEl || !container.contains(cardEl)) {
+                    return null;
+                }
+                const card = this._cards.get(cardEl.dataset.cardId);
+                return card ? { cardEl, card } : null;
+            };
+            container.addEventListener("click", (event) => {
+                const hit = resolve(event);
+                if (!hit) {
+                    return;
+                }
+                const laneEl = hit.cardEl.closest(".kanban-lane");
+                this._emit("cardClick", {
+                    card: hit.card,
+                    columnId: hit.card.status,
+                    laneId: laneEl && laneEl.dataset.laneId ? laneEl.dataset.laneId : null,
+                });
+            });
+            container.addEventListener("dragstart", (event) => {
+                const hit = resolve(event);
+                if (hit) {
+                    this._handleDragStart(event, hit.cardEl, hit.card);
+                }
+            });
+            container.addEventListener("dragend", (event) => {
+                const hit = resolve(event);
+                if (hit) {
+                    this._handleDragEnd(hit.cardEl);
+                }
+            });
+        }
+
+        _flushPendingRender() {
+            if (this._suspendRender) {
+                return;
+            }
+            if (this._pendingFullRender) {
+                this._render();
+            } else if (this._pendingColumns.size) {
+                const columnIds = Array.from(this._pendingColumns);
+                this._pendingColumns.clear();
+                this._renderColumns(columnIds);
+            }
+        }
+
         _withSuspendedRender(callback) {
             const previous = this._suspendRender;
             this._suspendRender = true;
@@ -957,15 +1215,20 @@
 
         _render() {
             if (this._suspendRender) {
+                this._pendingFullRender = true;
                 return;
             }
+            this._pendingFullRender = false;
+            this._pendingColumns.clear();
 
             this._updateHeader();
 
             this._boardHeaderColumns.innerHTML = "";
             this._boardLanes.innerHTML = "";
+            this._columnEls.clear();
+            this._headerEls.clear();
+            this._renderedLaneKey = null;
             const hasColumns = Boolean(this._columns.length);
-            const hasCards = this._columns.some((column) => column.cards.length);
 
             if (!hasColumns) {
                 this._boardHeader.style.display = "none";
@@ -975,17 +1238,16 @@
             }
 
             this._boardHeader.style.display = "";
-            this._empty.style.display = hasCards ? "none" : "block";
-            if (!hasCards) {
-                this._empty.textContent = this._options.emptyBoardText || "Drop cards here to get started.";
-            }
+            this._updateEmptyState();
 
             this._columns.forEach((column) => {
                 const headerCell = this._renderColumnHeaderCell(column);
+                this._headerEls.set(column.id, headerCell);
                 this._boardHeaderColumns.appendChild(headerCell);
             });
 
             const lanes = this._getRenderableLanes();
+            this._renderedLaneKey = this._laneKey(lanes);
             lanes.forEach((lane, index) => {
                 const laneEl = this._renderLane(lane, index);
                 this._boardLanes.appendChild(laneEl);
@@ -1016,6 +1278,167 @@
             }
         }
 
+        // Patch only the given columns (in every lane) and their header
+        // cells. Falls back to a full render when the board structure the
+        // DOM was built for no longer matches (new derived lane, etc.).
+        _renderColumns(columnIds) {
+            if (this._suspendRender) {
+                columnIds.forEach((columnId) => this._pendingColumns.add(columnId));
+                return;
+            }
+            const lanes = this._getRenderableLanes();
+            if (this._renderedLaneKey === null || this._laneKey(lanes) !== this._renderedLaneKey) {
+                this._render();
+                return;
+            }
+            const unique = Array.from(new Set(columnIds));
+            for (const columnId of unique) {
+                const column = this._getColumn(columnId);
+                if (!column) {
+                    continue;
+                }
+                for (const lane of lanes) {
+                    const entry = this._columnEls.get(this._columnKey(lane, column.id));
+                    if (!entry) {
+                        this._render();
+                        return;
+                    }
+                    this._fillColumnBody(entry.body, column, lane);
+                }
+                this._refreshHeaderCell(column);
+            }
+            this._updateEmptyState();
+        }
+
+        // Rebuild a single card element in place (content change only).
+        _refreshCard(cardId) {
+            if (this._suspendRender) {
+                const card = this._cards.get(cardId);
+                this._cardEls.delete(cardId);
+                if (card) {
+                    this._pendingColumns.add(card.status);
+                }
+                return;
+            }
+            const cached = this._cardEls.get(cardId);
+            const card = this._cards.get(cardId);
+            this._cardHeights.delete(cardId);
+            if (!cached || !card || !cached.el.isConnected) {
+                // Not on screen (outside a column window or a hidden lane):
+                // it is rebuilt from the new data when it is next shown.
+                this._cardEls.delete(cardId);
+                return;
+            }
+            const columnEl = cached.el.closest(".kanban-column");
+            const laneEl = cached.el.closest(".kanban-lane");
+            const column = this._getColumn(card.status);
+            const lane = this._laneFromElement(laneEl);
+            if (!columnEl || !column) {
+                this._renderColumns([card.status]);
+                return;
+            }
+            this._cardEls.delete(cardId);
+            const next = this._getCardElement(card, column, lane);
+            cached.el.replaceWith(next);
+        }
+
+        _refreshHeaderCell(column) {
+            const previous = this._headerEls.get(column.id);
+            const next = this._renderColumnHeaderCell(column);
+            this._headerEls.set(column.id, next);
+            if (previous && previous.parentNode) {
+                previous.replaceWith(next);
+            }
+        }
+
+        _updateEmptyState() {
+            const hasCards = this._columns.some((column) => column.cards.length);
+            this._empty.style.display = hasCards ? "none" : "block";
+            if (!hasCards) {
+                this._empty.textContent = this._options.emptyBoardText || "Drop cards here to get started.";
+            }
+        }
+
+        _laneKey(lanes) {
+            return lanes.map((lane) => String(lane.id || "")).join("\u0001");
+        }
+
+        _columnKey(lane, columnId) {
+            return `${lane && lane.id ? lane.id : ""}\u0001${columnId}`;
+        }
+
+        _laneFromElement(laneEl) {
+            const laneId = laneEl && laneEl.dataset.laneId ? laneEl.dataset.laneId : null;
+            if (laneId === null) {
+                return { id: null, title: null };
+            }
+            return this._getRenderableLanes().find((lane) => String(lane.id) === laneId) || { id: laneId, title: laneId };
+        }
+
+        // Cached card element for `card` in (column, lane); rebuilt when the
+        // card has been invalidated or moved, or the board structure changed,
+        // since templates see the column and lane.
+        _getCardElement(card, column, lane) {
+            const laneId = lane && lane.id ? lane.id : null;
+            const cached = this._cardEls.get(card.id);
+            if (
+                cached
+                && cached.columnId === column.id
+                && cached.laneId === laneId
+                && cached.boardRevision === this._boardRevision
+            ) {
+                return cached.el;
+            }
+            const el = this._renderCard(card, column, lane);
+            this._cardEls.set(card.id, { el, columnId: column.id, laneId, boardRevision: this._boardRevision });
+            return el;
+        }
+
+        // Keyed reconciliation of a column body: existing card nodes are
+        // reused and only moved when out of place; stale nodes are dropped.
+        _fillColumnBody(body, column, lane) {
+            const windowSize = this._options.cardWindowSize;
+            if (windowSize > 0 && this._countColumnCards(column, lane) > windowSize) {
+                this._fillColumnWindow(body, column, lane);
+                return;
+            }
+            body.classList.remove("is-virtual");
+            const cards = this._getCardsForColumn(column, lane);
+            if (!cards.length) {
+                const current = body.firstElementChild;
+                if (!(current && current.classList.contains("kanban-empty-column") && body.childElementCount === 1)) {
+                    const empty = document.createElement("div");
+                    empty.className = "kanban-empty-column";
+                    empty.textContent = column.emptyText || "Nothing here yet";
+                    body.replaceChildren(empty);
+                }
+                return;
+            }
+            const canDrag = String(this._options.allowCardDrag && column.allowDrop !== false);
+            let cursor = body.firstChild;
+            if (cursor && cursor.classList && cursor.classList.contains("kanban-empty-column")) {
+                const next = cursor.nextSibling;
+                cursor.remove();
+                cursor = next;
+            }
+            cards.forEach((card) => {
+                const el = this._getCardElement(card, column, lane);
+                if (el.getAttribute("draggable") !== canDrag) {
+                    el.setAttribute("draggable", canDrag);
+                }
+                if (el === cursor) {
+                    cursor = cursor.nextSibling;
+                } else {
+                    body.insertBefore(el, cursor);
+                }
+            });
+            while (cursor) {
+                const next = cursor.nextSibling;
+                body.removeChild(cursor);
+                cursor = next;
+            }
+        }
+
         _renderLane(lane, laneIndex) {
             const laneEl = document.createElement("div");
             laneEl.className = "kanban-lane";
@@ -1102,19 +1525,10 @@
             body.addEventListener("dragover", (event) => this._handleDragOver(event, columnEl, column, lane));
             body.addEventListener("dragleave", (event) => this._handleDragLeave(event, columnEl));
             body.addEventListener("drop", (event) => this._handleDrop(event, columnEl, column, lane));
+            body.addEventListener("scroll", () => this._scheduleWindowUpdate(body, column, lane), { passive: true });
 
-            const cards = this._getCardsForColumn(column, lane);
-            if (!cards.length) {
-                const empty = document.createElement("div");
-                empty.className = "kanban-empty-column";
-                empty.textContent = column.emptyText || "Nothing here yet";
-                body.appendChild(empty);
-            } else {
-                cards.forEach((card) => {
-                    const cardEl = this._renderCard(card, column, lane);
-                    body.appendChild(cardEl);
-                });
-            }
+            this._fillColumnBody(body, column, lane);
+            this._columnEls.set(this._columnKey(lane, column.id), { columnEl, body });
 
             columnEl.appendChild(body);
 
@@ -1139,6 +1553,136 @@
             return columnEl;
         }
 
+        _scheduleWindowUpdate(body, column, lane) {
+            const state = this._bodyWindows.get(body);
+            if (!state || state.frame !== null || !body.classList.contains("is-virtual")) {
+                return;
+            }
+            state.frame = window.requestAnimationFrame(() => {
+                state.frame = null;
+                if (body.isConnected) {
+                    this._fillColumnWindow(body, column, lane);
+                }
+            });
+        }
+
+        _fillColumnWindow(body, column, lane) {
+            let state = this._bodyWindows.get(body);
+            if (!state) {
+                const styles = window.getComputedStyle(body);
+                state = {
+                    top: document.createElement("div"),
+                    bottom: document.createElement("div"),
+                    gap: parseFloat(styles.rowGap || styles.gap) || 0,
+                    frame: null,
+                };
+                state.top.className = "kanban-virtual-spacer";
+                state.bottom.className = "kanban-virtual-spacer";
+                this._bodyWindows.set(body, state);
+            }
+            body.classList.add("is-virtual");
+
+            const ids = this._getBucket(column, lane);
+            let measured = 0;
+            let measuredCount = 0;
+            ids.forEach((cardId) => {
+                const height = this._cardHeights.get(cardId);
+                if (height) {
+                    measured += height;
+                    measuredCount += 1;
+                }
+            });
+            const estimate = measuredCount ? measured / measuredCount : ESTIMATED_CARD_HEIGHT + state.gap;
+            const heightOf = (index) => this._cardHeights.get(ids[index]) || estimate;
+
+            const windowSize = this._options.cardWindowSize;
+            const overscan = Math.max(1, Math.floor(windowSize / 4));
+            const scrollTop = body.scrollTop;
+            const viewBottom = scrollTop + (body.clientHeight || windowSize * estimate);
+            let first = 0;
+            let offset = 0;
+            while (first < ids.length - 1 && offset + heightOf(first) <= scrollTop) {
+                offset += heightOf(first);
+                first += 1;
+            }
+            const anchorDelta = scrollTop - offset;
+            const start = Math.max(0, first - overscan);
+            let end = Math.min(ids.length, start + windowSize);
+            let cursorPx = offset;
+            for (let i = first; i < end; i += 1) {
+                cursorPx += heightOf(i);
+            }
+            while (end < ids.length && cursorPx < viewBottom) {
+                cursorPx += heightOf(end);
+                end += 1;
+            }
+
+            const canDrag = String(this._options.allowCardDrag && column.allowDrop !== false);
+            const nodes = [state.top];
+            for (let i = start; i < end; i += 1) {
+                const card = this._cards.get(ids[i]);
+                if (!card) {
+                    continue;
+                }
+                const el = this._getCardElement(card, column, lane);
+                if (el.getAttribute("draggable") !== canDrag) {
+                    el.setAttribute("draggable", canDrag);
+                }
+                nodes.push(el);
+            }
+            nodes.push(state.bottom);
+
+            let cursor = body.firstChild;
+            nodes.forEach((node) => {
+                if (node === cursor) {
+                    cursor = cursor.nextSibling;
+                } else {
+                    body.insertBefore(node, cursor);
+                }
+            });
+            while (cursor) {
+                const next = cursor.nextSibling;
+                body.removeChild(cursor);
+                cursor = next;
+            }
+
+            for (let i = start; i < end; i += 1) {
+                const cached = this._cardEls.get(ids[i]);
+                const height = cached ? cached.el.offsetHeight : 0;
+                if (height > 0) {
+                    this._cardHeights.set(ids[i], height + state.gap);
+                }
+            }
+
+            let topHeight = 0;
+            for (let i = 0; i < start; i += 1) {
+                topHeight += heightOf(i);
+            }
+            let bottomHeight = 0;
+            for (let i = end; i < ids.length; i += 1) {
+                bottomHeight += heightOf(i);
+            }
+            this._sizeSpacer(state.top, topHeight, state.gap);
+            this._sizeSpacer(state.bottom, bottomHeight, state.gap);
+
+            // Keep the first visible card in place once estimates above it
+            // have been replaced by measured heights.
+            let anchorTop = topHeight;
+            for (let i = start; i < first; i += 1) {
+                anchorTop += heightOf(i);
+            }
+            const target = anchorTop + anchorDelta;
+            if (scrollTop > 0 && Math.abs(body.scrollTop - target) > 1) {
+                body.scrollTop = target;
+            }
+        }
+
+        _sizeSpacer(spacer, height, gap) {
+            // Each spacer takes one flex gap of its own.
+            spacer.style.display = height > 0 ? "block" : "none";
+            spacer.style.height = `${Math.max(0, height - gap)}px`;
+        }
+
         _renderColumnHeaderContent(column, lane) {
             const template = this._resolveColumnTemplate(column);
             const context = {
@@ -1196,17 +1740,6 @@
             const canDrag = this._options.allowCardDrag && column.allowDrop !== false;
             cardEl.setAttribute("draggable", String(canDrag));
 
-            cardEl.addEventListener("click", () => {
-                this._emit("cardClick", {
-                    card,
-                    columnId: column.id,
-                    laneId: lane.id || null,
-                });
-            });
-
-            cardEl.addEventListener("dragstart", (event) => this._handleDragStart(event, cardEl, card));
-            cardEl.addEventListener("dragend", () => this._handleDragEnd(cardEl));
-
             const template = this._resolveCardTemplate(card);
             const context = {
                 card,
@@ -1216,7 +1749,7 @@
             };
 
             if (typeof template === "function") {
-                const result = template(context);
+                const result = this._renderCardTemplate(template, card, context);
                 if (result instanceof Node) {
                     cardEl.appendChild(result);
                 } else if (typeof result === "string") {
@@ -1300,6 +1833,94 @@
             return cardEl;
         }
 
+        _recordChange(type, detail) {
+            this._changeSeq += 1;
+            if (!this._changeSubscribers.size) {
+                return;
+            }
+            const change = deepClone(Object.assign({ seq: this._changeSeq, type, timestamp: Date.now() }, detail));
+            this._changeSubscribers.forEach((subscriber) => {
+                subscriber.buffer.push(change);
+                if (subscriber.timer === null) {
+                    subscriber.timer = setTimeout(() => this._deliverChanges(subscriber), subscriber.delay);
+                }
+            });
+        }
+
+        _deliverChanges(subscriber) {
+            subscriber.timer = null;
+            if (!subscriber.buffer.length || !this._changeSubscribers.has(subscriber)) {
+                return;
+            }
+            const batch = subscriber.buffer;
+            subscriber.buffer = [];
+            try {
+                subscriber.handler(batch);
+            } catch (err) {
+                console.error("[KanbanBoard] change handler failed", err);
+            }
+        }
+
+        // Records the changed fields of an update; returns false when the
+        // update did not change anything.
+        _recordCardUpdate(existing, updated, updates) {
+            const before = {};
+            const after = {};
+            Object.keys(updates).forEach((key) => {
+                if (!sameCardData({ v: existing[key] }, { v: updated[key] })) {
+                    before[key] = existing[key];
+                    after[key] = updated[key];
+                }
+            });
+            if (!Object.keys(after).length) {
+                return false;
+            }
+            this._recordChange("card:update", { cardId: existing.id, before, after });
+            return true;
+        }
+
+        _bumpRevision(cardId) {
+            this._revisions.set(cardId, (this._revisions.get(cardId) || 0) + 1);
+        }
+
+        // Memoized template call keyed by (template, card id, card revision,
+        // board revision, column, lane, theme). Only string output is cached:
+        // Node results may carry listeners the template attached, which a
+        // clone would drop, so templates returning nodes run every time.
+        _renderCardTemplate(template, card, context) {
+            const revision = this._revisions.get(card.id) || 0;
+            const theme = this._root ? this._root.getAttribute("data-kanban-theme") : null;
+            const columnId = context.column ? context.column.id : null;
+            const laneId = context.lane ? context.lane.id : null;
+            const cached = this._templateCache.get(card.id);
+            if (
+                cached
+                && cached.template === template
+                && cached.revision === revision
+                && cached.boardRevision === this._boardRevision
+                && cached.columnId === columnId
+                && cached.laneId === laneId
+                && cached.theme === theme
+            ) {
+                return cached.value;
+            }
+            const result = template(context);
+            if (typeof result === "string") {
+                this._templateCache.set(card.id, {
+                    template,
+                    revision,
+                    boardRevision: this._boardRevision,
+                    columnId,
+                    laneId,
+                    theme,
+                    value: result,
+                });
+            } else {
+                this._templateCache.delete(card.id);
+            }
+            return result;
+        }
+
         _handleDragStart(event, cardEl, card) {
             if (!this._options.allowCardDrag) {
                 event.preventDefault();
@@ -1370,6 +1991,9 @@
         }
 
         _applyOptions(rest) {
+            this._cardEls.clear();
+            this._boardRevision += 1;
+            this._invalidateBuckets();
             const next = Object.assign({}, rest);
             const dataKeys = ["columns", "cards", "lanes"];
             dataKeys.forEach((key) => delete next[key]);
@@ -1410,10 +2034,16 @@
             if (next.boardId !== undefined) {
                 this._options.boardId = next.boardId;
             }
+            if (next.cardWindowSize !== undefined) {
+                const size = Number(next.cardWindowSize);
+                this._options.cardWindowSize = Number.isFinite(size) && size > 0 ? Math.floor(size) : 0;
+            }
         }
 
         _applyColumns(columns) {
             const normalized = (columns || []).map((column) => this._normalizeColumn(column));
+            this._cardEls.clear();
+            this._boardRevision += 1;
             this._columns = normalized.sort((a, b) => {
                 const orderA = typeof a.order === "number" ? a.order : Number.MAX_SAFE_INTEGER;
                 const orderB = typeof b.order === "number" ? b.order : Number.MAX_SAFE_INTEGER;
@@ -1423,12 +2053,24 @@
         }
 
         _applyCards(cards) {
+            const previous = new Map(this._cards);
             this._cards.clear();
+            this._cardEls.clear();
             (cards || []).forEach((card) => {
                 const normalized = this._normalizeCard(card);
                 this._cards.set(normalized.id, normalized);
+                if (!sameCardData(previous.get(normalized.id), normalized)) {
+                    this._bumpRevision(normalized.id);
+                }
+            });
+            previous.forEach((_card, cardId) => {
+                if (!this._cards.has(cardId)) {
+                    this._revisions.delete(cardId);
+                    this._templateCache.delete(cardId);
+                }
             });
             this._columns.forEach((column) => { column.cards = []; });
+            this._invalidateBuckets();
             this._cards.forEach((card) => {
                 const column = this._getColumn(card.status);
                 if (column) {
@@ -1438,6 +2080,8 @@
         }
 
         _applyLanes(lanes) {
+            this._cardEls.clear();
+            this._boardRevision += 1;
             if (!Array.isArray(lanes)) {
                 this._lanes = [];
                 return;
@@ -1463,12 +2107,18 @@
                         typeof card === "string" ? { id: card, status: column.id } : card,
                         column.id,
                     );
-                    this._cards.set(normalized.id, Object.assign({}, this._cards.get(normalized.id) || {}, normalized));
+                    const previous = this._cards.get(normalized.id);
+                    const merged = Object.assign({}, previous || {}, normalized);
+                    this._cards.set(normalized.id, merged);
+                    if (!sameCardData(previous, merged)) {
+                        this._bumpRevision(normalized.id);
+                    }
                     collected.push(normalized.id);
                     seen.add(normalized.id);
                 });
                 column.cards = collected;
             });
+            this._invalidateBuckets();
             this._cards.forEach((_, cardId) => {
                 if (!seen.has(cardId)) {
                     const card = this._cards.get(cardId);
@@ -1551,39 +2201,35 @@
                 return this._lanes;
             }
 
-            const extracted = new Map();
-            this._cards.forEach((card) => {
-                const laneId = card[this._options.laneField] || card.lane || null;
-                if (!laneId) {
-                    return;
-                }
-                if (!extracted.has(laneId)) {
-                    extracted.set(laneId, {
-                        id: laneId,
-                        title: laneId,
-                    });
-                }
-            });
+            if (!this._derivedLanes) {
+                const extracted = new Map();
+                this._cards.forEach((card) => {
+                    const laneId = this._laneKeyOf(card);
+                    if (!laneId) {
+                        return;
+                    }
+                    if (!extracted.has(laneId)) {
+                        extracted.set(laneId, {
+                            id: laneId,
+                            title: laneId,
+                        });
+                    }
+                });
+                this._derivedLanes = Array.from(extracted.values());
+            }
 
-            if (!extracted.size) {
+            if (!this._derivedLanes.length) {
                 return [{ id: null, title: null }];
             }
 
-            return Array.from(extracted.values());
+            return this._derivedLanes;
         }
 
         _getCardsForColumn(column, lane) {
-            const laneId = this._options.enableLanes
-                ? (lane && typeof lane === "object" ? (lane.id || null) : null)
-                : null;
             const cards = [];
-            column.cards.forEach((cardId) => {
+            this._getBucket(column, lane).forEach((cardId) => {
                 const card = this._cards.get(cardId);
-                if (!card) {
-                    return;
-                }
-                const currentLane = card[this._options.laneField] || card.lane || null;
-                if (!this._options.enableLanes || laneId === null || currentLane === laneId) {
+                if (card) {
                     cards.push(card);
                 }
             });
@@ -1591,7 +2237,106 @@
         }
 
         _countColumnCards(column, lane) {
-            return this._getCardsForColumn(column, lane).length;
+            return this._getBucket(column, lane).length;
+        }
+
+        // ------------------------------------------------------------------
+        // (lane, column) bucket index
+        // ------------------------------------------------------------------
+
+        _laneKeyOf(card) {
+            return card[this._options.laneField] || card.lane || null;
+        }
+
+        // Ordered card ids shown in (column, lane). Without lanes (or for a
+        // lane without id) that is the whole column.
+        _getBucket(column, lane) {
+            const laneId = this._options.enableLanes
+                ? (lane && typeof lane === "object" ? (lane.id || null) : null)
+                : null;
+            if (laneId === null) {
+                return column.cards;
+            }
+            return this._columnBuckets(column).get(laneId) || [];
+        }
+
+        _columnBuckets(column) {
+            let buckets = this._buckets.get(column.id);
+            if (!buckets || this._staleBuckets.has(column.id)) {
+                buckets = new Map();
+                column.cards.forEach((cardId) => {
+                    const card = this._cards.get(cardId);
+                    if (!card) {
+                        return;
+                    }
+                    const laneId = this._laneKeyOf(card);
+                    const bucket = buckets.get(laneId);
+                    if (bucket) {
+                        bucket.push(cardId);
+                    } else {
+                        buckets.set(laneId, [cardId]);
+                    }
+                });
+                this._buckets.set(column.id, buckets);
+                this._staleBuckets.delete(column.id);
+            }
+            return buckets;
+        }
+
+        _invalidateBuckets(columnId) {
+            if (columnId === undefined) {
+                this._buckets.clear();
+                this._staleBuckets.clear();
+                this._derivedLanes = null;
+                return;
+            }
+            this._staleBuckets.add(columnId);
+        }
+
+        // Remove a card id from its column and bucket. Looks in the card's
+        // own column first and only scans the board if it is not there.
+        _detachCardId(cardId, card) {
+            let column = this._getColumn(card.status);
+            let index = column ? column.cards.indexOf(cardId) : -1;
+            if (index < 0) {
+                column = this._columns.find((candidate) => candidate.cards.includes(cardId));
+                index = column ? column.cards.indexOf(cardId) : -1;
+            }
+            if (!column || index < 0) {
+                return -1;
+            }
+            column.cards.splice(index, 1);
+            const buckets = this._buckets.get(column.id);
+            if (buckets && !this._staleBuckets.has(column.id)) {
+                const bucket = buckets.get(this._laneKeyOf(card));
+                const position = bucket ? bucket.indexOf(cardId) : -1;
+                if (position >= 0) {
+                    bucket.splice(position, 1);
+                } else {
+                    this._staleBuckets.add(column.id);
+                }
+            }
+            return index;
+        }
+
+        // Record `card` at `columnIndex` of column.cards in its bucket.
+        // Appends are O(1); inserts in the middle regroup the column lazily.
+        _bucketInsert(column, card, columnIndex) {
+            const buckets = this._buckets.get(column.id);
+            if (!buckets || this._staleBuckets.has(column.id)) {
+                return;
+            }
+            if (columnIndex !== column.cards.length - 1) {
+                this._staleBuckets.add(column.id);
+                return;
+            }
+            const laneId = this._laneKeyOf(card);
+            const bucket = buckets.get(laneId);
+            if (bucket) {
+                bucket.push(card.id);
+            } else {
+                buckets.set(laneId, [card.id]);
+            }
         }
 
         _resolveTheme(theme) {
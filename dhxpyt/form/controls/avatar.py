@@ -3,10 +3,10 @@ pyTincture Avatar control implementation
 """
 
 from typing import Any, Callable, Dict, List, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .avatar_config import AvatarConfig
 
 
@@ -16,7 +16,8 @@ class Avatar:
         if config is None:
             config = AvatarConfig()
         config_dict = config.to_dict()
-        self.avatar = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.avatar = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ Avatar API Functions """
 
@@ -35,6 +36,9 @@ class Avatar:
     def destructor(self) -> None:
         """Removes the Avatar instance and releases the occupied resources."""
         self.avatar.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the Avatar control."""
@@ -74,15 +78,15 @@ class Avatar:
 
     def send(self, params: Dict[str, Any] = None) -> None:
         """Sends a POST request for a file upload to a server-side URL."""
-        self.avatar.send(js.JSON.parse(json.dumps(params or {})))
+        self.avatar.send(to_js(params or {}))
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing available configuration attributes of the control dynamically."""
-        self.avatar.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.avatar.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, value: Dict[str, Any]) -> None:
         """Sets the value for the Avatar control."""
-        self.avatar.setValue(js.JSON.parse(json.dumps(value)))
+        self.avatar.setValue(to_js(value))
 
     def show(self) -> None:
         """Shows the Avatar control on the page."""
@@ -90,7 +94,7 @@ class Avatar:
 
     def validate(self, silent: bool = False, validate_value: Dict[str, Any] = None) -> bool:
         """Validates the Avatar control."""
-        return self.avatar.validate(silent, js.JSON.parse(json.dumps(validate_value or {})))
+        return self.avatar.validate(silent, to_js(validate_value or {}))
 
     """ Avatar Events """
 
@@ -3,10 +3,10 @@ pyTincture Button control implementation
 """
 
 from typing import Any, Callable, Dict, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .button_config import ButtonConfig
 
 
@@ -16,7 +16,7 @@ class Button:
         if config is None:
             config = ButtonConfig()
         config_dict = config.to_dict()
-        self.button = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.button = js.dhx.FormControl.new(widget_parent, to_js(config_dict))
 
     """ Button API Functions """
 
@@ -58,7 +58,7 @@ class Button:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing available configuration attributes of the control dynamically."""
-        self.button.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.button.setProperties(to_js(properties))
 
     def show(self) -> None:
         """Shows the Button control on the page."""
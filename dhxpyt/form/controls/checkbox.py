@@ -2,11 +2,11 @@
 Checkbox control implementation for the Form widget
 """
 
-import json
-from typing import Any, Callable, Dict, Union
+from typing import Any, Callable, Dict, List, Union
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .checkbox_config import CheckboxConfig
 
 
@@ -16,7 +16,8 @@ class Checkbox:
         if config is None:
             config = CheckboxConfig()
         config_dict = config.to_dict()
-        self.checkbox = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.checkbox = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ Checkbox API Functions """
 
@@ -35,6 +36,9 @@ class Checkbox:
     def destructor(self) -> None:
         """Removes the Checkbox instance and releases the occupied resources."""
         self.checkbox.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the Checkbox control."""
@@ -74,7 +78,7 @@ class Checkbox:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.checkbox.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.checkbox.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, checked: bool) -> None:
         """Sets the state for the Checkbox control."""
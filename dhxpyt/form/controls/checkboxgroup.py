@@ -2,11 +2,11 @@
 CheckboxGroup control implementation for the Form widget
 """
 
-import json
-from typing import Any, Callable, Dict, Union
+from typing import Any, Callable, Dict, List, Union
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .checkboxgroup_config import CheckboxGroupConfig
 
 
@@ -16,7 +16,8 @@ class CheckboxGroup:
         if config is None:
             config = CheckboxGroupConfig()
         config_dict = config.to_dict()
-        self.checkboxgroup = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.checkboxgroup = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ CheckboxGroup API Functions """
 
@@ -35,6 +36,9 @@ class CheckboxGroup:
     def destructor(self) -> None:
         """Removes the CheckboxGroup instance and releases the occupied resources."""
         self.checkboxgroup.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self, id: str = None) -> None:
         """Disables the CheckboxGroup control or a specific checkbox."""
@@ -75,16 +79,15 @@ class CheckboxGroup:
     def set_properties(self, arg: Union[str, Dict[str, Any]] = None, properties: Dict[str, Any] = None) -> None:
         """Allows changing configuration attributes of the control dynamically."""
         if isinstance(arg, str):
-            self.checkboxgroup.setProperties(arg, js.JSON.parse(json.dumps(properties)))
+            self.checkboxgroup.setProperties(arg, to_js(properties, proxies=self._config_proxies))
         elif isinstance(arg, dict):
-            props = {k: js.JSON.parse(json.dumps(v)) for k, v in arg.items()}
-            self.checkboxgroup.setProperties(props)
+            self.checkboxgroup.setProperties(to_js(arg, proxies=self._config_proxies))
         else:
-            self.checkboxgroup.setProperties(js.JSON.parse(json.dumps(properties or {})))
+            self.checkboxgroup.setProperties(to_js(properties or {}, proxies=self._config_proxies))
 
     def set_value(self, value: Dict[str, Union[str, bool]]) -> None:
         """Sets the value for the CheckboxGroup control."""
-        self.checkboxgroup.setValue(js.JSON.parse(json.dumps(value)))
+        self.checkboxgroup.setValue(to_js(value))
 
     def show(self, id: str = None) -> None:
         """Shows the CheckboxGroup control or a specific checkbox."""
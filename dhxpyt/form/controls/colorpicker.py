@@ -2,12 +2,11 @@
 ColorPicker control implementation for the Form widget
 """
 
-import json
-from typing import Any, Callable, Dict, Union
-import json
+from typing import Any, Callable, Dict, List, Union
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .colorpicker_config import ColorpickerConfig
 
 
@@ -17,7 +16,8 @@ class Colorpicker:
         if config is None:
             config = ColorPickerConfig()
         config_dict = config.to_dict()
-        self.colorpicker = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.colorpicker = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ ColorPicker API Functions """
 
@@ -36,6 +36,9 @@ class Colorpicker:
     def destructor(self) -> None:
         """Removes the ColorPicker instance and releases the occupied resources."""
         self.colorpicker.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the ColorPicker control."""
@@ -75,7 +78,7 @@ class Colorpicker:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.colorpicker.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.colorpicker.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, value: str) -> None:
         """Sets the value for the ColorPicker control (Hex format)."""
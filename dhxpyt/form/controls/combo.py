@@ -3,10 +3,10 @@ Combo control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, Union, List
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .combo_config import ComboConfig
 
 
@@ -16,7 +16,8 @@ class Combo:
         if config is None:
             config = ComboConfig()
         config_dict = config.to_dict()
-        self.combo = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.combo = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ Combo API Functions """
 
@@ -35,6 +36,9 @@ class Combo:
     def destructor(self) -> None:
         """Removes the Combo instance and releases the occupied resources."""
         self.combo.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the Combo control."""
@@ -78,7 +82,7 @@ class Combo:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.combo.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.combo.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, ids: Union[str, int, List[Union[str, int]]]) -> None:
         """Sets the value for the Combo control."""
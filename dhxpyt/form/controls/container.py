@@ -3,10 +3,10 @@ Container control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .container_config import ContainerConfig
 
 
@@ -16,7 +16,7 @@ class Container:
         if config is None:
             config = ContainerConfig()
         config_dict = config.to_dict()
-        self.container = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.container = js.dhx.FormControl.new(widget_parent, to_js(config_dict))
 
     """ Container API Functions """
 
@@ -54,7 +54,7 @@ class Container:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration properties of the control dynamically."""
-        self.container.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.container.setProperties(to_js(properties))
 
     def show(self) -> None:
         """Shows the Container control on the page."""
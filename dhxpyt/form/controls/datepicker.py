@@ -2,11 +2,11 @@
 DatePicker control implementation for the Form widget
 """
 
-from typing import Any, Callable, Dict, Union
-import json
+from typing import Any, Callable, Dict, List, Union
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .datepicker_config import DatepickerConfig
 
 
@@ -16,7 +16,8 @@ class Datepicker:
         if config is None:
             config = DatePickerConfig()
         config_dict = config.to_dict()
-        self.datepicker = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.datepicker = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ DatePicker API Functions """
 
@@ -35,6 +36,9 @@ class Datepicker:
     def destructor(self) -> None:
         """Removes the DatePicker instance and releases the occupied resources."""
         self.datepicker.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the DatePicker control."""
@@ -74,7 +78,7 @@ class Datepicker:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.datepicker.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.datepicker.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, value: Union[str, Any]) -> None:
         """Sets a date in the DatePicker control."""
@@ -3,10 +3,10 @@ Fieldset control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, List, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .fieldset_config import FieldsetConfig
 
 
@@ -16,7 +16,7 @@ class Fieldset:
         if config is None:
             config = FieldsetConfig()
         config_dict = config.to_dict()
-        self.fieldset = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.fieldset = js.dhx.FormControl.new(widget_parent, to_js(config_dict))
 
     """ Fieldset API Functions """
 
@@ -58,7 +58,7 @@ class Fieldset:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.fieldset.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.fieldset.setProperties(to_js(properties))
 
     def show(self) -> None:
         """Shows the Fieldset control on the page."""
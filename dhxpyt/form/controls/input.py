@@ -2,11 +2,11 @@
 Input control implementation for the Form widget
 """
 
-from typing import Any, Callable, Dict, Union
-import json
+from typing import Any, Callable, Dict, List, Union
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .input_config import InputConfig
 
 
@@ -16,7 +16,8 @@ class Input:
         if config is None:
             config = InputConfig()
         config_dict = config.to_dict()
-        self.input = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.input = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ Input API Functions """
 
@@ -35,6 +36,9 @@ class Input:
     def destructor(self) -> None:
         """Removes the Input instance and releases the occupied resources."""
         self.input.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the Input control."""
@@ -70,7 +74,7 @@ class Input:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.input.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.input.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, value: Union[str, int]) -> None:
         """Sets the value for the Input control."""
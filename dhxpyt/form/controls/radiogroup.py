@@ -3,10 +3,10 @@ RadioGroup control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, Union, List
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .radiogroup_config import RadioGroupConfig
 
 
@@ -17,7 +17,7 @@ class RadioGroup:
             config = RadioGroupConfig()
         config_dict = config.to_dict()
         print(config_dict)
-        self.radiogroup = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.radiogroup = js.dhx.FormControl.new(widget_parent, to_js(config_dict))
 
     """ RadioGroup API Functions """
 
@@ -74,10 +74,10 @@ class RadioGroup:
         """Allows changing configuration attributes of the control dynamically."""
         if isinstance(arg, str):
             # arg is id, props is properties
-            self.radiogroup.setProperties(arg, js.JSON.parse(json.dumps(props)))
+            self.radiogroup.setProperties(arg, to_js(props))
         else:
             # arg is properties, props is None
-            self.radiogroup.setProperties(js.JSON.parse(json.dumps(arg)))
+            self.radiogroup.setProperties(to_js(arg))
 
     def set_value(self, value: str) -> None:
         """Sets the value for the RadioGroup control."""
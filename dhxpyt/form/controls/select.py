@@ -3,10 +3,10 @@ Select control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, Union, List
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .select_config import SelectConfig
 
 
@@ -16,7 +16,8 @@ class Select:
         if config is None:
             config = SelectConfig()
         config_dict = config.to_dict()
-        self.select = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.select = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ Select API Functions """
 
@@ -35,6 +36,9 @@ class Select:
     def destructor(self) -> None:
         """Removes the Select instance and releases the occupied resources."""
         self.select.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self, value: Union[str, int] = None) -> None:
         """Disables the Select control or a specific option."""
@@ -75,11 +79,11 @@ class Select:
 
     def set_options(self, options: List[Dict[str, Any]]) -> None:
         """Allows changing a list of Select options dynamically."""
-        self.select.setOptions(js.JSON.parse(json.dumps(options)))
+        self.select.setOptions(to_js(options))
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.select.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.select.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, value: Union[str, int]) -> None:
         """Sets the value for the Select control."""
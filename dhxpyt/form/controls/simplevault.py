@@ -3,10 +3,10 @@ SimpleVault control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, Union, List
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .simplevault_config import SimpleVaultConfig
 
 
@@ -16,7 +16,8 @@ class SimpleVault:
         if config is None:
             config = SimpleVaultConfig()
         config_dict = config.to_dict()
-        self.simplevault = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.simplevault = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ SimpleVault API Functions """
 
@@ -35,6 +36,9 @@ class SimpleVault:
     def destructor(self) -> None:
         """Removes the SimpleVault instance and releases the occupied resources."""
         self.simplevault.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the SimpleVault control."""
@@ -79,11 +83,11 @@ class SimpleVault:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.simplevault.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.simplevault.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, value: List[Dict[str, Any]]) -> None:
         """Sets the value for the SimpleVault control."""
-        self.simplevault.setValue(js.JSON.parse(json.dumps(value)))
+        self.simplevault.setValue(to_js(value))
 
     def show(self) -> None:
         """Shows the SimpleVault control on the page."""
@@ -3,10 +3,10 @@ Slider control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, List, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .slider_config import SliderConfig
 
 
@@ -16,7 +16,8 @@ class Slider:
         if config is None:
             config = SliderConfig()
         config_dict = config.to_dict()
-        self.slider = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.slider = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ Slider API Functions """
 
@@ -31,6 +32,9 @@ class Slider:
     def destructor(self) -> None:
         """Removes the Slider instance and releases the occupied resources."""
         self.slider.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the Slider control."""
@@ -70,7 +74,7 @@ class Slider:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.slider.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.slider.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, value: Union[float, List[float]]) -> None:
         """Sets the value for the Slider control."""
@@ -3,10 +3,10 @@ Spacer control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .spacer_config import SpacerConfig
 
 
@@ -16,7 +16,7 @@ class Spacer:
         if config is None:
             config = SpacerConfig()
         config_dict = config.to_dict()
-        self.spacer = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.spacer = js.dhx.FormControl.new(widget_parent, to_js(config_dict))
 
     """ Spacer API Functions """
 
@@ -38,7 +38,7 @@ class Spacer:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.spacer.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.spacer.setProperties(to_js(properties))
 
     def show(self) -> None:
         """Shows the Spacer control on the page."""
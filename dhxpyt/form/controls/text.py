@@ -3,10 +3,10 @@ Text control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .text_config import TextConfig
 
 
@@ -16,7 +16,7 @@ class Text:
         if config is None:
             config = TextConfig()
         config_dict = config.to_dict()
-        self.text = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.text = js.dhx.FormControl.new(widget_parent, to_js(config_dict))
 
     """ Text API Functions """
 
@@ -58,7 +58,7 @@ class Text:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.text.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.text.setProperties(to_js(properties))
 
     def set_value(self, value: Union[str, int]) -> None:
         """Sets the value for the Text control."""
@@ -2,11 +2,11 @@
 Textarea control implementation for the Form widget
 """
 
-from typing import Any, Callable, Dict, Union
-import json
+from typing import Any, Callable, Dict, List, Union
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .textarea_config import TextareaConfig
 
 
@@ -16,7 +16,8 @@ class Textarea:
         if config is None:
             config = TextareaConfig()
         config_dict = config.to_dict()
-        self.textarea = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.textarea = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ Textarea API Functions """
 
@@ -35,6 +36,9 @@ class Textarea:
     def destructor(self) -> None:
         """Removes the Textarea instance and releases the occupied resources."""
         self.textarea.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the Textarea control."""
@@ -70,7 +74,7 @@ class Textarea:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.textarea.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.textarea.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, value: str) -> None:
         """Sets the value for the Textarea control."""
@@ -2,11 +2,11 @@
 TimePicker control implementation for the Form widget
 """
 
-from typing import Any, Callable, Dict, Union
-import json
+from typing import Any, Callable, Dict, List, Union
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .timepicker_config import TimepickerConfig
 
 
@@ -16,7 +16,8 @@ class Timepicker:
         if config is None:
             config = TimepickerConfig()
         config_dict = config.to_dict()
-        self.timepicker = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.timepicker = js.dhx.FormControl.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ TimePicker API Functions """
 
@@ -35,6 +36,9 @@ class Timepicker:
     def destructor(self) -> None:
         """Removes the TimePicker instance and releases the occupied resources."""
         self.timepicker.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the TimePicker control."""
@@ -74,7 +78,7 @@ class Timepicker:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.timepicker.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.timepicker.setProperties(to_js(properties, proxies=self._config_proxies))
 
     def set_value(self, value: Union[str, int, float, Dict[str, Any], list]) -> None:
         """Sets the value for the TimePicker control."""
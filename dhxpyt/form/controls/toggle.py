@@ -3,10 +3,10 @@ Toggle control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .toggle_config import ToggleConfig
 
 
@@ -16,7 +16,7 @@ class Toggle:
         if config is None:
             config = ToggleConfig()
         config_dict = config.to_dict()
-        self.toggle = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.toggle = js.dhx.FormControl.new(widget_parent, to_js(config_dict))
 
     """ Toggle API Functions """
 
@@ -66,7 +66,7 @@ class Toggle:
 
     def set_properties(self, properties: Dict[str, Any]) -> None:
         """Allows changing configuration attributes of the control dynamically."""
-        self.toggle.setProperties(js.JSON.parse(json.dumps(properties)))
+        self.toggle.setProperties(to_js(properties))
 
     def set_value(self, selected: bool) -> None:
         """Sets the state for the Toggle control."""
@@ -3,10 +3,10 @@ ToggleGroup control implementation for the Form widget
 """
 
 from typing import Any, Callable, Dict, Union, List
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ...marshalling import to_js
 from .togglegroup_config import ToggleGroupConfig
 
 
@@ -16,7 +16,7 @@ class ToggleGroup:
         if config is None:
             config = ToggleGroupConfig()
         config_dict = config.to_dict()
-        self.togglegroup = js.dhx.FormControl.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.togglegroup = js.dhx.FormControl.new(widget_parent, to_js(config_dict))
 
     """ ToggleGroup API Functions """
 
@@ -68,11 +68,11 @@ class ToggleGroup:
 
     def set_properties(self, config: Dict[str, Any], id: str = None) -> None:
         """Allows changing configuration attributes dynamically."""
-        self.togglegroup.setProperties(js.JSON.parse(json.dumps(config)), id)
+        self.togglegroup.setProperties(to_js(config), id)
 
     def set_value(self, value: Dict[str, bool]) -> None:
         """Defines the state of the option's elements."""
-        self.togglegroup.setValue(js.JSON.parse(json.dumps(value)))
+        self.togglegroup.setValue(to_js(value))
 
     def show(self, id: str = None) -> None:
         """Shows either an option of ToggleGroup or the whole ToggleGroup."""
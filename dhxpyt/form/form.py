@@ -3,10 +3,10 @@ pyTincture Form widget implementation
 """
 
 from typing import Any, Callable, Dict, List, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .form_config import FormConfig
 
 
@@ -16,7 +16,8 @@ class Form:
         if config is None:
             config = FormConfig()
         config_dict = config.to_dict()
-        self.form = js.dhx.Form.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.form = js.dhx.Form.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ Form API Functions """
 
@@ -31,6 +32,9 @@ class Form:
     def destructor(self) -> None:
         """Removes the Form instance and releases occupied resources."""
         self.form.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the Form."""
@@ -84,16 +88,15 @@ class Form:
     def set_properties(self, arg: Union[str, Dict[str, Dict[str, Any]]], properties: Dict[str, Any] = None) -> None:
         """Allows changing available configuration attributes of Form controls dynamically."""
         if isinstance(arg, str):
-            self.form.setProperties(arg, js.JSON.parse(json.dumps(properties)))
+            self.form.setProperties(arg, to_js(properties, proxies=self._config_proxies))
         elif isinstance(arg, dict):
-            props = {k: js.JSON.parse(json.dumps(v)) for k, v in arg.items()}
-            self.form.setProperties(props)
+            self.form.setProperties(to_js(arg, proxies=self._config_proxies))
         else:
             raise TypeError("Argument must be a string or a dictionary")
 
     def set_value(self, obj: Dict[str, Any]) -> None:
         """Sets values/states for controls."""
-        self.form.setValue(js.JSON.parse(json.dumps(obj)))
+        self.form.setValue(to_js(obj))
 
     def show(self) -> None:
         """Shows the Form on the page."""
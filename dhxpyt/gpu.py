@@ -5,11 +5,12 @@ Only two touchpoints are exposed:
 1) enable_webgpu(**opts): initialize WebGPU globally (adapter/device options optional)
 2) webgpu_status(): inspect availability and readiness
 """
-import json
 from typing import Any, Dict
 
 import js
 
+from .marshalling import to_js
+
 
 async def enable_webgpu(**options: Any) -> Dict[str, Any]:
     """
@@ -22,7 +23,7 @@ async def enable_webgpu(**options: Any) -> Dict[str, Any]:
     if not helper or not hasattr(helper, "enable"):
         return {"supported": False, "enabled": False, "ready": False, "reason": "webgpu helper missing"}
 
-    opts = js.JSON.parse(json.dumps(options or {}))
+    opts = to_js(options or {})
     result = await helper.enable(opts)
     return result.to_py() if hasattr(result, "to_py") else result
 
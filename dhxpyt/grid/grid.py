@@ -2,14 +2,25 @@
 Grid widget implementation
 """
 
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+from array import array
+from collections import OrderedDict
+import asyncio
+import hashlib
+import inspect
 import json
+import logging
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .grid_config import GridConfig
 
 
+# memoryview formats that map onto JS typed arrays
+_NUMERIC_FORMATS = frozenset("bBhHiIlLqQfd")
+
+
 class Grid:
     def __init__(self, config: GridConfig = None, widget_parent: str = None):
         """
@@ -21,7 +32,17 @@ class Grid:
         if config is None:
             config = GridConfig()
         config_dict = config.to_dict()
-        self.grid = js.dhx.Grid.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        data = config_dict.get("data")
+        if isinstance(data, Mapping):
+            # Columnar data is assembled on the JS side once the grid exists
+            del config_dict["data"]
+        self._config_proxies: List[Any] = []
+        self.grid = js.dhx.Grid.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
+        # row key -> digest of the rows last pushed through sync()
+        self._sync_index: Optional[Dict[Any, str]] = None
+        self._source: Optional[Callable[..., Any]] = None
+        if isinstance(data, Mapping):
+            self.load_columns(data)
 
     """ Grid API Functions """
 
@@ -35,7 +56,7 @@ class Grid:
 
     def add_span(self, span_obj: Dict[str, Any]) -> None:
         """Adds a span to the grid."""
-        self.grid.addSpan(js.JSON.parse(json.dumps(span_obj)))
+        self.grid.addSpan(to_js(span_obj))
 
     def adjust_column_width(self, col_id: Union[str, int], adjust: Union[str, bool] = None) -> None:
         """Adjusts the width of a column."""
@@ -44,6 +65,9 @@ class Grid:
     def destructor(self) -> None:
         """Destroys the grid instance and releases resources."""
         self.grid.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def edit_cell(self, row_id: Union[str, int], col_id: Union[str, int], editor_type: str = None) -> None:
         """Enables editing of a grid cell."""
@@ -124,7 +148,7 @@ class Grid:
 
     def set_columns(self, columns: List[Dict[str, Any]]) -> None:
         """Sets configuration for grid columns."""
-        self.grid.setColumns(js.JSON.parse(json.dumps(columns)))
+        self.grid.setColumns(to_js(columns, proxies=self._config_proxies))
 
     def show_column(self, col_id: Union[str, int]) -> None:
         """Shows a hidden column."""
@@ -134,6 +158,245 @@ class Grid:
         """Shows a hidden row."""
         self.grid.showRow(row_id)
 
+    """ Grid Data Functions """
+
+    @staticmethod
+    def _data_helper() -> Any:
+        try:
+            return js.customdhx.gridData
+        except AttributeError as exc:
+            raise RuntimeError(
+                "customdhx.gridData is not available. Ensure the grid JavaScript helpers have been loaded."
+            ) from exc
+
+    @staticmethod
+    def _column_to_js(values: Any) -> Any:
+        """Converts one column to JS, packing numeric data into a single typed array."""
+        try:
+            view = memoryview(values)
+        except TypeError:
+            view = None
+        if view is not None:
+            if view.ndim != 1 or view.format not in _NUMERIC_FORMATS:
+                raise TypeError(f"Unsupported buffer column format: {view.format!r} (ndim={view.ndim})")
+            return to_js(view)
+
+        values = values if isinstance(values, list) else list(values)
+        first = next((value for value in values if value is not None), None)
+        if isinstance(first, (int, float)) and not isinstance(first, bool):
+            try:
+                return to_js(memoryview(array("d", values)))
+            except TypeError:
+                pass
+        return to_js(values)
+
+    def load_columns(self, columns: Mapping[str, Sequence[Any]], append: bool = False) -> int:
+        """
+        Loads data from columnar input instead of a list of row dicts.
+
+        Each value may be a list, an ``array.array`` or any 1-D buffer-protocol
+        object. Numeric columns are shipped as a single typed array and the row
+        objects are assembled on the JS side.
+
+        :param columns: Mapping of column id to the column values.
+        :param append: (Optional) Adds the rows to the existing data instead of replacing it.
+        :return: The number of rows loaded.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got lengths {sorted(lengths)}")
+        length = lengths.pop() if lengths else 0
+        payload = to_js({str(name): self._column_to_js(values) for name, values in columns.items()})
+        options = to_js({"length": length, "append": append})
+        self._sync_index = None
+        return self._data_helper().parseColumns(self.grid, payload, options)
+
+    @staticmethod
+    def _row_digest(row: Dict[str, Any]) -> str:
+        # Digest a canonical dump rather than hash(): hash(-1) == hash(-2) and
+        # hash(1) == hash(True), which would hide real updates
+        canonical = json.dumps(row, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+    def sync(self, rows: Iterable[Dict[str, Any]], key: str = "id") -> Dict[str, int]:
+        """
+        Brings the grid data in line with `rows`, sending only what changed.
+
+        The first call replaces the grid data. Later calls compare each row
+        against the digest recorded on the previous sync and push the inserted,
+        updated and removed rows in a single batched call, so scroll, selection
+        and sort state are kept.
+
+        :param rows: The complete, current set of rows.
+        :param key: (Optional) The row field that uniquely identifies a row. It
+            becomes the grid's row id, so with a key other than "id" rows must not
+            carry a different `id` field of their own.
+        :return: Counts of added, updated and removed rows.
+        """
+        previous = self._sync_index
+        index: Dict[Any, str] = {}
+        added: List[Dict[str, Any]] = []
+        updated: List[Dict[str, Any]] = []
+        for row in rows:
+            row_id = row[key]
+            if key != "id" and row.get("id") not in (None, row_id):
+                raise ValueError(
+                    f"Row {row_id!r} has its own id {row['id']!r}; sync by key={key!r} needs rows without an id field"
+                )
+            if row_id in index:
+                raise ValueError(f"Duplicate row key {row_id!r} in sync data")
+            digest = self._row_digest(row)
+            index[row_id] = digest
+            if previous is None or row_id not in previous:
+                added.append(row)
+            elif previous[row_id] != digest:
+                updated.append(row)
+
+        helper = self._data_helper()
+        if previous is None:
+            helper.applyDiff(self.grid, to_js({"replace": added}), key)
+            removed: List[Any] = []
+        else:
+            removed = [row_id for row_id in previous if row_id not in index]
+            if added or updated or removed:
+                diff = {"add": added, "update": updated, "remove": removed}
+                helper.applyDiff(self.grid, to_js(diff), key)
+        self._sync_index = index
+        return {"added": len(added), "updated": len(updated), "removed": len(removed)}
+
+    """ Grid Lazy Data Source """
+
+    def set_data_source(self, source: Callable[[int, int, Optional[Dict[str, Any]], Any], Any], total: int = None,
+                        page_size: int = 100, cache_pages: int = 20, prefetch: int = 1,
+                        sort: Dict[str, Any] = None, filter: Any = None) -> None:
+        """
+        Backs the grid with a paged data source instead of shipping all rows up front.
+
+        The grid is sized for `total` rows, but only the pages around the scroll
+        position are fetched and kept. Fetched pages are tracked in an LRU of
+        `cache_pages` pages; evicted pages are released back to placeholders.
+        Header sorting is forwarded to the source.
+
+        :param source: Callable (or backend_for_frontend method) invoked as
+            ``source(offset, limit, sort, filter)``. It may be sync or async and must
+            return a list of rows, or a dict with ``rows`` (or ``data``) and ``total``.
+        :param total: (Optional) Total row count. When omitted, the first response must provide it.
+        :param page_size: (Optional) Rows fetched per request.
+        :param cache_pages: (Optional) Maximum number of pages kept in the grid.
+        :param prefetch: (Optional) Number of pages fetched ahead of the visible one.
+        :param sort: (Optional) Initial sort state, e.g. ``{"by": "name", "dir": "asc"}``.
+        :param filter: (Optional) Initial filter, passed through to the source untouched.
+        """
+        if page_size <= 0 or cache_pages <= 0:
+            raise ValueError("page_size and cache_pages must be positive")
+        first_source = self._source is None
+        self._source = source
+        self._page_size = page_size
+        self._cache_pages = max(cache_pages, prefetch + 1)
+        self._prefetch = prefetch
+        if first_source:
+            scroll_proxy = create_proxy(self._on_lazy_scroll)
+            sort_proxy = create_proxy(self._on_lazy_before_sort)
+            self._config_proxies.extend((scroll_proxy, sort_proxy))
+            self.grid.events.on("scroll", scroll_proxy)
+            self.grid.events.on("beforeSort", sort_proxy)
+        self._reset_data_source(total, sort, filter)
+
+    def reload_data_source(self, sort: Dict[str, Any] = None, filter: Any = None, total: int = None) -> None:
+        """Drops all fetched pages and reloads the lazy grid with a new sort/filter state."""
+        if self._source is None:
+            raise RuntimeError("No data source set; call set_data_source() first")
+        self._reset_data_source(total, sort, filter)
+
+    def _reset_data_source(self, total: Optional[int], sort: Optional[Dict[str, Any]], filter: Any) -> None:
+        self._lazy_sort = sort
+        self._lazy_filter = filter
+        self._lazy_total = total
+        self._lazy_generation = getattr(self, "_lazy_generation", 0) + 1
+        # page index -> number of rows materialized in the grid, oldest first
+        self._lazy_pages: "OrderedDict[int, int]" = OrderedDict()
+        self._lazy_pending: set = set()
+        self._sync_index = None
+        if total is not None:
+            self._data_helper().initLazy(self.grid, total)
+        self._request_window(0)
+
+    def _on_lazy_scroll(self, *args) -> None:
+        row_height = self.grid.config.rowHeight or 40
+        first_row = int(self.get_scroll_state().get("y", 0) // row_height)
+        self._request_window(first_row // self._page_size)
+
+    def _on_lazy_before_sort(self, column, direction, *args) -> bool:
+        self.reload_data_source(sort={"by": column.id, "dir": direction}, filter=self._lazy_filter,
+                                total=self._lazy_total)
+        return False
+
+    def _request_window(self, page: int) -> None:
+        last_page = None
+        if self._lazy_total is not None:
+            last_page = max(0, (self._lazy_total - 1) // self._page_size)
+        for index in range(page, page + self._prefetch + 1):
+            if last_page is not None and index > last_page:
+                break
+            self._request_page(index)
+
+    def _request_page(self, page: int) -> None:
+        if page in self._lazy_pages:
+            self._lazy_pages.move_to_end(page)
+            return
+        if page in self._lazy_pending:
+            return
+        self._lazy_pending.add(page)
+        generation = self._lazy_generation
+        try:
+            result = self._source(page * self._page_size, self._page_size, self._lazy_sort, self._lazy_filter)
+        except Exception as exc:
+            self._page_failed(generation, page, exc)
+            return
+        if inspect.isawaitable(result):
+            async def receive():
+                try:
+                    self._receive_page(generation, page, await result)
+                except Exception as exc:
+                    self._page_failed(generation, page, exc)
+            asyncio.ensure_future(receive())
+        else:
+            try:
+                self._receive_page(generation, page, result)
+            except Exception as exc:
+                self._page_failed(generation, page, exc)
+
+    def _page_failed(self, generation: int, page: int, exc: Exception) -> None:
+        # Un-mark the page so the next scroll over it requests it again.
+        if generation == self._lazy_generation:
+            self._lazy_pending.discard(page)
+        logging.warning("[Grid] data source failed for page %s: %s", page, exc)
+
+    def _receive_page(self, generation: int, page: int, result: Any) -> None:
+        if generation != self._lazy_generation:
+            return  # superseded by a reload
+        self._lazy_pending.discard(page)
+        if hasattr(result, "to_py"):
+            result = result.to_py()
+        if isinstance(result, dict):
+            rows = result.get("rows", result.get("data")) or []
+            total = result.get("total", self._lazy_total)
+        else:
+            rows, total = list(result or []), self._lazy_total
+
+        helper = self._data_helper()
+        if self._lazy_total is None:
+            if total is None:
+                raise ValueError("Data source must report 'total' when set_data_source() has no total")
+            self._lazy_total = total
+            helper.initLazy(self.grid, total)
+        helper.fillRange(self.grid, page * self._page_size, to_js(rows))
+        self._lazy_pages[page] = len(rows)
+
+        while len(self._lazy_pages) > self._cache_pages:
+            evicted, count = self._lazy_pages.popitem(last=False)
+            helper.clearRange(self.grid, evicted * self._page_size, count)
+
     """ Grid Event Handlers """
 
     def add_event_handler(self, event_name: str, handler: Callable) -> None:
@@ -277,23 +540,23 @@ class Grid:
         """Exports data from the grid into a CSV string or file."""
         if config is None:
             config = {}
-        result = self.grid.csv(js.JSON.parse(json.dumps(config)))
+        result = self.grid.csv(to_js(config))
         return result
 
     def export_to_pdf(self, config: Dict[str, Any] = None) -> None:
         """Exports data from the grid to a PDF file."""
         if config is None:
             config = {}
-        self.grid.pdf(js.JSON.parse(json.dumps(config)))
+        self.grid.pdf(to_js(config))
 
     def export_to_png(self, config: Dict[str, Any] = None) -> None:
         """Exports data from the grid to a PNG file."""
         if config is None:
             config = {}
-        self.grid.png(js.JSON.parse(json.dumps(config)))
+        self.grid.png(to_js(config))
 
     def export_to_xlsx(self, config: Dict[str, Any] = None) -> None:
         """Exports data from the grid to an Excel file."""
         if config is None:
             config = {}
-        self.grid.xlsx(js.JSON.parse(json.dumps(config)))
+        self.grid.xlsx(to_js(config))
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Sequence, Union
 
 
 class GridColumnConfig:
@@ -98,7 +98,7 @@ class GridConfig:
     """
     def __init__(self,
                  columns: List[GridColumnConfig],
-                 data: List[Dict[str, Any]] = None,
+                 data: Union[List[Dict[str, Any]], Dict[str, Sequence[Any]]] = None,
                  adjust: Union[str, bool] = False,
                  autoEmptyRow: bool = False,
                  autoHeight: bool = False,
@@ -138,7 +138,7 @@ class GridConfig:
         Initializes the GridConfig.
 
         :param columns: (Required) List of column configurations.
-        :param data: (Optional) List of data objects.
+        :param data: (Optional) List of data objects, or a mapping of column id to column values (see Grid.load_columns).
         :param adjust: (Optional) Auto adjust columns.
         :param autoEmptyRow: (Optional) Adds an empty row after the last filled row.
         :param autoHeight: (Optional) Makes long text split into multiple lines.
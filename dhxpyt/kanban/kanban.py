@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
+import contextlib
 import logging
-from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+import uuid
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 import js
 from pyodide.ffi import create_proxy
 
+from ..marshalling import to_js
 from .kanban_config import (
     KanbanCardConfig,
     KanbanColumnConfig,
@@ -17,8 +19,7 @@ from .kanban_config import (
 
 logger = logging.getLogger(__name__)
 WRAPPER_REVISION = "kanban-wrapper/2024-06-02"
-logger.info("Kanban widget wrapper loaded (%s)", WRAPPER_REVISION)
-print(f"[KanbanWidget] Wrapper ready ({WRAPPER_REVISION})")
+logger.debug("Kanban widget wrapper loaded (%s)", WRAPPER_REVISION)
 
 
 class Kanban:
@@ -42,14 +43,15 @@ class Kanban:
         self.config = config or KanbanConfig()
         self._container = container
         self._event_proxies: Dict[str, List[Any]] = {}
+        self._batch_ops: Optional[List[Dict[str, Any]]] = None
+        self._batch_depth = 0
 
         root_element = self._resolve_root(container=container, root=root)
         if root_element is None:
             raise RuntimeError("Unable to resolve root element for Kanban widget.")
 
         config_dict = self.config.to_dict()
-        config_json = json.dumps(config_dict)
-        config_options = js.JSON.parse(config_json)
+        config_options = to_js(config_dict)
 
         widget_cls = self._js_class()
         self.kanban = widget_cls.new(root_element, config_options)
@@ -157,6 +159,40 @@ class Kanban:
     def on_column_toggle(self, handler: Callable[[Dict[str, Any]], Any]) -> None:
         self._bind_event("columnToggle", handler)
 
+    def on_changes(
+        self,
+        handler: Callable[[List[Dict[str, Any]]], Any],
+        coalesce_ms: int = 50,
+    ) -> Callable[[], None]:
+        """
+        Subscribe to the board's ordered change log instead of polling get_state().
+
+        The handler receives a list of change dicts, each with a monotonic ``seq``,
+        a ``type`` ("card:add", "card:update", "card:move", "card:remove" or
+        "board:reset"), the ``cardId`` and ``before``/``after`` snapshots of the
+        fields that changed. After a "board:reset" call get_state() once to resync.
+
+        :param handler: Callable receiving a list of changes.
+        :param coalesce_ms: (Optional) Window in milliseconds used to batch changes into one call.
+        :return: A callable that cancels the subscription.
+        """
+        def wrapped(changes):
+            converted = changes.to_py() if hasattr(changes, "to_py") else changes
+            return handler(list(converted))
+
+        proxy = create_proxy(wrapped)
+        self._event_proxies.setdefault("changes", []).append(proxy)
+        unsubscribe_js = self.kanban.subscribeChanges(proxy, coalesce_ms)
+
+        def unsubscribe() -> None:
+            unsubscribe_js()
+            bucket = self._event_proxies.get("changes", [])
+            if proxy in bucket:
+                bucket.remove(proxy)
+                proxy.destroy()
+
+        return unsubscribe
+
     # ------------------------------------------------------------------
     # Data operations
     # ------------------------------------------------------------------
@@ -202,28 +238,28 @@ class Kanban:
         Low-level hook: forward an entire configuration payload to the JS widget.
         """
         payload = config.to_dict()
-        self.kanban.load(js.JSON.parse(json.dumps(payload)))
+        self.kanban.load(to_js(payload))
 
     def set_columns(
         self,
         columns: Iterable[Union[KanbanColumnConfig, Dict[str, Any]]],
     ) -> None:
         payload = [self._column_to_dict(column) for column in columns]
-        self.kanban.setColumns(js.JSON.parse(json.dumps(payload)))
+        self.kanban.setColumns(to_js(payload))
 
     def set_cards(
         self,
         cards: Iterable[Union[KanbanCardConfig, Dict[str, Any]]],
     ) -> None:
         payload = [self._card_to_dict(card) for card in cards]
-        self.kanban.setCards(js.JSON.parse(json.dumps(payload)))
+        self.kanban.setCards(to_js(payload))
 
     def set_lanes(
         self,
         lanes: Iterable[Union[KanbanLaneConfig, Dict[str, Any]]],
     ) -> None:
         payload = [self._lane_to_dict(lane) for lane in lanes]
-        self.kanban.setLanes(js.JSON.parse(json.dumps(payload)))
+        self.kanban.setLanes(to_js(payload))
 
     def add_card(
         self,
@@ -232,16 +268,27 @@ class Kanban:
         index: Optional[int] = None,
     ) -> str:
         payload = self._card_to_dict(card)
+        if self._batch_ops is not None:
+            payload = dict(payload)
+            payload.setdefault("id", f"card-{uuid.uuid4().hex}")
+            self._batch_ops.append({"op": "add", "card": payload, "index": index})
+            return payload["id"]
         result = self.kanban.addCard(
-            js.JSON.parse(json.dumps(payload)),
+            to_js(payload),
             index if index is None else int(index),
         )
         return result.to_py() if hasattr(result, "to_py") else result
 
     def update_card(self, card_id: str, **updates: Any) -> None:
-        self.kanban.updateCard(card_id, js.JSON.parse(json.dumps(updates)))
+        if self._batch_ops is not None:
+            self._batch_ops.append({"op": "update", "id": card_id, "changes": updates})
+            return
+        self.kanban.updateCard(card_id, to_js(updates))
 
     def remove_card(self, card_id: str) -> None:
+        if self._batch_ops is not None:
+            self._batch_ops.append({"op": "remove", "id": card_id})
+            return
         self.kanban.removeCard(card_id)
 
     def move_card(
@@ -258,11 +305,66 @@ class Kanban:
             "index": index,
         }
         options = {k: v for k, v in options.items() if v is not None}
+        if self._batch_ops is not None:
+            self._batch_ops.append(dict(options, op="move", id=card_id))
+            return
         if options:
-            self.kanban.moveCard(card_id, js.JSON.parse(json.dumps(options)))
+            self.kanban.moveCard(card_id, to_js(options))
         else:
             self.kanban.moveCard(card_id)
 
+    # ------------------------------------------------------------------
+    # Batched updates
+    # ------------------------------------------------------------------
+
+    def _batch_op_to_dict(self, op: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(op, dict) or "op" not in op:
+            raise TypeError(f"Unsupported batch operation: {op!r}")
+        payload = {key: value for key, value in op.items() if value is not None}
+        if "card" in payload:
+            payload["card"] = self._card_to_dict(payload["card"])
+        return payload
+
+    def apply_batch(self, ops: Iterable[Dict[str, Any]]) -> int:
+        """
+        Apply many card operations in one call; the board renders once at the end.
+
+        Each operation is a dict with an ``op`` key:
+        ``{"op": "add", "card": ..., "index": ...}``,
+        ``{"op": "update", "id": ..., "changes": {...}}``,
+        ``{"op": "move", "id": ..., "column": ..., "lane": ..., "index": ...}`` or
+        ``{"op": "remove", "id": ...}``.
+
+        :param ops: Operations, applied in order.
+        :return: Number of operations the board applied.
+        """
+        payload = [self._batch_op_to_dict(op) for op in ops]
+        if not payload:
+            return 0
+        result = self.kanban.applyBatch(to_js(payload))
+        return int(result) if result is not None else 0
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["Kanban"]:
+        """
+        Queue ``add_card``/``update_card``/``move_card``/``remove_card`` calls
+        made inside the block and send them as one ``apply_batch`` on exit.
+        Queued operations are discarded if the block raises.
+        """
+        if self._batch_depth == 0:
+            self._batch_ops = []
+        self._batch_depth += 1
+        completed = False
+        try:
+            yield self
+            completed = True
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                ops, self._batch_ops = self._batch_ops or [], None
+                if completed and ops:
+                    self.apply_batch(ops)
+
     def add_column(
         self,
         column: Union[KanbanColumnConfig, Dict[str, Any]],
@@ -271,13 +373,13 @@ class Kanban:
     ) -> str:
         payload = self._column_to_dict(column)
         result = self.kanban.addColumn(
-            js.JSON.parse(json.dumps(payload)),
+            to_js(payload),
             index if index is None else int(index),
         )
         return result.to_py() if hasattr(result, "to_py") else result
 
     def update_column(self, column_id: str, **updates: Any) -> None:
-        self.kanban.updateColumn(column_id, js.JSON.parse(json.dumps(updates)))
+        self.kanban.updateColumn(column_id, to_js(updates))
 
     def remove_column(self, column_id: str) -> None:
         self.kanban.removeColumn(column_id)
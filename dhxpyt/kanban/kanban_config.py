@@ -146,6 +146,7 @@ class KanbanConfig:
     column_template: Optional[Any] = None
     empty_board_text: Optional[str] = None
     board_id: Optional[str] = None
+    card_window_size: Optional[int] = None
     extra: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -195,6 +196,7 @@ class KanbanConfig:
             "columnTemplate": self.column_template,
             "emptyBoardText": self.empty_board_text,
             "boardId": self.board_id,
+            "cardWindowSize": self.card_window_size,
         }
         payload.update(self.extra or {})
         return _clean_dict(payload)
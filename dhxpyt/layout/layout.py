@@ -2,30 +2,35 @@
 pyTincture layout widget implementation
 """
 
-from typing import Any, Callable, Dict, List, Union, TypeVar
-import json
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Union, TypeVar, TYPE_CHECKING
 from pyodide.ffi import create_proxy
 import js
 from uuid import uuid4
 
-from ..grid import Grid, GridConfig
-from ..toolbar import Toolbar, ToolbarConfig
-from ..sidebar import Sidebar, SidebarConfig
-from ..form import Form, FormConfig
-from ..menu import Menu, MenuConfig
+from ..marshalling import to_js
+from ..widget_registry import load_widget
 from .layout_config import LayoutConfig, CellConfig
-from ..listbox import Listbox, ListboxConfig
-from ..calendar import Calendar, CalendarConfig
-from ..chart import Chart, ChartConfig
-from ..pagination import Pagination, PaginationConfig
-from ..ribbon import Ribbon, RibbonConfig
-from ..tabbar import Tabbar, TabbarConfig
-from ..timepicker import Timepicker, TimepickerConfig
-from ..tree import Tree, TreeConfig
-from ..kanban import Kanban, KanbanConfig
-from ..cardflow import CardFlow, CardFlowConfig
-from ..cardpanel import CardPanel, CardPanelConfig
-from ..chat import Chat, ChatConfig
+
+if TYPE_CHECKING:
+    from ..grid import Grid, GridConfig
+    from ..toolbar import Toolbar, ToolbarConfig
+    from ..sidebar import Sidebar, SidebarConfig
+    from ..form import Form, FormConfig
+    from ..menu import Menu, MenuConfig
+    from ..listbox import Listbox, ListboxConfig
+    from ..calendar import Calendar, CalendarConfig
+    from ..chart import Chart, ChartConfig
+    from ..pagination import Pagination, PaginationConfig
+    from ..ribbon import Ribbon, RibbonConfig
+    from ..tabbar import Tabbar, TabbarConfig
+    from ..timepicker import Timepicker, TimepickerConfig
+    from ..tree import Tree, TreeConfig
+    from ..kanban import Kanban, KanbanConfig
+    from ..cardflow import CardFlow, CardFlowConfig
+    from ..cardpanel import CardPanel, CardPanelConfig
+    from ..chat import Chat, ChatConfig
 
 
 TLayout = TypeVar("TLayout", bound="Layout")
@@ -55,9 +60,9 @@ class Layout(object, metaclass=LoadUICaller):
             ).to_dict()
 
         if mainwindow:
-            self.layout = js.dhx.Layout.new("maindiv", js.JSON.parse(json.dumps(mainconfig)))
+            self.layout = js.dhx.Layout.new("maindiv", to_js(mainconfig))
         else:
-            self.layout = js.dhx.Layout.new(None, js.JSON.parse(json.dumps(mainconfig)))
+            self.layout = js.dhx.Layout.new(None, to_js(mainconfig))
             
         self.initialized = False
 
@@ -69,11 +74,11 @@ class Layout(object, metaclass=LoadUICaller):
 
     def add_grid(self, id: str = "mainwindow", grid_config: GridConfig = None) -> Grid:
         """Adds a Grid widget into a Layout cell."""
-        grid_widget = Grid(config=grid_config)
+        grid_widget = load_widget("Grid")(config=grid_config)
         self.attach(id, grid_widget.grid)
-        if grid_config.data:
+        if grid_config.data and not isinstance(grid_config.data, dict):
             grid_widget.grid.data.removeAll()
-            grid_widget.grid.data.parse(js.JSON.parse(json.dumps(grid_config.data)))
+            grid_widget.grid.data.parse(to_js(grid_config.data))
         return grid_widget
 
     # Define a function to wait for the element to be ready
@@ -94,7 +99,7 @@ class Layout(object, metaclass=LoadUICaller):
         self.wait_for_element(f"#{self.kanban_div_id}", self.create_kanban)
 
     def create_kanban(self):
-        return_kanban = Kanban(config=self.kanban_config, root=f"#{self.kanban_div_id}")
+        return_kanban = load_widget("Kanban")(config=self.kanban_config, root=f"#{self.kanban_div_id}")
         current_theme = js.document.documentElement.getAttribute('data-dhx-theme')
         if current_theme == "dark":
             theme = "dark"
@@ -113,88 +118,88 @@ class Layout(object, metaclass=LoadUICaller):
     
     def add_menu(self, id: str = "mainwindow_header", menu_config: MenuConfig = None) -> Menu:
         """ Adds a Layout into a Layout cell """
-        menu_widget = Menu(config=menu_config)
+        menu_widget = load_widget("Menu")(config=menu_config)
         self.attach(id, menu_widget.menu)
         return menu_widget
 
     def add_toolbar(self, id: str = "mainwindow", toolbar_config: ToolbarConfig = None) -> Toolbar:
         """Adds a Toolbar widget into a Layout cell."""
-        toolbar_widget = Toolbar(config=toolbar_config)
+        toolbar_widget = load_widget("Toolbar")(config=toolbar_config)
         self.attach(id, toolbar_widget.toolbar)
         return toolbar_widget
 
     def add_sidebar(self, id: str, sidebar_config: SidebarConfig = None) -> Sidebar:
         """Adds a Sidebar widget into a Layout cell."""
-        sidebar_widget = Sidebar(config=sidebar_config)
+        sidebar_widget = load_widget("Sidebar")(config=sidebar_config)
         self.attach(id, sidebar_widget.sidebar)
         return sidebar_widget
 
     def add_form(self, id: str, form_config: FormConfig = None) -> Form:
         """Adds a Form widget into a Layout cell."""
-        form_widget = Form(config=form_config)
+        form_widget = load_widget("Form")(config=form_config)
         self.attach(id, form_widget.form)
         return form_widget
     
     def add_listbox(self, id: str, listbox_config: ListboxConfig = None) -> Any:
         """Adds a Listbox widget into a Layout cell."""
-        listbox_widget = Listbox(config=listbox_config)
+        listbox_widget = load_widget("Listbox")(config=listbox_config)
         self.attach(id, listbox_widget.listbox)
         return listbox_widget
     
     def add_calendar(self, id: str, calendar_config: CalendarConfig = None) -> Any:
         """Adds a Calendar widget into a Layout cell."""
-        calendar_widget = Calendar(config=calendar_config)
+        calendar_widget = load_widget("Calendar")(config=calendar_config)
         self.attach(id, calendar_widget.calendar)
         return calendar_widget
     
     def add_chart(self, id: str, chart_config: ChartConfig = None) -> Any:
         """Adds a Chart widget into a Layout cell."""
-        chart_widget = Chart(config=chart_config)
+        chart_widget = load_widget("Chart")(config=chart_config)
         self.attach(id, chart_widget.chart)
         return chart_widget
     
     def add_pagination(self, id: str, pagination_config: PaginationConfig = None) -> Any:
         """Adds a Pagination widget into a Layout cell."""
-        pagination_widget = Pagination(config=pagination_config)
+        pagination_widget = load_widget("Pagination")(config=pagination_config)
         self.attach(id, pagination_widget.pagination)
         return pagination_widget
     
     def add_cardflow(self, id: str, cardflow_config: CardFlowConfig = None) -> Any:
         """Adds a CardFlow widget into a Layout cell."""
-        cardflow_widget = CardFlow(config=cardflow_config, container=self.layout.getCell(id))
+        cardflow_widget = load_widget("CardFlow")(config=cardflow_config, container=self.layout.getCell(id))
         return cardflow_widget
     
     def add_cardpanel(self, id: str, cardpanel_config: CardPanelConfig = None) -> CardPanel:
         """Adds a CardPanel widget into a Layout cell."""
-        cardpanel_widget = CardPanel(config=cardpanel_config, container=self.layout.getCell(id))
+        cardpanel_widget = load_widget("CardPanel")(config=cardpanel_config, container=self.layout.getCell(id))
         return cardpanel_widget
     
     def add_chat(self, id: str, chat_config: ChatConfig = None) -> Chat:
         """Adds a Chat widget into a Layout cell."""
-        chat_widget = Chat(config=chat_config, container=self.layout.getCell(id))
+        chat_widget = load_widget("Chat")(config=chat_config, container=self.layout.getCell(id))
         return chat_widget
     
     def add_ribbon(self, id: str, ribbon_config: RibbonConfig = None) -> Any:
         """Adds a Ribbon widget into a Layout cell."""
-        ribbon_widget = Ribbon(config=ribbon_config)
+        ribbon_widget = load_widget("Ribbon")(config=ribbon_config)
         self.attach(id, ribbon_widget.ribbon)
         return ribbon_widget
     
     def add_tabbar(self, id: str, tabbar_config: TabbarConfig = None) -> Any:
         """Adds a Tabbar widget into a Layout cell."""
-        tabbar_widget = Tabbar(config=tabbar_config)
+        tabbar_widget = load_widget("Tabbar")(config=tabbar_config)
         self.attach(id, tabbar_widget.tabbar)
         return tabbar_widget
     
     def add_timepicker(self, id: str, timepicker_config: TimepickerConfig = None) -> Any:
         """Adds a Timepicker widget into a Layout cell."""
-        timepicker_widget = Timepicker(config=timepicker_config)
+        timepicker_widget = load_widget("Timepicker")(config=timepicker_config)
         self.attach(id, timepicker_widget.timepicker)
         return timepicker_widget
     
     def add_tree(self, id: str, tree_config: TreeConfig = None) -> Any:
         """Adds a Tree widget into a Layout cell."""
-        tree_widget = Tree(config=tree_config)
+        tree_widget = load_widget("Tree")(config=tree_config)
         self.attach(id, tree_widget.tree)
         return tree_widget
         
@@ -334,7 +339,7 @@ class Layout(object, metaclass=LoadUICaller):
 
     def attach(self, id: str, component: Union[str, Any], config: Dict[str, Any] = None) -> Any:
         """Attaches a component or HTML content to a cell."""
-        return self.layout.getCell(id).attach(component, js.JSON.parse(json.dumps(config or {})))
+        return self.layout.getCell(id).attach(component, to_js(config or {}))
 
     def attach_html(self, id: str, html: str) -> None:
         """Inserts HTML content into a cell."""
@@ -3,10 +3,10 @@ ListBox widget implementation
 """
 
 from typing import Any, Callable, Dict, List, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .listbox_config import ListboxConfig
 
 
@@ -21,13 +21,17 @@ class Listbox:
         if config is None:
             config = ListboxConfig()
         config_dict = config.to_dict()
-        self.listbox = js.dhx.List.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.listbox = js.dhx.List.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ ListBox API Functions """
 
     def destructor(self) -> None:
         """Destroys the ListBox instance and releases resources."""
         self.listbox.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def edit_item(self, item_id: Union[str, int]) -> None:
         """Enables editing of an item."""
@@ -0,0 +1,126 @@
+"""
+Python -> JavaScript conversion shared by every widget wrapper.
+
+Widgets used to hand configuration and data to DHTMLX with
+``js.JSON.parse(json.dumps(payload))``, which serialises the payload to a
+Python string and then parses it again in JS. ``to_js`` converts the payload
+directly with ``pyodide.ffi.to_js`` so large row sets are only walked once.
+
+Conversion rules:
+
+* ``dict`` -> plain JS object, ``list``/``tuple`` -> ``Array``
+* objects exposing ``to_dict()`` (the ``*Config`` classes) -> converted dict
+* ``datetime``/``date``/``time`` -> ISO 8601 string
+* ``Decimal`` -> number
+* ``None`` -> ``null`` (as the JSON round trip produced)
+* Python callables -> proxies usable as JS callbacks
+* JS objects (``JsProxy``) pass through; ``undefined`` items of JS arrays
+  inside the payload come out as ``null`` too
+
+Pyodide turns ``None`` into ``undefined``; the JS object builder used for
+every dict maps those values (and ``undefined`` array items) to ``null`` as
+part of the same conversion, so payloads with nullable fields are not walked
+again in Python.
+
+Callable proxies belong to the caller: pass a ``proxies`` list and destroy
+its entries together with the widget.
+"""
+
+import datetime
+from decimal import Decimal
+from typing import Any, Callable, List, Optional
+
+import js
+from pyodide.ffi import create_proxy
+from pyodide.ffi import to_js as _pyodide_to_js
+
+try:
+    from pyodide.ffi import jsnull as _JS_NULL
+except ImportError:  # Pyodide < 0.26 has no way to hand a bare JS null across
+    _JS_NULL = None
+
+__all__ = ["to_js"]
+
+_OBJECT_BUILDER_SOURCE = """
+(function () {
+    function fillArray(items) {
+        for (var i = 0; i < items.length; i++) {
+            var item = items[i];
+            if (item === undefined) {
+                items[i] = null;
+            } else if (Array.isArray(item)) {
+                fillArray(item);
+            }
+        }
+        return items;
+    }
+    function buildObject(entries) {
+        var result = {};
+        for (var entry of entries) {
+            var item = entry[1];
+            if (item === undefined) {
+                item = null;
+            } else if (Array.isArray(item)) {
+                fillArray(item);
+            }
+            result[entry[0]] = item;
+        }
+        return result;
+    }
+    return { buildObject: buildObject, fillArray: fillArray };
+})()
+"""
+
+_object_builder: Any = None
+
+
+def _builder() -> Any:
+    global _object_builder
+    if _object_builder is None:
+        _object_builder = js.eval(_OBJECT_BUILDER_SOURCE)
+    return _object_builder
+
+
+def _make_default_converter(proxies: Optional[List[Any]]) -> Callable[[Any, Callable[[Any], Any], Callable[[Any, Any], None]], Any]:
+    def default_converter(value: Any, convert: Callable[[Any], Any], cache_conversion: Callable[[Any, Any], None]) -> Any:
+        """
+        Fallback invoked by Pyodide for objects it has no built-in conversion for.
+        """
+        if hasattr(value, "to_dict"):
+            return convert(value.to_dict())
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return float(value)
+        if callable(value):
+            proxy = create_proxy(value)
+            if proxies is not None:
+                proxies.append(proxy)
+            return proxy
+        raise TypeError(f"Object of type {type(value).__name__} cannot be converted to JavaScript")
+    return default_converter
+
+
+def to_js(value: Any, proxies: Optional[List[Any]] = None) -> Any:
+    """
+    Convert a Python payload (config dict, row list, config object, ...) into
+    the equivalent JavaScript value without a JSON round trip.
+
+    :param value: The payload to convert.
+    :param proxies: (Optional) List that receives the proxies created for callables;
+        the caller owns them and must destroy them. Wrappers whose payloads can
+        carry callables always pass one.
+    """
+    if hasattr(value, "to_dict"):
+        value = value.to_dict()
+    if value is None:
+        return _JS_NULL
+    builder = _builder()
+    converted = _pyodide_to_js(
+        value,
+        dict_converter=builder.buildObject,
+        default_converter=_make_default_converter(proxies),
+    )
+    if isinstance(value, (list, tuple)):
+        builder.fillArray(converted)
+    return converted
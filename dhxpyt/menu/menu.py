@@ -3,10 +3,10 @@ pyTincture Menu widget implementation
 """
 
 from typing import Any, Callable, Dict, List, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .menu_config import MenuConfig, MenuItemConfig
 
 class Menu:
@@ -15,7 +15,7 @@ class Menu:
         if config is None:
             config = MenuConfig()
         config_dict = config.to_dict()
-        self.menu = js.dhx.Menu.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.menu = js.dhx.Menu.new(widget_parent, to_js(config_dict))
     
     """ Menu API Functions """
     
@@ -117,7 +117,7 @@ class Menu:
     
     @data.setter
     def data(self, value: List[Dict[str, Any]]) -> None:
-        self.menu.data.parse(js.JSON.parse(json.dumps(value)))
+        self.menu.data.parse(to_js(value))
     
     @property
     def menu_css(self) -> str:
@@ -3,10 +3,10 @@ Message widget implementation
 """
 
 from typing import Any
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .message_config import MessageConfig
 
 
@@ -21,7 +21,7 @@ class Message:
             config = MessageConfig()
         config_dict = config.to_dict()
         # Display the message and store the returned message instance
-        self.message = js.dhx.message(None, js.JSON.parse(json.dumps(config_dict)))
+        self.message = js.dhx.message(None, to_js(config_dict))
 
     def close(self) -> None:
         """Closes the message box."""
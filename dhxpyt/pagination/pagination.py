@@ -3,10 +3,10 @@ Pagination widget implementation
 """
 
 from typing import Any, Callable
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .pagination_config import PaginationConfig
 
 
@@ -26,7 +26,7 @@ class Pagination:
         # For now, we will pass the data collection directly
 
         # Create the Pagination instance
-        self.pagination = js.dhx.Pagination.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.pagination = js.dhx.Pagination.new(widget_parent, to_js(config_dict))
 
     """ Pagination API Functions """
 
@@ -3,10 +3,10 @@ Popup widget implementation
 """
 
 from typing import Any, Callable, Dict, Optional, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .popup_config import PopupConfig, PopupShowConfig
 
 
@@ -21,7 +21,7 @@ class Popup:
             config = PopupConfig()
         config_dict = config.to_dict()
         # Create the Popup instance
-        self.popup = js.dhx.Popup.new(None, js.JSON.parse(json.dumps(config_dict)))
+        self.popup = js.dhx.Popup.new(None, to_js(config_dict))
 
     """ Popup API Functions """
 
@@ -35,7 +35,7 @@ class Popup:
         """
         if config is None:
             config = {}
-        component = self.popup.attach(name, js.JSON.parse(json.dumps(config)))
+        component = self.popup.attach(name, to_js(config))
         return component
 
     def attach_html(self, html: str) -> None:
@@ -97,7 +97,7 @@ class Popup:
         """
         if config is None:
             config = {}
-        self.popup.show(node, js.JSON.parse(json.dumps(config)))
+        self.popup.show(node, to_js(config))
 
     """ Popup Event Handlers """
 
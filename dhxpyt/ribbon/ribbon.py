@@ -3,10 +3,10 @@ Ribbon widget implementation
 """
 
 from typing import Any, Callable, Dict, List, Optional, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .ribbon_config import RibbonConfig
 
 
@@ -22,7 +22,7 @@ class Ribbon:
             config = RibbonConfig()
         config_dict = config.to_dict()
         # Create the Ribbon instance
-        self.ribbon = js.dhx.Ribbon.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.ribbon = js.dhx.Ribbon.new(widget_parent, to_js(config_dict))
 
     """ Ribbon API Functions """
 
@@ -70,7 +70,7 @@ class Ribbon:
 
     def set_state(self, state: Dict[str, Any]) -> None:
         """Sets values/states of controls."""
-        self.ribbon.setState(js.JSON.parse(json.dumps(state)))
+        self.ribbon.setState(to_js(state))
 
     def show(self, ids: Union[str, int, List[Union[str, int]]] = None) -> None:
         """Shows an item of Ribbon."""
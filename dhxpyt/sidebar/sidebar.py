@@ -3,10 +3,10 @@ Sidebar widget implementation
 """
 
 from typing import Any, Callable, Dict, List, Optional, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .sidebar_config import SidebarConfig
 
 
@@ -22,7 +22,7 @@ class Sidebar:
             config = SidebarConfig()
         config_dict = config.to_dict()
         # Create the Sidebar instance
-        self.sidebar = js.dhx.Sidebar.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.sidebar = js.dhx.Sidebar.new(widget_parent, to_js(config_dict))
 
     """ Sidebar API Functions """
 
@@ -3,10 +3,10 @@ Slider widget implementation
 """
 
 from typing import Any, Callable, Dict, List, Optional, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .slider_config import SliderConfig
 
 
@@ -20,15 +20,18 @@ class Slider:
         """
         config_dict = config.to_dict()
 
+        self._config_proxies: List[Any] = []
+
         # Handle the tickTemplate function separately
         tick_template = None
         if 'tickTemplate' in config_dict:
             tick_template = config_dict.pop('tickTemplate')
             # Create a proxy for the JavaScript side
             config_dict['tickTemplate'] = create_proxy(tick_template)
+            self._config_proxies.append(config_dict['tickTemplate'])
 
         # Create the Slider instance
-        self.slider = js.dhx.Slider.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.slider = js.dhx.Slider.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
         if tick_template:
             # Assign the tickTemplate function
             self.slider.config.tickTemplate = config_dict['tickTemplate']
@@ -42,6 +45,9 @@ class Slider:
     def destructor(self) -> None:
         """Destroys the slider instance and releases occupied resources."""
         self.slider.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def disable(self) -> None:
         """Disables the slider."""
@@ -1,8 +1,9 @@
-import json
 from typing import Any, Dict, Optional, Union
 
 import js
 
+from .marshalling import to_js
+
 
 def _apply_css_vars(css_vars: Optional[Dict[str, Dict[str, Any]]]) -> None:
     """
@@ -18,7 +19,7 @@ def _apply_css_vars(css_vars: Optional[Dict[str, Dict[str, Any]]]) -> None:
         helper = None
 
     if helper:
-        helper(js.JSON.parse(json.dumps(css_vars)))
+        helper(to_js(css_vars))
 
 
 def apply_theme(theme: Union[str, Dict[str, Any], None], css_vars: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
@@ -30,7 +31,7 @@ def apply_theme(theme: Union[str, Dict[str, Any], None], css_vars: Optional[Dict
     """
     if theme is not None:
         if isinstance(theme, dict):
-            js.dhx.setTheme(js.JSON.parse(json.dumps(theme)))
+            js.dhx.setTheme(to_js(theme))
         elif isinstance(theme, str):
             js.dhx.setTheme(theme)
         else:
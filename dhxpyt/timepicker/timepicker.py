@@ -2,11 +2,11 @@
 TimePicker widget implementation
 """
 
-from typing import Any, Callable, Dict, Optional, Union
-import json
+from typing import Any, Callable, Dict, List, Optional, Union
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .timepicker_config import TimepickerConfig
 
 
@@ -23,7 +23,8 @@ class Timepicker:
         config_dict = config.to_dict()
 
         # Create the TimePicker instance
-        self.timepicker = js.dhx.TimePicker.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.timepicker = js.dhx.TimePicker.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
 
     """ TimePicker API Functions """
@@ -35,6 +36,9 @@ class Timepicker:
     def destructor(self) -> None:
         """Destroys the timepicker instance and releases occupied resources."""
         self.timepicker.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def get_value(self, as_object: bool = False) -> Union[Dict[str, int], str]:
         """
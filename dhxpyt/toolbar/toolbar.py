@@ -3,10 +3,10 @@ Toolbar widget implementation
 """
 
 from typing import Any, Callable, List, Union, Optional
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .toolbar_config import ToolbarConfig
 
 
@@ -22,7 +22,7 @@ class Toolbar:
             config = ToolbarConfig()
         config_dict = config.to_dict()
         # Create the Toolbar instance
-        self.toolbar = js.dhx.Toolbar.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self.toolbar = js.dhx.Toolbar.new(widget_parent, to_js(config_dict))
 
     """ Toolbar API Functions """
 
@@ -73,11 +73,11 @@ class Toolbar:
 
     def set_state(self, state: dict) -> None:
         """Sets values/states of controls."""
-        self.toolbar.setState(js.JSON.parse(json.dumps(state)))
+        self.toolbar.setState(to_js(state))
 
     def update_item(self, id, item_dict: str) -> None:
         """Updates a toolbar item that is already on the toolbar"""
-        self.toolbar.data.update(id, js.JSON.parse(json.dumps(item_dict)))
+        self.toolbar.data.update(id, to_js(item_dict))
 
     def show(self, ids: Union[str, int, List[Union[str, int]]] = None) -> None:
         """Shows items of Toolbar."""
@@ -3,10 +3,10 @@ Tree widget implementation
 """
 
 from typing import Any, Callable, Dict, List, Optional, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .tree_config import TreeConfig
 
 
@@ -22,7 +22,8 @@ class Tree:
             config = TreeConfig()
         config_dict = config.to_dict()
         # Create the Tree instance
-        self.tree = js.dhx.Tree.new(widget_parent, js.JSON.parse(json.dumps(config_dict)))
+        self._config_proxies: List[Any] = []
+        self.tree = js.dhx.Tree.new(widget_parent, to_js(config_dict, proxies=self._config_proxies))
 
     """ Tree API Functions """
 
@@ -41,6 +42,9 @@ class Tree:
     def destructor(self) -> None:
         """Releases the occupied resources."""
         self.tree.destructor()
+        for proxy in self._config_proxies:
+            proxy.destroy()
+        self._config_proxies.clear()
 
     def edit_item(self, id: Union[str, int], config: dict = None) -> None:
         """Edits a tree item."""
@@ -72,7 +76,7 @@ class Tree:
 
     def set_state(self, state: Dict[str, Dict[str, Union[int, bool]]]) -> None:
         """Sets the state for the tree."""
-        self.tree.setState(js.JSON.parse(json.dumps(state)))
+        self.tree.setState(to_js(state))
 
     def toggle(self, id: Union[str, int]) -> None:
         """Opens or closes a tree item by ID."""
@@ -0,0 +1,65 @@
+"""
+Lazy widget registry used by the container widgets (Layout, Tabbar).
+
+Importing every widget module up front puts their bytecode loading on the
+Pyodide start-up path even when a page only uses one or two widgets. The
+``add_*`` helpers resolve their widget class through ``load_widget`` instead,
+so each module is imported on first use and cached afterwards.
+"""
+
+import importlib
+from typing import Any, Dict, Tuple
+
+__all__ = ["load_widget", "register_widget"]
+
+# widget name -> (module path relative to the dhxpyt package, attribute)
+_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "Calendar": (".calendar", "Calendar"),
+    "CardFlow": (".cardflow", "CardFlow"),
+    "CardPanel": (".cardpanel", "CardPanel"),
+    "Chart": (".chart", "Chart"),
+    "Chat": (".chat", "Chat"),
+    "Form": (".form", "Form"),
+    "Grid": (".grid", "Grid"),
+    "Kanban": (".kanban", "Kanban"),
+    "Layout": (".layout", "Layout"),
+    "Listbox": (".listbox", "Listbox"),
+    "Menu": (".menu", "Menu"),
+    "Pagination": (".pagination", "Pagination"),
+    "Ribbon": (".ribbon", "Ribbon"),
+    "Sidebar": (".sidebar", "Sidebar"),
+    "Tabbar": (".tabbar", "Tabbar"),
+    "Timepicker": (".timepicker", "Timepicker"),
+    "Toolbar": (".toolbar", "Toolbar"),
+    "Tree": (".tree", "Tree"),
+}
+
+_loaded: Dict[str, Any] = {}
+
+
+def register_widget(name: str, module: str, attribute: str) -> None:
+    """
+    Register (or override) the module that provides a widget class.
+
+    :param name: Registry key used by load_widget.
+    :param module: Absolute module path, or a path relative to the dhxpyt package (leading dot).
+    :param attribute: Name of the class inside that module.
+    """
+    _REGISTRY[name] = (module, attribute)
+    _loaded.pop(name, None)
+
+
+def load_widget(name: str) -> Any:
+    """
+    Return the widget class registered under `name`, importing its module on first use.
+    """
+    widget = _loaded.get(name)
+    if widget is None:
+        try:
+            module_path, attribute = _REGISTRY[name]
+        except KeyError:
+            raise KeyError(f"Unknown widget: {name!r}") from None
+        module = importlib.import_module(module_path, __package__)
+        widget = getattr(module, attribute)
+        _loaded[name] = widget
+    return widget
@@ -3,10 +3,10 @@ Window widget implementation
 """
 
 from typing import Any, Callable, Dict, Optional, Union
-import json
 from pyodide.ffi import create_proxy
 import js
 
+from ..marshalling import to_js
 from .window_config import WindowConfig
 
 
@@ -22,7 +22,7 @@ class Window:
             config = WindowConfig()
         config_dict = config.to_dict()
         # Create the Window instance
-        self.window = js.dhx.Window.new(js.JSON.parse(json.dumps(config_dict)))
+        self.window = js.dhx.Window.new(to_js(config_dict))
 
     """ Window API Functions """
 
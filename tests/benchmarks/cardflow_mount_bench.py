@@ -0,0 +1,62 @@
+"""Compare CardFlow mount cost with and without virtual rendering.
+
+Run inside Pyodide (browser console or a pyTincture app) with the dhx suite
+and the custom CardFlow bundle loaded::
+
+    from cardflow_mount_bench import run
+    run()
+
+The default mode builds a dhx Layout cell pair and a dhx Toolbar per row;
+``CardFlowConfig(virtual=True)`` draws pooled rows for the viewport only, so
+its cost should stay flat as ``row_counts`` grows.
+"""
+
+import time
+from typing import Dict
+
+import js
+
+from dhxpyt.cardflow import CardFlow, CardFlowColumnConfig, CardFlowConfig
+from dhxpyt.marshalling import to_js
+
+COLUMNS = [
+    CardFlowColumnConfig(id="ticket", header="Ticket #", width="130px"),
+    CardFlowColumnConfig(id="vehicle", header="Vehicle", width="220px"),
+    CardFlowColumnConfig(id="status", header="Status", width="150px"),
+]
+
+
+def _mount(row_count: int, virtual: bool) -> float:
+    host = js.document.createElement("div")
+    host.style.height = "800px"
+    js.document.body.appendChild(host)
+    layout = js.dhx.Layout.new(host, to_js({"rows": [{"id": "flow"}]}))
+    config = CardFlowConfig(
+        columns=COLUMNS,
+        data=[
+            {"id": f"wo-{index}", "ticket": f"T{index:05d}", "vehicle": "Sedan", "status": "Open"}
+            for index in range(row_count)
+        ],
+        virtual=virtual,
+    )
+    try:
+        start = time.perf_counter()
+        CardFlow(config, container=layout.getCell("flow"))
+        return (time.perf_counter() - start) * 1000.0
+    finally:
+        layout.destructor()
+        host.remove()
+
+
+def run(row_counts=(200, 1_000)) -> Dict[int, Dict[str, float]]:
+    results: Dict[int, Dict[str, float]] = {}
+    for row_count in row_counts:
+        default_ms = _mount(row_count, virtual=False)
+        virtual_ms = _mount(row_count, virtual=True)
+        results[row_count] = {"default_ms": default_ms, "virtual_ms": virtual_ms}
+        print(f"{row_count:>6} rows  default: {default_ms:8.1f} ms   virtual: {virtual_ms:8.1f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,81 @@
+"""Compare per-call Kanban card updates against ``Kanban.apply_batch``.
+
+Run inside Pyodide (browser console or a pyTincture app) with the custom
+Kanban bundle loaded::
+
+    from kanban_batch_bench import run
+    run()
+
+Each case mounts a board with ``board_size`` cards, then syncs ``sync_size``
+cards (half moves, half updates) either one ``move_card``/``update_card`` call
+at a time or as a single ``apply_batch`` payload that renders once.
+"""
+
+import time
+from typing import Dict, List
+
+import js
+
+from dhxpyt.kanban import Kanban, KanbanConfig
+
+COLUMNS = ["todo", "doing", "done"]
+
+
+def make_board(board_size: int) -> Kanban:
+    host = js.document.createElement("div")
+    js.document.body.appendChild(host)
+    config = KanbanConfig(
+        columns=[{"id": column, "title": column.title()} for column in COLUMNS],
+        cards=[
+            {"id": f"card-{index}", "title": f"Card {index}", "status": COLUMNS[index % len(COLUMNS)]}
+            for index in range(board_size)
+        ],
+    )
+    return Kanban(config, root=host)
+
+
+def make_ops(sync_size: int) -> List[Dict[str, object]]:
+    ops: List[Dict[str, object]] = []
+    for index in range(sync_size):
+        card_id = f"card-{index}"
+        if index % 2:
+            ops.append({"op": "move", "id": card_id, "column": COLUMNS[(index + 1) % len(COLUMNS)]})
+        else:
+            ops.append({"op": "update", "id": card_id, "changes": {"title": f"Synced {index}"}})
+    return ops
+
+
+def _apply_one_by_one(board: Kanban, ops: List[Dict[str, object]]) -> None:
+    for op in ops:
+        if op["op"] == "move":
+            board.move_card(op["id"], to_column=op["column"])
+        else:
+            board.update_card(op["id"], **op["changes"])
+
+
+def _time(board_size: int, fn) -> float:
+    board = make_board(board_size)
+    try:
+        start = time.perf_counter()
+        fn(board)
+        return (time.perf_counter() - start) * 1000.0
+    finally:
+        board.destroy()
+
+
+def run(board_sizes=(1_000, 5_000), sync_size: int = 300) -> Dict[int, Dict[str, float]]:
+    results: Dict[int, Dict[str, float]] = {}
+    ops = make_ops(sync_size)
+    for board_size in board_sizes:
+        single_ms = _time(board_size, lambda board: _apply_one_by_one(board, ops))
+        batch_ms = _time(board_size, lambda board: board.apply_batch(ops))
+        results[board_size] = {"per_call_ms": single_ms, "apply_batch_ms": batch_ms}
+        print(
+            f"{board_size:>6} cards, {sync_size} ops  per call: {single_ms:8.1f} ms   "
+            f"apply_batch: {batch_ms:8.1f} ms   speedup: {single_ms / batch_ms:5.1f}x"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    run()
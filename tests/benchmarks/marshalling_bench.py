@@ -0,0 +1,67 @@
+"""Compare ``dhxpyt.marshalling.to_js`` against the legacy JSON round trip.
+
+Run inside Pyodide (browser console or a pyTincture app)::
+
+    from marshalling_bench import run
+    run()
+
+Each case builds grid-style row payloads and times how long it takes to hand
+them to JavaScript either via ``js.JSON.parse(json.dumps(rows))`` or via
+``to_js(rows)``. Every size runs twice: once with fully populated rows and
+once with nullable columns, where every third row has ``None`` values that
+must arrive as ``null``.
+"""
+
+import json
+import time
+from typing import Dict, List
+
+import js
+
+from dhxpyt.marshalling import to_js
+
+
+def make_rows(count: int, nullable: bool = False) -> List[Dict[str, object]]:
+    def missing(index: int) -> bool:
+        return nullable and index % 3 == 0
+
+    return [
+        {
+            "id": index,
+            "name": f"Row {index}",
+            "price": None if missing(index) else index * 1.25,
+            "qty": index % 97,
+            "active": bool(index % 2),
+            "note": None if missing(index) else f"note {index}",
+        }
+        for index in range(count)
+    ]
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0
+
+
+def run(sizes=(10_000, 100_000), repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for size in sizes:
+        for nullable in (False, True):
+            rows = make_rows(size, nullable)
+            legacy_ms = _time(lambda: js.JSON.parse(json.dumps(rows)), repeat)
+            direct_ms = _time(lambda: to_js(rows), repeat)
+            label = f"{size}{' nullable' if nullable else ''}"
+            results[label] = {"json_roundtrip_ms": legacy_ms, "to_js_ms": direct_ms}
+            print(
+                f"{label:>16} rows  json round trip: {legacy_ms:8.1f} ms   "
+                f"to_js: {direct_ms:8.1f} ms   speedup: {legacy_ms / direct_ms:4.2f}x"
+            )
+    return results
+
+
+if __name__ == "__main__":
+    run()
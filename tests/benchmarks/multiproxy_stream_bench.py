@@ -0,0 +1,195 @@
+"""Compare ``multiaiproxy.chat_stream`` on a thread pool against ``achat_stream``.
+
+Run on the backend (CPython with litellm and pytincture installed), from the
+``tests`` directory so ``multiproxy`` is importable::
+
+    python benchmarks/multiproxy_stream_bench.py
+
+A local fake OpenAI-compatible provider streams ``tokens`` chunks per request,
+``token_delay_ms`` apart. The sync path drains one stream per worker thread, so
+its wall time grows with ``streams / workers``; the async path keeps every
+stream open on one event loop and should stay close to a single generation.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+MODEL = "gpt-4o-mini"
+
+
+class FakeProvider:
+    """Minimal keep-alive HTTP/1.1 server speaking the chat completions SSE format."""
+
+    def __init__(self, tokens: int, token_delay_ms: float):
+        self.tokens = tokens
+        self.delay = token_delay_ms / 1000.0
+        self.requests = 0
+        self.port = None
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def start(self) -> str:
+        self._thread.start()
+        self._ready.wait()
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=1024)
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+        server.close()
+
+    async def _handle(self, reader, writer) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode("latin-1").split("\r\n")[1:]:
+                    name, _, value = line.partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value.strip())
+                body = json.loads(await reader.readexactly(length) or b"{}")
+                self.requests += 1
+                if body.get("stream"):
+                    await self._stream(writer, body)
+                else:
+                    await self._complete(writer, body)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _chunk(self, body, delta, finish_reason=None):
+        return {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": body.get("model", MODEL),
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+
+    async def _stream(self, writer, body) -> None:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Transfer-Encoding: chunked\r\nConnection: keep-alive\r\n\r\n"
+        )
+        events = [self._chunk(body, {"role": "assistant", "content": ""})]
+        events += [self._chunk(body, {"content": f"tok{index} "}) for index in range(self.tokens)]
+        events.append(self._chunk(body, {}, "stop"))
+        for event in events:
+            data = f"data: {json.dumps(event)}\n\n".encode()
+            writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+            await writer.drain()
+            await asyncio.sleep(self.delay)
+        done = b"data: [DONE]\n\n"
+        writer.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(done), done))
+        await writer.drain()
+
+    async def _complete(self, writer, body) -> None:
+        payload = json.dumps(
+            {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body.get("model", MODEL),
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}
+                ],
+            }
+        ).encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\n\r\n%s" % (len(payload), payload)
+        )
+        await writer.drain()
+
+
+def _make_proxy(streams: int):
+    from multiproxy import multiaiproxy
+
+    return multiaiproxy(
+        provider_config={"providers": {"openai": [MODEL]}},
+        concurrency={"openai": streams},
+    )
+
+
+def _messages(index: int):
+    return [{"role": "user", "content": f"request {index}"}]
+
+
+def _drain_sync(proxy, index: int) -> int:
+    return sum(1 for _ in proxy.chat_stream(_messages(index), model=MODEL))
+
+
+def _time_threads(streams: int, workers: int) -> float:
+    proxy = _make_proxy(streams)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda index: _drain_sync(proxy, index), range(streams)))
+    return (time.perf_counter() - start) * 1000.0
+
+
+def _time_async(streams: int) -> float:
+    proxy = _make_proxy(streams)
+
+    async def drain(index: int) -> int:
+        count = 0
+        async for _ in proxy.achat_stream(_messages(index), model=MODEL):
+            count += 1
+        return count
+
+    async def main() -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(drain(index) for index in range(streams)))
+        elapsed = (time.perf_counter() - start) * 1000.0
+        await proxy._provider.aclose()
+        return elapsed
+
+    return asyncio.run(main())
+
+
+def run(stream_counts=(50, 200), workers: int = 16, tokens: int = 20, token_delay_ms: float = 20.0) -> Dict[int, Dict[str, float]]:
+    provider = FakeProvider(tokens, token_delay_ms)
+    base_url = provider.start()
+    os.environ["OPENAI_BASE_URL"] = base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-fake")
+
+    results: Dict[int, Dict[str, float]] = {}
+    try:
+        # LiteLLM imports provider modules lazily on first use; keep that out of the timings.
+        _time_threads(1, 1)
+        _time_async(1)
+        for streams in stream_counts:
+            threads_ms = _time_threads(streams, workers)
+            async_ms = _time_async(streams)
+            results[streams] = {"threads_ms": threads_ms, "async_ms": async_ms}
+            print(
+                f"{streams:>5} streams  {workers} threads: {threads_ms:8.1f} ms   "
+                f"asyncio: {async_ms:8.1f} ms   speedup: {threads_ms / async_ms:5.1f}x"
+            )
+    finally:
+        provider.stop()
+    return results
+
+
+if __name__ == "__main__":
+    run()
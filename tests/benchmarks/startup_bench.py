@@ -0,0 +1,46 @@
+"""Measure the start-up cost saved by lazy widget imports in dhxpyt.layout.
+
+Run inside Pyodide (browser console or a pyTincture app)::
+
+    from startup_bench import run
+    run()
+
+"lazy" is what ``import dhxpyt.layout`` costs now. "eager" additionally
+imports every widget module the layout used to import at module load, which
+is what every page paid before widget resolution moved to
+``dhxpyt.widget_registry``.
+"""
+
+import importlib
+import sys
+import time
+from typing import Dict
+
+from dhxpyt.widget_registry import _REGISTRY
+
+
+def _purge() -> None:
+    for name in [module for module in sys.modules if module == "dhxpyt" or module.startswith("dhxpyt.")]:
+        del sys.modules[name]
+    importlib.invalidate_caches()
+
+
+def _import_layout(eager: bool) -> float:
+    _purge()
+    start = time.perf_counter()
+    importlib.import_module("dhxpyt.layout")
+    if eager:
+        for module_path, _attribute in _REGISTRY.values():
+            importlib.import_module(module_path, "dhxpyt")
+    return (time.perf_counter() - start) * 1000.0
+
+
+def run(repeat: int = 5) -> Dict[str, float]:
+    lazy_ms = min(_import_layout(eager=False) for _ in range(repeat))
+    eager_ms = min(_import_layout(eager=True) for _ in range(repeat))
+    print(f"import dhxpyt.layout  lazy: {lazy_ms:7.1f} ms   eager: {eager_ms:7.1f} ms   saved: {eager_ms - lazy_ms:7.1f} ms")
+    return {"lazy_ms": lazy_ms, "eager_ms": eager_ms}
+
+
+if __name__ == "__main__":
+    run()
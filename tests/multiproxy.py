@@ -5,12 +5,21 @@ Grok, and Google Gemini through a unified streaming interface while maintaining
 PyTincture compatibility.
 """
 
+import asyncio
+import hashlib
 import json
 import os
+import sqlite3
 import sys
+import threading
+import time
 import types
+import weakref
+from collections import OrderedDict
 
+import httpx
 import litellm
+from openai import AsyncOpenAI
 
 # Ensure the module is registered for inspect.getfile when loaded via SourceFileLoader.
 if __name__ not in sys.modules:
@@ -88,6 +97,22 @@ DEFAULT_PROVIDER_CONFIG = {
 DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gpt-4o")
 REQUEST_TIMEOUT = float(os.getenv("REQUEST_TIMEOUT", "60"))
 DEBUG_STREAM = os.getenv("MULTIPROXY_DEBUG_STREAM", "").lower() in {"1", "true", "yes"}
+XAI_BASE_URL = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1")
+# Minimum spacing between text frames in ``wire="delta"`` mode.
+DELTA_BATCH_MS = float(os.getenv("MULTIPROXY_DELTA_BATCH_MS", "30"))
+WIRE_FORMATS = {"full", "delta"}
+# Streams allowed in flight per provider on the async path; override per
+# provider with a ``"concurrency": {"openai": 200}`` entry in the provider config.
+DEFAULT_CONCURRENCY = int(os.getenv("MULTIPROXY_PROVIDER_CONCURRENCY", "64"))
+# Providers LiteLLM drives through the OpenAI SDK, so they accept a shared ``client``.
+OPENAI_COMPATIBLE_PROVIDERS = {"openai", "xai"}
+# Caller options that bypass the pooled client on the async path.
+POOLED_CLIENT_OVERRIDES = {"api_key", "api_base", "base_url", "client"}
+# Credentials and transport options stay out of cache keys; the endpoint
+# (api_base/base_url) is kept, since one model name can point at different backends.
+CACHE_IGNORED_OPTIONS = {"timeout", "stream", "api_key", "client", "metadata", "user"}
+# Single-flight keys cover endpoint and credentials too: only the timeout may differ.
+FLIGHT_IGNORED_OPTIONS = {"timeout"}
 
 # ---------------------------------------------------------------------------
 # LiteLLM provider helpers
@@ -97,8 +122,16 @@ DEBUG_STREAM = os.getenv("MULTIPROXY_DEBUG_STREAM", "").lower() in {"1", "true",
 class UnifiedAIProvider:
     """Unified AI provider using LiteLLM for multi-provider support."""
 
-    def __init__(self, provider_config):
+    # Async clients and semaphores belong to the event loop that created them.
+    # They are shared by every instance (the BFF host builds one per call) and
+    # each loop keeps its own set for as long as it is alive.
+    _loop_states = weakref.WeakKeyDictionary()
+    _loop_states_lock = threading.Lock()
+
+    def __init__(self, provider_config, concurrency=None):
         self.provider_config = provider_config or {"providers": {}}
+        self.concurrency = dict(self.provider_config.get("concurrency") or {})
+        self.concurrency.update(concurrency or {})
         self.setup_environment()
         self._build_model_mapping()
 
@@ -124,18 +157,27 @@ class UnifiedAIProvider:
     def _build_model_mapping(self):
         providers = self.provider_config.get("providers", {})
         self.model_mapping = {}
+        self.model_providers = {}
+        # Per-model request parameters (endpoint, credentials) passed straight to
+        # LiteLLM, so concurrent calls never depend on process-wide env vars.
+        self.model_routes = {}
+        self._xai_route = {"api_base": XAI_BASE_URL, "api_key": os.getenv("XAI_API_KEY")}
 
         bedrock = providers.get("aws_bedrock", {})
         for provider_type, models in bedrock.items():
             for model in models:
                 litellm_name = self._map_bedrock_model(provider_type, model)
                 self.model_mapping[model] = litellm_name
+                self.model_providers[model] = "aws_bedrock"
 
         for provider, models in providers.items():
             if provider == "aws_bedrock":
                 continue
             for model in models:
                 self.model_mapping[model] = self._map_direct_model(provider, model)
+                self.model_providers[model] = provider
+                if provider == "xai":
+                    self.model_routes[model] = self._xai_route
 
     @staticmethod
     def _map_bedrock_model(provider_type, model):
@@ -167,64 +209,547 @@ class UnifiedAIProvider:
             return True
         return model in providers.get("xai", []) or model.startswith("grok")
 
+    def get_provider(self, model):
+        provider = self.model_providers.get(model)
+        if provider:
+            return provider
+        return "xai" if self.is_xai_model(model) else "openai"
+
+    def get_route(self, model):
+        route = self.model_routes.get(model)
+        if route is None and self.is_xai_model(model):
+            route = self._xai_route
+        return {key: value for key, value in (route or {}).items() if value is not None}
+
+    def _request_options(self, model, kwargs):
+        options = self.get_route(model)
+        options.update(kwargs)
+        return options
+
+    def get_concurrency_limit(self, provider):
+        return int(self.concurrency.get(provider, DEFAULT_CONCURRENCY))
+
     def stream_completion(self, model, messages, **kwargs):
-        litellm_model = self.get_litellm_model(model)
-
-        if self.is_xai_model(model):
-            original_base_url = os.getenv("OPENAI_BASE_URL")
-            os.environ["OPENAI_BASE_URL"] = "https://api.x.ai/v1"
-            try:
-                response = litellm.completion(
-                    model=litellm_model,
-                    messages=list(messages),
-                    stream=True,
-                    api_key=os.getenv("XAI_API_KEY"),
-                    **kwargs,
-                )
-                for chunk in response:
-                    yield chunk
-            finally:
-                if original_base_url is not None:
-                    os.environ["OPENAI_BASE_URL"] = original_base_url
-                elif "OPENAI_BASE_URL" in os.environ:
-                    del os.environ["OPENAI_BASE_URL"]
+        response = litellm.completion(
+            model=self.get_litellm_model(model),
+            messages=list(messages),
+            stream=True,
+            **self._request_options(model, kwargs),
+        )
+        for chunk in response:
+            yield chunk
+
+    def complete(self, model, messages, **kwargs):
+        return litellm.completion(
+            model=self.get_litellm_model(model),
+            messages=list(messages),
+            stream=False,
+            **self._request_options(model, kwargs),
+        )
+
+    # -- asyncio path -------------------------------------------------------
+
+    def _loop_state(self):
+        loop = asyncio.get_running_loop()
+        with self._loop_states_lock:
+            state = self._loop_states.get(loop)
+            if state is None:
+                # A closed loop's clients cannot be awaited any more; drop them.
+                for closed in [other for other in self._loop_states if other.is_closed()]:
+                    del self._loop_states[closed]
+                state = self._loop_states[loop] = {"clients": {}, "semaphores": {}}
+            return state
+
+    def _get_semaphore(self, provider):
+        limit = self.get_concurrency_limit(provider)
+        semaphores = self._loop_state()["semaphores"]
+        semaphore = semaphores.get((provider, limit))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            semaphores[(provider, limit)] = semaphore
+        return semaphore
+
+    def _get_async_client(self, provider):
+        """Return the pooled SDK client shared by every async call to ``provider``.
+
+        Only OpenAI-compatible providers take a ``client`` argument; LiteLLM keeps
+        its own cached async HTTP handler for the others.
+        """
+
+        if provider not in OPENAI_COMPATIBLE_PROVIDERS:
+            return None
+        if provider == "xai":
+            api_key = self._xai_route["api_key"]
+            base_url = self._xai_route["api_base"]
         else:
-            response = litellm.completion(
-                model=litellm_model,
+            api_key = os.getenv("OPENAI_API_KEY")
+            base_url = os.getenv("OPENAI_BASE_URL")
+        limit = self.get_concurrency_limit(provider)
+        key = (provider, api_key, base_url, limit)
+        clients = self._loop_state()["clients"]
+        if key in clients:
+            return clients[key]
+
+        client = None
+        if api_key:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+                timeout=REQUEST_TIMEOUT,
+            )
+            client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+        clients[key] = client
+        return client
+
+    def _async_options(self, model, kwargs):
+        provider = self.get_provider(model)
+        options = self._request_options(model, kwargs)
+        # The pooled client carries the default endpoint and key; a caller who
+        # passes their own must not be silently routed through it.
+        if not POOLED_CLIENT_OVERRIDES.intersection(kwargs):
+            client = self._get_async_client(provider)
+            if client is not None:
+                options["client"] = client
+        return provider, options
+
+    async def astream_completion(self, model, messages, **kwargs):
+        provider, options = self._async_options(model, kwargs)
+        # The slot is held for the whole stream, so the limit caps open generations.
+        async with self._get_semaphore(provider):
+            response = await litellm.acompletion(
+                model=self.get_litellm_model(model),
                 messages=list(messages),
                 stream=True,
-                **kwargs,
+                **options,
             )
-            for chunk in response:
+            async for chunk in response:
                 yield chunk
 
-    def complete(self, model, messages, **kwargs):
-        litellm_model = self.get_litellm_model(model)
-
-        if self.is_xai_model(model):
-            original_base_url = os.getenv("OPENAI_BASE_URL")
-            os.environ["OPENAI_BASE_URL"] = "https://api.x.ai/v1"
-            try:
-                return litellm.completion(
-                    model=litellm_model,
-                    messages=list(messages),
-                    stream=False,
-                    api_key=os.getenv("XAI_API_KEY"),
-                    **kwargs,
-                )
-            finally:
-                if original_base_url is not None:
-                    os.environ["OPENAI_BASE_URL"] = original_base_url
-                elif "OPENAI_BASE_URL" in os.environ:
-                    del os.environ["OPENAI_BASE_URL"]
+    async def acomplete(self, model, messages, **kwargs):
+        provider, options = self._async_options(model, kwargs)
+        async with self._get_semaphore(provider):
+            return await litellm.acompletion(
+                model=self.get_litellm_model(model),
+                messages=list(messages),
+                stream=False,
+                **options,
+            )
 
-        return litellm.completion(
-            model=litellm_model,
-            messages=list(messages),
-            stream=False,
-            **kwargs,
+    async def aclose(self):
+        """Close the pooled async clients of the running event loop (for every instance)."""
+
+        clients = self._loop_state()["clients"]
+        pooled = [client for client in clients.values() if client is not None]
+        clients.clear()
+        for client in pooled:
+            await client.close()
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+class ResponseCache:
+    """LRU + TTL cache of finished chat streams, with an optional sqlite tier.
+
+    Entries are the normalised chunks a stream yielded, stored as JSON so a
+    hit can be replayed chunk by chunk. ``ttl`` is in seconds (0 disables
+    expiry); ``path`` enables the on-disk tier shared across restarts, which
+    keeps at most ``max_disk_entries`` rows (the most recently written).
+    ``aget``/``aset`` run the disk tier in a worker thread so the event loop
+    never waits on sqlite.
+    """
+
+    def __init__(self, max_entries=512, ttl=600, path=None, max_disk_entries=10000):
+        self.max_entries = max(1, int(max_entries))
+        self.max_disk_entries = max(1, int(max_disk_entries))
+        self.ttl = float(ttl or 0)
+        self.path = path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_lock = threading.Lock()
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires_at REAL, chunks TEXT)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+            self._evict_disk(time.time())
+            self._db.commit()
+
+    @staticmethod
+    def make_key(model, messages, options, ignored=CACHE_IGNORED_OPTIONS):
+        params = {key: value for key, value in options.items() if key not in ignored}
+        raw = json.dumps(
+            {"model": model, "messages": list(messages), "params": params},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return the cached chunks for ``key`` (fresh objects) or ``None``."""
+
+        now = time.time()
+        payload = self._memory_get(key, now)
+        if payload is None and self._db is not None:
+            payload = self._disk_get(key, now)
+        return self._finish_get(payload)
+
+    async def aget(self, key):
+        """Like ``get``, with the sqlite lookup off the event loop."""
+
+        now = time.time()
+        payload = self._memory_get(key, now)
+        if payload is None and self._db is not None:
+            payload = await asyncio.to_thread(self._disk_get, key, now)
+        return self._finish_get(payload)
+
+    def set(self, key, chunks):
+        """Store a finished stream; ``chunks`` is a list of JSON-encoded chunks."""
+
+        expires_at, payload = self._memory_set(key, chunks)
+        if self._db is not None:
+            self._disk_set(key, expires_at, payload)
+
+    async def aset(self, key, chunks):
+        """Like ``set``, with the sqlite write off the event loop."""
+
+        expires_at, payload = self._memory_set(key, chunks)
+        if self._db is not None:
+            await asyncio.to_thread(self._disk_set, key, expires_at, payload)
+
+    def _memory_get(self, key, now):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at is None or expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+            del self._entries[key]
+            return None
+
+    def _memory_set(self, key, chunks):
+        expires_at = time.time() + self.ttl if self.ttl > 0 else None
+        payload = "[" + ",".join(chunks) + "]"
+        with self._lock:
+            self._remember(key, expires_at, payload)
+        return expires_at, payload
+
+    def _disk_get(self, key, now):
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT expires_at, chunks FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or (row[0] is not None and row[0] <= now):
+            return None
+        with self._lock:
+            self._remember(key, row[0], row[1])
+            self.hits += 1
+            self.disk_hits += 1
+        return row[1]
+
+    def _disk_set(self, key, expires_at, payload):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, chunks) VALUES (?, ?, ?)",
+                (key, expires_at, payload),
+            )
+            self._evict_disk(time.time())
+            self._db.commit()
+
+    def _evict_disk(self, now):
+        # REPLACE gives a row a new rowid, so the lowest rowids were written longest ago.
+        self._db.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at < ?", (now,))
+        self._db.execute(
+            "DELETE FROM responses WHERE rowid <= "
+            "(SELECT rowid FROM responses ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+            (self.max_disk_entries,),
         )
 
+    def _finish_get(self, payload):
+        if payload is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        return json.loads(payload)
+
+    def _remember(self, key, expires_at, payload):
+        self._entries[key] = (expires_at, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def recorder(self, key):
+        return _StreamRecorder(self, key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+
+class _StreamRecorder:
+    """Collects the chunks of one stream and stores them if it finished cleanly."""
+
+    def __init__(self, cache, key):
+        self.key = key
+        self._cache = cache
+        self._chunks = []
+        self._valid = True
+
+    def add(self, chunk):
+        if not self._valid:
+            return
+        if isinstance(chunk, dict) and "error" in chunk:
+            self._valid = False
+            return
+        # Encode now: callers may mutate the chunk after it is yielded.
+        self._chunks.append(json.dumps(chunk, separators=(",", ":"), default=str))
+
+    def commit(self):
+        if self._valid and self._chunks:
+            self._cache.set(self.key, self._chunks)
+
+    async def acommit(self):
+        if self._valid and self._chunks:
+            await self._cache.aset(self.key, self._chunks)
+
+
+# ---------------------------------------------------------------------------
+# Single-flight coalescing
+# ---------------------------------------------------------------------------
+
+
+class _Flight:
+    """One upstream stream shared by every identical request running alongside it.
+
+    Chunks are kept for the lifetime of the flight so late joiners replay
+    from the start. Whichever subscriber has caught up pulls the next
+    upstream chunk, so no extra thread is needed and the stream keeps going
+    if the first requester disconnects. It is closed once nobody is left.
+    """
+
+    def __init__(self, source, on_done):
+        self._source = source
+        self._on_done = on_done
+        self._chunks = []
+        self._done = False
+        self._abandoned = False
+        self._pumping = False
+        self._subscribers = 0
+        self._cond = threading.Condition()
+
+    def join(self):
+        with self._cond:
+            if self._abandoned:
+                return False
+            self._subscribers += 1
+            return True
+
+    def chunks(self):
+        index = 0
+        try:
+            while True:
+                with self._cond:
+                    while index >= len(self._chunks) and not self._done and self._pumping:
+                        self._cond.wait()
+                    if index < len(self._chunks):
+                        chunk = self._chunks[index]
+                        index += 1
+                    elif self._done:
+                        return
+                    else:
+                        self._pumping = True
+                        chunk = None
+                if chunk is not None:
+                    yield dict(chunk) if isinstance(chunk, dict) else chunk
+                    continue
+                finished = True
+                try:
+                    chunk = next(self._source)
+                    finished = False
+                except StopIteration:
+                    pass
+                finally:
+                    with self._cond:
+                        if finished:
+                            self._done = True
+                        else:
+                            self._chunks.append(chunk)
+                        self._pumping = False
+                        self._cond.notify_all()
+                    if finished:
+                        self._on_done(self)
+        finally:
+            abandoned = False
+            with self._cond:
+                self._subscribers -= 1
+                if self._subscribers == 0 and not self._done:
+                    # A request arriving after this starts a fresh flight.
+                    self._done = True
+                    self._abandoned = True
+                    abandoned = True
+            if abandoned:
+                self._source.close()
+                self._on_done(self)
+
+
+class _AsyncFlight:
+    """asyncio counterpart of ``_Flight``; the upstream is drained by its own task."""
+
+    def __init__(self, source, on_done):
+        self._source = source
+        self._on_done = on_done
+        self._chunks = []
+        self._done = False
+        self._abandoned = False
+        self._subscribers = 0
+        self._task = None
+        self._wakeup = asyncio.Event()
+
+    def join(self):
+        if self._abandoned:
+            return False
+        self._subscribers += 1
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._pump())
+        return True
+
+    def _notify(self):
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        wakeup.set()
+
+    async def _pump(self):
+        try:
+            async for chunk in self._source:
+                self._chunks.append(chunk)
+                self._notify()
+        finally:
+            self._done = True
+            self._notify()
+            self._on_done(self)
+
+    async def chunks(self):
+        index = 0
+        try:
+            while True:
+                if index < len(self._chunks):
+                    chunk = self._chunks[index]
+                    index += 1
+                    yield dict(chunk) if isinstance(chunk, dict) else chunk
+                elif self._done:
+                    return
+                else:
+                    await self._wakeup.wait()
+        finally:
+            self._subscribers -= 1
+            if self._subscribers == 0 and not self._done:
+                self._abandoned = True
+                self._task.cancel()
+
+
+# ---------------------------------------------------------------------------
+# Compact wire format
+# ---------------------------------------------------------------------------
+
+
+class _DeltaFramer:
+    """Re-frame normalised chunks as ``{"t": text}`` deltas plus sparse control frames.
+
+    Control frames are ``{"finish": reason}``, ``{"usage": {...}}`` and
+    ``{"error": {...}}``. Text is sent at most once per ``batch_ms``: the
+    first delta after a quiet period goes out immediately, later ones are
+    merged until the window has passed or a control frame forces a flush.
+    """
+
+    def __init__(self, batch_ms):
+        self._batch = max(0.0, float(batch_ms)) / 1000.0
+        self._buffer = []
+        self._last_flush = float("-inf")
+
+    @property
+    def pending(self):
+        return bool(self._buffer)
+
+    def due_in(self):
+        return max(0.0, self._last_flush + self._batch - time.monotonic())
+
+    def feed(self, chunk):
+        text, controls = self._split(chunk)
+        frames = []
+        if text:
+            self._buffer.append(text)
+            if time.monotonic() - self._last_flush >= self._batch:
+                frames.extend(self.flush())
+        if controls:
+            frames.extend(self.flush())
+            frames.extend(controls)
+        return frames
+
+    def flush(self):
+        if not self._buffer:
+            return []
+        text = "".join(self._buffer)
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        return [{"t": text}]
+
+    @staticmethod
+    def _split(chunk):
+        if not isinstance(chunk, dict):
+            return "", []
+        if "error" in chunk:
+            return "", [{"error": chunk["error"]}]
+
+        text = ""
+        controls = []
+        choices = chunk.get("choices") or []
+        if choices:
+            choice = choices[0] or {}
+            delta = choice.get("delta")
+            if isinstance(delta, str):
+                text = delta
+            elif isinstance(delta, dict):
+                content = delta.get("content")
+                if isinstance(content, str):
+                    text = content
+                elif isinstance(content, list):
+                    text = "".join(
+                        item if isinstance(item, str) else (item.get("text") or "")
+                        for item in content
+                        if isinstance(item, (str, dict))
+                    )
+                elif isinstance(delta.get("text"), str):
+                    text = delta["text"]
+            if choice.get("finish_reason"):
+                controls.append({"finish": choice["finish_reason"]})
+        if chunk.get("usage"):
+            controls.append({"usage": chunk["usage"]})
+        return text, controls
+
 
 # ---------------------------------------------------------------------------
 # Backend-for-frontend proxy
@@ -235,12 +760,37 @@ class UnifiedAIProvider:
 class multiaiproxy:
     """Multi-provider AI proxy supporting OpenAI, Anthropic, Bedrock, xAI, and Google."""
 
-    def __init__(self, *, provider_config=None, default_model=None, timeout=None):
+    # The BFF host creates an instance per call, so everything requests must
+    # share lives on the class: in-flight streams (async ones per event loop)
+    # and the caches built from settings.
+    _flights = {}
+    _flights_lock = threading.Lock()
+    _async_flights = weakref.WeakKeyDictionary()
+    _shared_caches = {}
+
+    def __init__(
+        self,
+        *,
+        provider_config=None,
+        default_model=None,
+        timeout=None,
+        concurrency=None,
+        cache=None,
+        coalesce=None,
+    ):
         config = provider_config or self._load_config_from_env() or DEFAULT_PROVIDER_CONFIG
-        self._provider = UnifiedAIProvider(config)
+        self._provider = UnifiedAIProvider(config, concurrency=concurrency)
         self._provider_config = config
         self._default_model = default_model or os.getenv("DEFAULT_MODEL", DEFAULT_MODEL)
         self._timeout = timeout or REQUEST_TIMEOUT
+        if cache is None:
+            cache = self._load_cache_from_env()
+        elif cache is True:
+            cache = self._shared_cache()
+        self._cache = cache or None
+        if coalesce is None:
+            coalesce = os.getenv("MULTIPROXY_COALESCE", "").lower() in {"1", "true", "yes"}
+        self._coalesce = coalesce
 
     @staticmethod
     def _normalize_stream_chunk(chunk):
@@ -311,6 +861,31 @@ class multiaiproxy:
             print("Warning: MULTIPROXY_PROVIDER_CONFIG is not valid JSON; falling back to defaults.")
             return None
 
+    @classmethod
+    def _load_cache_from_env(cls):
+        if os.getenv("MULTIPROXY_CACHE", "").lower() not in {"1", "true", "yes"}:
+            return None
+        return cls._shared_cache(
+            max_entries=int(os.getenv("MULTIPROXY_CACHE_SIZE", "512")),
+            ttl=float(os.getenv("MULTIPROXY_CACHE_TTL", "600")),
+            path=os.getenv("MULTIPROXY_CACHE_PATH") or None,
+            max_disk_entries=int(os.getenv("MULTIPROXY_CACHE_DISK_SIZE", "10000")),
+        )
+
+    @classmethod
+    def _shared_cache(cls, **settings):
+        key = tuple(sorted(settings.items()))
+        with cls._flights_lock:
+            cache = cls._shared_caches.get(key)
+            if cache is None:
+                cache = cls._shared_caches[key] = ResponseCache(**settings)
+            return cache
+
+    def get_cache_stats(self):
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.stats()}
+
     def get_available_models(self):
         return self._provider_config.get("providers", {})
 
@@ -337,12 +912,13 @@ class multiaiproxy:
             "supported": model in self._provider.model_mapping,
         }
 
-    @bff_stream()
-    def chat_stream(self, messages, model=None, **extra):
+    def _prepare_request(self, messages, model, extra):
         options = extra.copy()
         timeout_override = options.pop("timeout", None)
         options.pop("stream", None)
-        timeout = timeout_override or self._timeout
+        use_cache = options.pop("use_cache", True)
+        coalesce = options.pop("coalesce", True)
+        options["timeout"] = timeout_override or self._timeout
 
         selected_model = model or self._default_model
 
@@ -351,59 +927,286 @@ class multiaiproxy:
                 f"Model '{selected_model}' is not supported. Available models: {list(self._provider.model_mapping.keys())}"
             )
 
+        use_cache = use_cache and self._cache is not None
+        coalesce = coalesce and self._coalesce
+        # Keys use the resolved model and route, since the cache and the
+        # flights are shared by instances that may be configured differently.
+        target = self._provider.get_litellm_model(selected_model)
+        effective = self._provider._request_options(selected_model, options)
+        recorder = None
+        if use_cache:
+            recorder = self._cache.recorder(ResponseCache.make_key(target, messages, effective))
+        flight_key = None
+        if coalesce:
+            flight_key = ResponseCache.make_key(target, messages, effective, FLIGHT_IGNORED_OPTIONS)
+        return selected_model, options, recorder, flight_key
+
+    def _end_flight(self, flights, key, flight):
+        with self._flights_lock:
+            if flights.get(key) is flight:
+                del flights[key]
+
+    def _loop_flights(self):
+        loop = asyncio.get_running_loop()
+        with self._flights_lock:
+            flights = self._async_flights.get(loop)
+            if flights is None:
+                flights = self._async_flights[loop] = {}
+            return flights
+
+    def _normalize_logged(self, chunk):
+        if DEBUG_STREAM:
+            print(f"[multiproxy] raw chunk: {type(chunk)!r} {chunk!r}")
+        normalized = self._normalize_stream_chunk(chunk)
+        if DEBUG_STREAM:
+            print(f"[multiproxy] normalized: {normalized!r}")
+        return normalized
+
+    @staticmethod
+    def _completion_chunk(response):
+        """Turn a non-streamed completion into a single delta chunk (or None)."""
+
+        payload = response
+        if hasattr(payload, "model_dump"):
+            payload = payload.model_dump(exclude_none=True)
+        elif hasattr(payload, "dict"):
+            payload = payload.dict(exclude_none=True)
+        text = ""
+        if isinstance(payload, dict):
+            for choice in payload.get("choices") or []:
+                message = (choice or {}).get("message") or {}
+                if isinstance(message, dict):
+                    text = message.get("content") or ""
+                if text:
+                    break
+        if text:
+            return {"choices": [{"delta": {"content": text}}]}
+        return None
+
+    @staticmethod
+    def _error_chunk(exc):
+        return {
+            "error": {
+                "message": str(exc),
+                "type": "provider_error",
+                "code": "stream_error",
+            }
+        }
+
+    def _stream_upstream(self, selected_model, messages, options, recorder):
         try:
             yielded_any = False
             for chunk in self._provider.stream_completion(
                 model=selected_model,
                 messages=messages,
-                timeout=timeout,
                 **options,
             ):
-                if DEBUG_STREAM:
-                    print(f"[multiproxy] raw chunk: {type(chunk)!r} {chunk!r}")
-                normalized = self._normalize_stream_chunk(chunk)
-                if DEBUG_STREAM:
-                    print(f"[multiproxy] normalized: {normalized!r}")
+                normalized = self._normalize_logged(chunk)
                 if normalized is not None:
                     yielded_any = True
+                    if recorder is not None:
+                        recorder.add(normalized)
                     yield normalized
             if not yielded_any:
                 response = self._provider.complete(
                     model=selected_model,
                     messages=messages,
-                    timeout=timeout,
                     **options,
                 )
-                payload = response
-                if hasattr(payload, "model_dump"):
-                    payload = payload.model_dump(exclude_none=True)
-                elif hasattr(payload, "dict"):
-                    payload = payload.dict(exclude_none=True)
-                text = ""
-                if isinstance(payload, dict):
-                    for choice in payload.get("choices") or []:
-                        message = (choice or {}).get("message") or {}
-                        if isinstance(message, dict):
-                            text = message.get("content") or ""
-                        if text:
-                            break
-                if text:
-                    yield {"choices": [{"delta": {"content": text}}]}
+                fallback = self._completion_chunk(response)
+                if fallback is not None:
+                    if recorder is not None:
+                        recorder.add(fallback)
+                    yield fallback
         except Exception as exc:  # pragma: no cover - provider errors
-            yield {
-                "error": {
-                    "message": str(exc),
-                    "type": "provider_error",
-                    "code": "stream_error",
-                }
-            }
+            yield self._error_chunk(exc)
+        else:
+            if recorder is not None:
+                recorder.commit()
+
+    async def _astream_upstream(self, selected_model, messages, options, recorder):
+        try:
+            yielded_any = False
+            async for chunk in self._provider.astream_completion(
+                model=selected_model,
+                messages=messages,
+                **options,
+            ):
+                normalized = self._normalize_logged(chunk)
+                if normalized is not None:
+                    yielded_any = True
+                    if recorder is not None:
+                        recorder.add(normalized)
+                    yield normalized
+            if not yielded_any:
+                response = await self._provider.acomplete(
+                    model=selected_model,
+                    messages=messages,
+                    **options,
+                )
+                fallback = self._completion_chunk(response)
+                if fallback is not None:
+                    if recorder is not None:
+                        recorder.add(fallback)
+                    yield fallback
+        except Exception as exc:  # pragma: no cover - provider errors
+            yield self._error_chunk(exc)
+        else:
+            if recorder is not None:
+                await recorder.acommit()
+
+    def _chat_chunks(self, messages, model, extra):
+        selected_model, options, recorder, flight_key = self._prepare_request(messages, model, extra)
+
+        # Followers skip the cache lookup: the leader already missed it.
+        if flight_key is not None:
+            with self._flights_lock:
+                flight = self._flights.get(flight_key)
+                joined = flight is not None and flight.join()
+            if joined:
+                yield from flight.chunks()
+                return
+
+        if recorder is not None:
+            cached = self._cache.get(recorder.key)
+            if cached is not None:
+                yield from cached
+                return
+
+        if flight_key is None:
+            yield from self._stream_upstream(selected_model, messages, options, recorder)
+            return
+
+        # Identical requests already in flight share its upstream stream.
+        with self._flights_lock:
+            flight = self._flights.get(flight_key)
+            if flight is None or not flight.join():
+                flight = _Flight(
+                    self._stream_upstream(selected_model, messages, options, recorder),
+                    lambda done: self._end_flight(self._flights, flight_key, done),
+                )
+                flight.join()
+                self._flights[flight_key] = flight
+        yield from flight.chunks()
+
+    async def _achat_chunks(self, messages, model, extra):
+        selected_model, options, recorder, flight_key = self._prepare_request(messages, model, extra)
+
+        # Followers skip the cache lookup: the leader already missed it.
+        if flight_key is not None:
+            flights = self._loop_flights()
+            flight = flights.get(flight_key)
+            if flight is not None and flight.join():
+                async for chunk in flight.chunks():
+                    yield chunk
+                return
+
+        if recorder is not None:
+            cached = await self._cache.aget(recorder.key)
+            if cached is not None:
+                for chunk in cached:
+                    yield chunk
+                return
+
+        if flight_key is None:
+            async for chunk in self._astream_upstream(selected_model, messages, options, recorder):
+                yield chunk
+            return
+
+        flight = flights.get(flight_key)
+        if flight is None or not flight.join():
+            flight = _AsyncFlight(
+                self._astream_upstream(selected_model, messages, options, recorder),
+                lambda done: self._end_flight(flights, flight_key, done),
+            )
+            flight.join()
+            flights[flight_key] = flight
+        async for chunk in flight.chunks():
+            yield chunk
+
+    @staticmethod
+    def _check_wire(wire):
+        if wire not in WIRE_FORMATS:
+            raise ValueError(f"Unsupported wire format {wire!r}; expected one of {sorted(WIRE_FORMATS)}")
+
+    @staticmethod
+    def _delta_frames(chunks, batch_ms):
+        framer = _DeltaFramer(DELTA_BATCH_MS if batch_ms is None else batch_ms)
+        for chunk in chunks:
+            yield from framer.feed(chunk)
+        yield from framer.flush()
+
+    @staticmethod
+    async def _adelta_frames(chunks, batch_ms):
+        framer = _DeltaFramer(DELTA_BATCH_MS if batch_ms is None else batch_ms)
+        iterator = chunks.__aiter__()
+        pending = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                # With text buffered, wake up when its window closes even if upstream stalls.
+                timeout = framer.due_in() if framer.pending else None
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if not done:
+                    for frame in framer.flush():
+                        yield frame
+                    continue
+                task, pending = pending, None
+                try:
+                    chunk = task.result()
+                except StopAsyncIteration:
+                    break
+                for frame in framer.feed(chunk):
+                    yield frame
+            for frame in framer.flush():
+                yield frame
+        finally:
+            if pending is not None:
+                pending.cancel()
+            else:
+                await iterator.aclose()
+
+    @bff_stream()
+    def chat_stream(self, messages, model=None, wire="full", wire_batch_ms=None, **extra):
+        """Stream a chat completion.
+
+        ``wire="full"`` yields normalised LiteLLM chunks. ``wire="delta"``
+        yields ``{"t": text}`` frames, merged to at most one per
+        ``wire_batch_ms`` (default ``MULTIPROXY_DELTA_BATCH_MS``), plus sparse
+        ``finish``/``usage``/``error`` frames.
+        """
+
+        self._check_wire(wire)
+        chunks = self._chat_chunks(messages, model, extra)
+        if wire == "delta":
+            chunks = self._delta_frames(chunks, wire_batch_ms)
+        yield from chunks
+
+    @bff_stream()
+    async def achat_stream(self, messages, model=None, wire="full", wire_batch_ms=None, **extra):
+        """Async twin of ``chat_stream`` backed by ``litellm.acompletion``.
+
+        Streams share one pooled HTTP client per provider and wait for a
+        per-provider concurrency slot, so a single event loop can serve many
+        concurrent generations without pinning a worker thread each.
+        """
+
+        self._check_wire(wire)
+        chunks = self._achat_chunks(messages, model, extra)
+        if wire == "delta":
+            chunks = self._adelta_frames(chunks, wire_batch_ms)
+        async for chunk in chunks:
+            yield chunk
 
     @bff_stream()
     def chat_stream_with_provider_info(self, messages, model=None, **extra):
         model_info = self.get_model_info(model or self._default_model)
         yield {"type": "model_info", "model_info": model_info}
+        # Delta frames stay minimal; the model_info frame already names the provider.
+        tag = extra.get("wire", "full") != "delta"
         for chunk in self.chat_stream(messages, model, **extra):
-            if isinstance(chunk, dict) and "error" not in chunk:
+            if tag and isinstance(chunk, dict) and "error" not in chunk:
                 chunk["provider"] = model_info["provider"]
             yield chunk
 